@@ -0,0 +1,57 @@
+"""Time to convert a few seasons of play-by-play clocks to elapsed seconds, row by row vs
+vectorized.
+
+The clocks are synthetic (about 2.4 million actions, four seasons of PlayByPlayV3) so the
+benchmark runs offline:
+
+    python benchmarks/clock_speed.py
+"""
+
+import re
+import time
+
+import numpy as np
+import pandas as pd
+
+from nbastatpy.clock import get_elapsed
+
+ROWS = 2_400_000
+
+
+def make_clocks(seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    tenths = rng.integers(0, 7200, ROWS)
+    return pd.DataFrame(
+        {
+            "period": rng.integers(1, 6, ROWS),
+            "clock": [f"PT{t // 600:02d}M{t % 600 / 10:05.2f}S" for t in tenths],
+        }
+    )
+
+
+def row_by_row(df: pd.DataFrame) -> list:
+    elapsed = []
+    for period, clock in zip(df["period"], df["clock"]):
+        minutes, seconds = re.match(r"PT(\d+)M([\d.]+)S", clock).groups()
+        remaining = int(minutes) * 60 + float(seconds)
+        if period <= 4:
+            elapsed.append((period - 1) * 720 + 720 - remaining)
+        else:
+            elapsed.append(2880 + (period - 5) * 300 + 300 - remaining)
+    return elapsed
+
+
+if __name__ == "__main__":
+    df = make_clocks()
+    start = time.perf_counter()
+    expected = row_by_row(df)
+    slow = time.perf_counter() - start
+
+    start = time.perf_counter()
+    elapsed = get_elapsed(df["period"], df["clock"])
+    fast = time.perf_counter() - start
+
+    assert np.allclose(elapsed, expected)
+    print(f"rows:        {ROWS:,}")
+    print(f"row by row:  {slow:8.2f} s")
+    print(f"vectorized:  {fast:8.2f} s ({slow / fast:.0f}x faster)")
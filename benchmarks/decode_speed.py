@@ -0,0 +1,78 @@
+"""Time and peak memory of decoding a large stats.nba.com response, nba_api vs nbastatpy.
+
+The payload is a synthetic league-wide PlayerGameLogs response (about 26k rows, 11 MB)
+so the benchmark runs offline:
+
+    python benchmarks/decode_speed.py
+"""
+
+import json
+import random
+import time
+import tracemalloc
+
+import nba_api.stats.endpoints as nba
+from nba_api.stats.library.http import NBAStatsResponse
+
+from nbastatpy.decode import decode
+
+ROWS = 26000
+
+
+def make_payload(seed: int = 0) -> str:
+    rng = random.Random(seed)
+    headers = nba.PlayerGameLogs.expected_data["PlayerGameLogs"]
+    text_columns = {"PLAYER_NAME", "TEAM_ABBREVIATION", "TEAM_NAME", "MATCHUP", "WL"}
+    rows = []
+    for i in range(ROWS):
+        row = []
+        for header in headers:
+            if header == "SEASON_YEAR":
+                row.append("2023-24")
+            elif header in text_columns:
+                row.append(f"{header.lower()} {i % 500}")
+            elif header == "GAME_DATE":
+                row.append("2024-01-01T00:00:00")
+            elif header == "GAME_ID":
+                row.append(f"00223{i % 1230:05d}")
+            elif "PCT" in header or header == "MIN":
+                row.append(rng.random())
+            else:
+                row.append(rng.randint(0, 50))
+        rows.append(row)
+    result_set = {"name": "PlayerGameLogs", "headers": headers, "rowSet": rows}
+    return json.dumps({"resource": "playergamelogs", "resultSets": [result_set]})
+
+
+def nba_api_decode(contents: str):
+    request = nba.PlayerGameLogs(get_request=False)
+    request.nba_response = NBAStatsResponse(
+        response=contents, status_code=200, url=None
+    )
+    request.load_response()
+    return request.get_data_frames()
+
+
+def measure(func, contents: str):
+    tracemalloc.start()
+    start = time.perf_counter()
+    func(contents)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] / 1024**2
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+if __name__ == "__main__":
+    contents = make_payload()
+    print(f"payload: {len(contents) / 1024**2:.1f} MB, {ROWS:,} rows")
+    for name, func in [
+        ("nba_api", nba_api_decode),
+        ("nbastatpy", lambda contents: decode("playergamelogs", contents)),
+    ]:
+        # Time without tracemalloc, which slows allocation down
+        start = time.perf_counter()
+        func(contents)
+        elapsed = time.perf_counter() - start
+        peak = measure(func, contents)[1]
+        print(f"{name:10} {elapsed:6.3f}s  peak {peak:6.1f} MB")
@@ -0,0 +1,134 @@
+"""Memory used by a season of play-by-play with and without the dtype policy.
+
+The season is synthetic (1,230 games of about 480 actions, with the columns and value
+ranges of PlayByPlayV3) so the benchmark runs offline:
+
+    python benchmarks/dtypes_memory.py
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from nbastatpy.dtypes import SCHEMAS, optimize_frame
+
+GAMES = 1230
+ACTIONS = 480
+
+TEAMS = [
+    "ATL",
+    "BOS",
+    "BKN",
+    "CHA",
+    "CHI",
+    "CLE",
+    "DAL",
+    "DEN",
+    "DET",
+    "GSW",
+    "HOU",
+    "IND",
+    "LAC",
+    "LAL",
+    "MEM",
+    "MIA",
+    "MIL",
+    "MIN",
+    "NOP",
+    "NYK",
+    "OKC",
+    "ORL",
+    "PHI",
+    "PHX",
+    "POR",
+    "SAC",
+    "SAS",
+    "TOR",
+    "UTA",
+    "WAS",
+]
+ACTION_TYPES = [
+    "Made Shot",
+    "Missed Shot",
+    "Rebound",
+    "Foul",
+    "Free Throw",
+    "Turnover",
+    "Substitution",
+    "Timeout",
+    "Jump Ball",
+    "Violation",
+    "period",
+]
+SUB_TYPES = [
+    "Jump Shot",
+    "Layup",
+    "Dunk",
+    "Hook",
+    "personal",
+    "shooting",
+    "offensive",
+    "defensive",
+    "bad pass",
+    "lost ball",
+    "out",
+    "in",
+    "",
+]
+
+
+def make_season(seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    rows = GAMES * ACTIONS
+    players = [f"Player {i}" for i in range(550)]
+    player = rng.integers(0, len(players), rows)
+    seconds = rng.integers(0, 720, rows)
+    return pd.DataFrame(
+        {
+            "gameId": np.repeat(
+                [f"00223{i:05d}" for i in range(1, GAMES + 1)], ACTIONS
+            ),
+            "actionNumber": np.tile(np.arange(1, ACTIONS + 1), GAMES),
+            "clock": [f"PT{s // 60:02d}M{s % 60:02d}.00S" for s in seconds],
+            "period": np.tile(np.repeat([1, 2, 3, 4], ACTIONS // 4), GAMES),
+            "teamId": rng.integers(1610612737, 1610612767, rows),
+            "teamTricode": rng.choice(TEAMS, rows),
+            "personId": 1626000 + player,
+            "playerName": np.array(players, dtype=object)[player],
+            "playerNameI": np.array([f"P. {i}" for i in range(550)], dtype=object)[
+                player
+            ],
+            "xLegacy": rng.integers(-250, 250, rows),
+            "yLegacy": rng.integers(-50, 400, rows),
+            "shotDistance": rng.integers(0, 35, rows),
+            "shotResult": rng.choice(["Made", "Missed", ""], rows),
+            "isFieldGoal": rng.integers(0, 2, rows),
+            "scoreHome": rng.integers(0, 130, rows).astype(str),
+            "scoreAway": rng.integers(0, 130, rows).astype(str),
+            "pointsTotal": rng.integers(0, 260, rows),
+            "location": rng.choice(["h", "v", ""], rows),
+            "description": [f"Player {p} action {i}" for i, p in enumerate(player)],
+            "actionType": rng.choice(ACTION_TYPES, rows),
+            "subType": rng.choice(SUB_TYPES, rows),
+            "videoAvailable": rng.integers(0, 2, rows),
+            "shotValue": rng.integers(0, 4, rows),
+            "actionId": np.tile(np.arange(1, ACTIONS + 1), GAMES),
+        }
+    )
+
+
+def megabytes(df: pd.DataFrame) -> float:
+    return df.memory_usage(deep=True).sum() / 1024**2
+
+
+if __name__ == "__main__":
+    season = make_season()
+    start = time.perf_counter()
+    optimized = optimize_frame(season, SCHEMAS["playbyplayv3"])
+    elapsed = time.perf_counter() - start
+
+    before, after = megabytes(season), megabytes(optimized)
+    print(f"rows:      {len(season):,}")
+    print(f"default:   {before:8.1f} MB")
+    print(f"optimized: {after:8.1f} MB ({before / after:.1f}x smaller, {elapsed:.2f}s)")
@@ -0,0 +1,77 @@
+"""Time to find who was on the floor for a season of play-by-play actions, scanning the
+rotations for every action vs the OnCourtIndex.
+
+Rotations are synthetic (1,230 games, ten players per team each checking in and out a
+few times) so the benchmark runs offline:
+
+    python benchmarks/oncourt_speed.py
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from nbastatpy.oncourt import OnCourtIndex
+
+GAMES = 1230
+LOOKUPS = 1_000_000
+TEAMS = (1610612737, 1610612738)
+
+
+def make_rotations(seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    rows = []
+    for game in range(1, GAMES + 1):
+        for team in TEAMS:
+            for slot in range(5):
+                cuts = np.sort(rng.choice(np.arange(1, 288) * 100, 3, replace=False))
+                edges = [0, *cuts, 28800]
+                for k in range(4):
+                    player = team % 1000 * 100 + slot * 4 + k
+                    rows.append(
+                        (f"00223{game:05d}", team, player, edges[k], edges[k + 1])
+                    )
+    return pd.DataFrame(
+        rows,
+        columns=["GAME_ID", "TEAM_ID", "PERSON_ID", "IN_TIME_REAL", "OUT_TIME_REAL"],
+    )
+
+
+def scan(rotations: pd.DataFrame, game_id: str, seconds: float, team: int) -> tuple:
+    on_court = (
+        (rotations["GAME_ID"] == game_id)
+        & (rotations["TEAM_ID"] == team)
+        & (rotations["IN_TIME_REAL"] <= seconds * 10)
+        & (seconds * 10 < rotations["OUT_TIME_REAL"])
+    )
+    return tuple(sorted(rotations.loc[on_court, "PERSON_ID"]))
+
+
+if __name__ == "__main__":
+    rotations = make_rotations()
+    rng = np.random.default_rng(1)
+    game_ids = np.array([f"00223{g:05d}" for g in rng.integers(1, GAMES + 1, LOOKUPS)])
+    seconds = rng.uniform(0, 2879, LOOKUPS)
+    teams = rng.choice(TEAMS, LOOKUPS)
+
+    sample = 200
+    start = time.perf_counter()
+    expected = [
+        scan(rotations, *args)
+        for args in zip(game_ids[:sample], seconds[:sample], teams[:sample])
+    ]
+    scanned = (time.perf_counter() - start) / sample * LOOKUPS
+
+    start = time.perf_counter()
+    index = OnCourtIndex(rotations)
+    built = time.perf_counter() - start
+    start = time.perf_counter()
+    lineups = index.lineups_at(game_ids, seconds, teams)
+    looked_up = time.perf_counter() - start
+
+    assert lineups[:sample] == expected
+    print(f"lookups:       {LOOKUPS:,}")
+    print(f"linear scan:   {scanned:8.1f} s (extrapolated from {sample})")
+    print(f"index build:   {built:8.2f} s")
+    print(f"index lookups: {looked_up:8.2f} s")
@@ -0,0 +1,30 @@
+"""Time to split one game and a whole season of play-by-play into possessions.
+
+The season is the synthetic one from dtypes_memory.py (1,230 games of about 480
+actions) so the benchmark runs offline:
+
+    python benchmarks/possessions_speed.py
+"""
+
+import time
+
+from dtypes_memory import make_season
+
+from nbastatpy.possessions import get_possessions
+
+if __name__ == "__main__":
+    season = make_season()
+    game = season[season["gameId"] == season["gameId"].iloc[0]]
+
+    start = time.perf_counter()
+    get_possessions(game)
+    game_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    possessions = get_possessions(season)
+    season_elapsed = time.perf_counter() - start
+
+    print(f"rows:        {len(season):,}")
+    print(f"possessions: {len(possessions):,}")
+    print(f"one game:    {game_elapsed * 1000:8.1f} ms")
+    print(f"season:      {season_elapsed:8.2f} s")
@@ -0,0 +1,49 @@
+"""Peak memory of writing a season of play-by-play to Parquet, concatenated vs streamed.
+
+Games are synthetic (1,230 of about 480 actions, built one at a time like responses
+coming in) so the benchmark runs offline:
+
+    python benchmarks/stream_memory.py
+"""
+
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+from dtypes_memory import ACTIONS, GAMES, make_season
+
+from nbastatpy.export import write_dataset, write_stream
+
+GAME = make_season().iloc[:ACTIONS]
+
+
+def games():
+    for i in range(1, GAMES + 1):
+        yield GAME.assign(gameId=f"00223{i:05d}")
+
+
+def measure(write) -> tuple:
+    tracemalloc.start()
+    start = time.perf_counter()
+    with tempfile.TemporaryDirectory() as path:
+        write(path)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] / 1024**2
+    tracemalloc.stop()
+    return peak, elapsed
+
+
+def concatenated(path):
+    season = pd.concat(list(games()), ignore_index=True)
+    write_dataset(season, path, "playbyplay", "2023-24")
+
+
+def streamed(path):
+    write_stream(games(), path, "playbyplay", "2023-24", chunk_rows=50_000)
+
+
+if __name__ == "__main__":
+    for name, write in [("concatenated", concatenated), ("streamed", streamed)]:
+        peak, elapsed = measure(write)
+        print(f"{name:13} peak {peak:8.1f} MB ({elapsed:.2f}s)")
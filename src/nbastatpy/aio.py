@@ -0,0 +1,176 @@
+import asyncio
+import functools
+import weakref
+from typing import Any, Dict, Tuple, Union
+
+from nbastatpy.client import PendingRequest, PendingRequests, prefetched
+from nbastatpy.game import Game
+from nbastatpy.player import Player
+from nbastatpy.ratelimit import get_rate_limiter
+from nbastatpy.retry import send_async
+from nbastatpy.season import Season
+from nbastatpy.session import SessionConfig
+from nbastatpy.team import Team
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+
+class AsyncConfig:
+    """Settings for the async API"""
+
+    MAX_CONCURRENCY = 50
+
+
+_client = None
+_loops = weakref.WeakKeyDictionary()
+
+
+def configure_async(max_concurrency: int = None, client=None) -> None:
+    """Sets the concurrency limit and, optionally, the httpx.AsyncClient used by the async API
+
+    Args:
+        max_concurrency (int, optional): most requests in flight at once. Defaults to AsyncConfig.MAX_CONCURRENCY.
+        client (httpx.AsyncClient, optional): client to send requests with. Defaults to a new pooled client per event loop.
+    """
+    global _client
+    if max_concurrency is not None:
+        AsyncConfig.MAX_CONCURRENCY = max_concurrency
+    _client = client
+    _loops.clear()
+
+
+def _get_loop_state() -> Tuple[Any, asyncio.Semaphore, Dict[str, asyncio.Task]]:
+    # httpx clients and semaphores are bound to the event loop they are first used on
+    loop = asyncio.get_running_loop()
+    if loop not in _loops:
+        client = _client
+        if client is None:
+            if httpx is None:
+                raise ImportError(
+                    "The async API needs httpx: pip install 'nbastatpy[async]'"
+                )
+            client = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=AsyncConfig.MAX_CONCURRENCY),
+                follow_redirects=True,
+            )
+        _loops[loop] = (client, asyncio.Semaphore(AsyncConfig.MAX_CONCURRENCY), {})
+    return _loops[loop]
+
+
+async def fetch(request: PendingRequest) -> Union[str, bytes]:
+    """Sends a pending request with the async client, under the concurrency limit
+
+    Args:
+        request (PendingRequest): request raised by a synchronous method
+
+    Returns:
+        Union[str, bytes]: text for stats.nba.com responses, bytes for pages and images
+    """
+    client, semaphore, in_flight = _get_loop_state()
+
+    # Identical requests already in flight share one network call
+    if request.key not in in_flight:
+        in_flight[request.key] = asyncio.ensure_future(
+            _send(client, semaphore, request)
+        )
+        in_flight[request.key].add_done_callback(
+            lambda _: in_flight.pop(request.key, None)
+        )
+    return await asyncio.shield(in_flight[request.key])
+
+
+async def _send(client, semaphore: asyncio.Semaphore, request: PendingRequest):
+    limiter = get_rate_limiter()
+
+    async def send_once():
+        # Only stats.nba.com requests count against the rate limit
+        if limiter and request.text:
+            await limiter.acquire_async()
+        async with semaphore:
+            return await client.get(
+                request.url,
+                params=request.params,
+                headers=request.headers,
+                timeout=SessionConfig.TIMEOUT,
+            )
+
+    response = await send_async(
+        request.url, send_once, request.retry, errors=(httpx.TransportError,)
+    )
+    # Errors like 404 aren't retried, but they mustn't be cached or archived either
+    response.raise_for_status()
+    return response.text if request.text else response.content
+
+
+async def resolve(method, *args, **kwargs) -> Any:
+    """Runs a synchronous nbastatpy method, awaiting each request it makes instead of blocking
+
+    The method is run until it asks for a response that hasn't been fetched, then the
+    response is awaited and the method is run again.  Transformations are cheap next to
+    the requests, and re-running the real method keeps the return shapes identical.
+
+    Args:
+        method: bound ``get_*`` method of a Game, Player, Season or Team
+
+    Returns:
+        Any: whatever the method returns
+    """
+    responses = {}
+    token = prefetched.set(responses)
+    try:
+        while True:
+            try:
+                return method(*args, **kwargs)
+            except PendingRequests as error:
+                contents = await asyncio.gather(
+                    *[fetch(request) for request in error.requests]
+                )
+                for request, content in zip(error.requests, contents):
+                    responses[request.key] = content
+    finally:
+        prefetched.reset(token)
+
+
+class _AsyncWrapper:
+    sync_class = None
+
+    def __init__(self, *args, **kwargs):
+        self._sync = self.sync_class(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._sync, name)
+        if name.startswith("get_") and callable(attr):
+
+            @functools.wraps(attr)
+            async def method(*args, **kwargs):
+                return await resolve(attr, *args, **kwargs)
+
+            return method
+        return attr
+
+
+class AsyncGame(_AsyncWrapper):
+    """Awaitable version of ``Game``: ``await AsyncGame(game_id).get_boxscore()``"""
+
+    sync_class = Game
+
+
+class AsyncPlayer(_AsyncWrapper):
+    """Awaitable version of ``Player``: ``await AsyncPlayer("Giannis").get_awards()``"""
+
+    sync_class = Player
+
+
+class AsyncSeason(_AsyncWrapper):
+    """Awaitable version of ``Season``: ``await AsyncSeason("2023").get_player_stats()``"""
+
+    sync_class = Season
+
+
+class AsyncTeam(_AsyncWrapper):
+    """Awaitable version of ``Team``: ``await AsyncTeam("MIL").get_roster()``"""
+
+    sync_class = Team
@@ -0,0 +1,157 @@
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from nbastatpy.cache import CacheMissError
+
+
+class ArchiveMissError(CacheMissError):
+    """Raised when replaying and a request was never recorded"""
+
+
+class Archive:
+    MODES = ["record", "replay"]
+
+    def __init__(self, directory: str, mode: str = "record", compresslevel: int = 6):
+        """
+        Compressed, content-addressed archive of raw upstream responses (stats.nba.com JSON,
+        hoopshype pages, cdn.nba.com images).
+
+        Responses are stored once per distinct body under ``objects/`` and ``index.jsonl``
+        maps each request to the body it got, so replaying gives back exactly what was
+        recorded without touching the network.
+
+        Args:
+            directory (str): where to keep the archive
+            mode (str, optional): "record" to save every response, "replay" to serve every request from the archive. Defaults to "record".
+            compresslevel (int, optional): gzip level for new objects. Defaults to 6.
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Archive mode: {mode} not found")
+        self.directory = Path(directory).expanduser()
+        self.mode = mode
+        self.compresslevel = compresslevel
+        self.index_path = self.directory / "index.jsonl"
+        self._index = self._load_index()
+        self._lock = threading.Lock()
+        (self.directory / "objects").mkdir(parents=True, exist_ok=True)
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    def _load_index(self) -> Dict[str, str]:
+        index = {}
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # A line cut short by a crash, the rest of the index is fine
+                        continue
+                    index[entry["key"]] = entry["object"]
+        except FileNotFoundError:
+            pass
+        return index
+
+    def _object_path(self, digest: str) -> Path:
+        return self.directory / "objects" / digest[:2] / f"{digest}.gz"
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Gets the recorded body of a request, None if it was never recorded"""
+        digest = self._index.get(key)
+        if digest is None:
+            return None
+        try:
+            with gzip.open(self._object_path(digest), "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def put(self, key: str, contents: bytes, url: str = None) -> str:
+        """Records the body of a request
+
+        Args:
+            key (str): cache key of the request
+            contents (bytes): raw response body
+            url (str, optional): address requested, kept for reference. Defaults to None.
+
+        Returns:
+            str: SHA-256 of the body, the name it's stored under
+        """
+        digest = hashlib.sha256(contents).hexdigest()
+        path = self._object_path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    # mtime=0 keeps the same body byte-identical across recordings
+                    f.write(gzip.compress(contents, self.compresslevel, mtime=0))
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+
+        with self._lock:
+            if self._index.get(key) != digest:
+                entry = {
+                    "key": key,
+                    "object": digest,
+                    "url": url,
+                    "recorded": time.time(),
+                }
+                with open(self.index_path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(entry) + "\n")
+                self._index[key] = digest
+        return digest
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
+_archive: Optional[Archive] = None
+
+
+def get_archive() -> Optional[Archive]:
+    return _archive
+
+
+def set_archive(archive: Optional[Archive]) -> None:
+    """Sets the archive every request is recorded to or replayed from.  Pass None to turn it off."""
+    global _archive
+    _archive = archive
+
+
+def enable_archive(directory: str = None, mode: str = None) -> Archive:
+    """Turns on recording or replaying of raw responses
+
+    Args:
+        directory (str, optional): archive directory. Defaults to $NBASTATPY_ARCHIVE_DIR.
+        mode (str, optional): "record" or "replay". Defaults to $NBASTATPY_ARCHIVE_MODE or "record".
+
+    Returns:
+        Archive: the archive now in use
+    """
+    directory = directory or os.environ.get("NBASTATPY_ARCHIVE_DIR")
+    if not directory:
+        raise ValueError("Pass a directory or set NBASTATPY_ARCHIVE_DIR")
+    archive = Archive(
+        directory, mode or os.environ.get("NBASTATPY_ARCHIVE_MODE", "record")
+    )
+    set_archive(archive)
+    return archive
+
+
+if os.environ.get("NBASTATPY_ARCHIVE_DIR"):
+    enable_archive()
@@ -0,0 +1,326 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import pandas as pd
+
+from nbastatpy.utils import Formatter
+
+
+class CachePolicy:
+    """Time-to-live, in seconds, for each kind of data. ``None`` never expires and 0 disables caching."""
+
+    FOREVER = None
+
+    TTL = {
+        "game": FOREVER,  # completed boxscores, rotations and play-by-play
+        "live_game": 60,  # the same for games that aren't final yet
+        "season": 60 * 60,  # in-progress league aggregates
+        "game_log": 15 * 60,  # game logs that grow every night
+        "player": 6 * 60 * 60,  # bios, careers and awards
+        "team": 6 * 60 * 60,  # rosters, franchise history and splits
+        "salary": 24 * 60 * 60,  # hoopshype tables
+        "static": 7 * 24 * 60 * 60,  # images and logos
+    }
+
+    # Seconds past its TTL a response is still served while a fresh copy is fetched in
+    # the background, by endpoint.  Others wait on stats.nba.com once they expire.
+    STALE = {
+        "leaguedashplayerstats": 24 * 60 * 60,  # Season.get_player_stats
+        "leaguedashteamstats": 24 * 60 * 60,  # Season.get_team_stats
+        "playerestimatedmetrics": 24 * 60 * 60,  # Season.get_player_estimated_metrics
+        "commonteamroster": 24 * 60 * 60,  # Team.get_roster
+    }
+
+    SEASON_PARAMETERS = ["Season", "SeasonNullable", "SeasonYear", "SeasonAllTime"]
+
+    # Games of the current season known to be over, seeded from the game logs
+    FINAL_GAMES: Set[str] = set()
+
+    def set_ttl(kind: str, seconds: Optional[float]) -> None:
+        CachePolicy.TTL[kind] = seconds
+
+    def set_stale(endpoint: str, seconds: float) -> None:
+        """Sets how long past its TTL an endpoint, e.g. "leaguedashplayerstats", is served stale.  0 turns it off."""
+        CachePolicy.STALE[endpoint.lower()] = seconds
+
+    def get_stale(endpoint: str) -> float:
+        return CachePolicy.STALE.get(endpoint.lower(), 0)
+
+    def mark_final(game_ids: Iterable[str]) -> None:
+        """Records games as over, so their boxscores and play-by-play are kept forever"""
+        CachePolicy.FINAL_GAMES.update(
+            Formatter.format_game_id(game_id) for game_id in game_ids
+        )
+
+    def is_final(game_id: str) -> bool:
+        """Checks whether a game is over: every game of a past season is, and games of
+        this season once a game log has listed them"""
+        game_id = Formatter.format_game_id(game_id)
+        if game_id in CachePolicy.FINAL_GAMES:
+            return True
+        season, _ = Formatter.get_game_season(game_id)
+        return int(season[:4]) < Formatter.get_current_season_year()
+
+    def get_ttl(kind: str, parameters: Dict = None) -> Optional[float]:
+        """Gets the TTL for a kind of data, keeping finished seasons forever
+
+        Args:
+            kind (str): key of ``CachePolicy.TTL``
+            parameters (Dict, optional): request parameters used to find the season. Defaults to None.
+
+        Returns:
+            Optional[float]: seconds to keep the response, None for forever
+        """
+        if kind not in CachePolicy.TTL:
+            raise ValueError(f"Cache kind: {kind} not found")
+
+        season = None
+        for name in CachePolicy.SEASON_PARAMETERS:
+            if (parameters or {}).get(name):
+                season = str(parameters[name])
+                break
+
+        if season and season[:4].isdigit():
+            if int(season[:4]) < Formatter.get_current_season_year():
+                return CachePolicy.FOREVER
+
+        return CachePolicy.TTL[kind]
+
+
+def make_key(name: str, parameters: Dict) -> str:
+    """Builds a cache key from an endpoint name and its normalized parameters
+
+    Args:
+        name (str): endpoint or url the parameters belong to
+        parameters (Dict): request parameters
+
+    Returns:
+        str: sha256 hex digest
+    """
+    normalized = {
+        str(key): "" if value is None else str(value)
+        for key, value in (parameters or {}).items()
+    }
+    payload = json.dumps([name.lower(), normalized], sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CacheMissError(LookupError):
+    """Raised in offline mode when a response isn't in the local cache or archive"""
+
+
+class BaseCache:
+    """Interface for response caches.  Subclass and override get/set/delete/clear to plug in a new backend."""
+
+    def get(self, key: str, allow_expired: bool = False) -> Optional[str]:
+        raise NotImplementedError
+
+    def get_entry(self, key: str) -> Optional[Tuple[str, Optional[float]]]:
+        """Gets a response and when it expires, even if it already has.  Caches that
+        don't override this are never served stale."""
+        contents = self.get(key)
+        return None if contents is None else (contents, None)
+
+    def set(self, key: str, contents: str, ttl: Optional[float] = None) -> None:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+class DiskCache(BaseCache):
+    def __init__(self, directory: str = None):
+        """
+        Stores raw responses as files on disk, one file per request.
+
+        Args:
+            directory (str, optional): Where to keep the files. Defaults to $NBASTATPY_CACHE_DIR or ~/.cache/nbastatpy.
+        """
+        if directory is None:
+            directory = os.environ.get(
+                "NBASTATPY_CACHE_DIR", Path.home() / ".cache" / "nbastatpy"
+            )
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, key: str, allow_expired: bool = False) -> Optional[str]:
+        entry = self.get_entry(key)
+        if entry is None:
+            return None
+        contents, expires = entry
+        if not allow_expired and expires is not None and expires < time.time():
+            return None
+        return contents
+
+    def get_entry(self, key: str) -> Optional[Tuple[str, Optional[float]]]:
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                expires = json.loads(f.readline())["expires"]
+                return f.read(), expires
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def set(self, key: str, contents: str, ttl: Optional[float] = None) -> None:
+        if ttl == 0:
+            return
+        expires = None if ttl is None else time.time() + ttl
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write then rename so readers in other processes never see half a file
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(json.dumps({"expires": expires}) + "\n")
+                f.write(contents)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def delete(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        for path in self.directory.glob("*/*.json"):
+            path.unlink(missing_ok=True)
+
+
+class MemoryCache:
+    def __init__(self, max_bytes: int = 256 * 1024**2):
+        """
+        Process-wide LRU cache of endpoint data frames, bounded by their total memory usage.
+
+        Args:
+            max_bytes (int, optional): Largest total ``memory_usage(deep=True)`` to hold. Defaults to 256 MB.
+        """
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[List[pd.DataFrame]]:
+        """Gets copies of the cached data frames, so callers are free to modify them"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] is not None and entry[1] < time.time():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return [df.copy() for df in entry[0]]
+
+    def set(
+        self, key: str, data_frames: List[pd.DataFrame], ttl: Optional[float] = None
+    ) -> None:
+        if ttl == 0:
+            return
+        data_frames = [df.copy() for df in data_frames]
+        nbytes = int(sum(df.memory_usage(deep=True).sum() for df in data_frames))
+        if nbytes > self.max_bytes:
+            return
+        expires = None if ttl is None else time.time() + ttl
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (data_frames, expires, nbytes)
+            self.size += nbytes
+            while self.size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        self.size -= self._entries.pop(key)[2]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Gets hit/miss counters and current usage"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self.size,
+            "max_bytes": self.max_bytes,
+        }
+
+
+_cache: Optional[BaseCache] = None
+_memory_cache: Optional[MemoryCache] = None
+
+
+def get_cache() -> Optional[BaseCache]:
+    return _cache
+
+
+def set_cache(cache: Optional[BaseCache]) -> None:
+    """Sets the cache used by every nbastatpy request.  Pass None to turn caching off."""
+    global _cache
+    _cache = cache
+
+
+def enable_cache(directory: str = None) -> DiskCache:
+    """Turns on the on-disk cache
+
+    Args:
+        directory (str, optional): cache directory. Defaults to $NBASTATPY_CACHE_DIR or ~/.cache/nbastatpy.
+
+    Returns:
+        DiskCache: the cache now in use
+    """
+    cache = DiskCache(directory)
+    set_cache(cache)
+    return cache
+
+
+def get_memory_cache() -> Optional[MemoryCache]:
+    return _memory_cache
+
+
+def set_memory_cache(cache: Optional[MemoryCache]) -> None:
+    """Sets the in-process cache of data frames.  Pass None to turn it off."""
+    global _memory_cache
+    _memory_cache = cache
+
+
+def enable_memory_cache(max_bytes: int = 256 * 1024**2) -> MemoryCache:
+    """Turns on the in-process cache of data frames
+
+    Args:
+        max_bytes (int, optional): memory budget for the cached frames. Defaults to 256 MB.
+
+    Returns:
+        MemoryCache: the cache now in use
+    """
+    cache = MemoryCache(max_bytes)
+    set_memory_cache(cache)
+    return cache
+
+
+if os.environ.get("NBASTATPY_CACHE_DIR"):
+    enable_cache()
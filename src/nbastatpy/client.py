@@ -0,0 +1,471 @@
+import base64
+import contextvars
+import functools
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Type
+
+import pandas as pd
+import requests
+from nba_api.stats.endpoints._base import Endpoint
+from loguru import logger
+from nba_api.stats.library.http import NBAStatsHTTP, NBAStatsResponse
+from rich.progress import track
+
+from nbastatpy.archive import ArchiveMissError, get_archive
+from nbastatpy.cache import (
+    CacheMissError,
+    CachePolicy,
+    get_cache,
+    get_memory_cache,
+    make_key,
+)
+from nbastatpy.decode import DecodeConfig, LazyFrames, decode_lazy
+from nbastatpy.dtypes import SCHEMAS, DtypeConfig, optimize_frame, optimize_frames
+from nbastatpy.ratelimit import get_rate_limiter
+from nbastatpy.retry import RetryPolicy, send
+from nbastatpy.session import SessionConfig, get_headers, get_session
+
+# Responses fetched ahead of time by the async API, keyed by cache key.  When set,
+# requests that aren't in it raise PendingRequest instead of going to the network.
+prefetched: ContextVar[Optional[Dict]] = ContextVar("prefetched", default=None)
+
+
+class ClientConfig:
+    """Settings for how requests are sent"""
+
+    MAX_WORKERS = 8
+    # Threads refreshing stale cache entries in the background
+    REFRESH_WORKERS = 2
+    # Serve everything from the local cache and archive, never the network
+    OFFLINE = os.environ.get("NBASTATPY_OFFLINE", "").lower() not in ("", "0", "false")
+
+
+def configure_offline(enabled: bool = True) -> None:
+    """Turns offline mode on or off.  Offline, every request is served from the disk cache
+    (expired entries included) or the archive, and anything missing raises CacheMissError.
+    ``NBASTATPY_OFFLINE=1`` turns it on at import.
+    """
+    ClientConfig.OFFLINE = enabled
+
+
+class PendingRequests(Exception):
+    def __init__(self, requests: List["PendingRequest"]):
+        """
+        Raised when several requests have to be fetched before a method can finish.
+
+        Args:
+            requests (List[PendingRequest]): the requests to fetch
+        """
+        super().__init__(f"{len(requests)} pending requests")
+        self.requests = requests
+
+
+class PendingRequest(PendingRequests):
+    def __init__(
+        self,
+        key: str,
+        url: str,
+        params: List = None,
+        headers: Dict[str, str] = None,
+        text: bool = True,
+        retry: RetryPolicy = None,
+    ):
+        """
+        Raised when a request has to be fetched by the caller before the method can finish.
+
+        Args:
+            key (str): cache key the response should be stored under
+            url (str): address to request
+            params (List, optional): query parameters as (key, value) pairs. Defaults to None.
+            headers (Dict[str, str], optional): request headers. Defaults to None.
+            text (bool, optional): whether the response is decoded text or raw bytes. Defaults to True.
+            retry (RetryPolicy, optional): retry policy for this request. Defaults to None.
+        """
+        super().__init__([self])
+        self.key = key
+        self.url = url
+        self.params = params
+        self.headers = headers
+        self.text = text
+        self.retry = retry
+
+
+class _Call:
+    def __init__(self):
+        self.event = threading.Event()
+        self.waiters = 0
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    def __init__(self):
+        """
+        Coalesces concurrent calls with the same key: the first caller runs the call and the
+        others wait for it and share its result (or its exception).
+        """
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, func: Callable[[], Any]) -> Tuple[Any, bool]:
+        """Runs func unless a call with the same key is already in flight
+
+        Args:
+            key (str): identifies identical calls
+            func (Callable[[], Any]): the call
+
+        Returns:
+            Tuple[Any, bool]: the result, and whether it was shared with other callers
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                call.waiters += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = func()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.result, call.waiters > 0
+
+
+_in_flight = SingleFlight()
+
+
+class EndpointResult:
+    def __init__(self, data_frames: Sequence[pd.DataFrame]):
+        """
+        Data frames loaded from an nba_api endpoint.
+
+        Args:
+            data_frames (Sequence[pd.DataFrame]): one data frame per result set, a LazyFrames when decoded by nbastatpy
+        """
+        self.data_frames = data_frames
+
+    def get_data_frames(self) -> Sequence[pd.DataFrame]:
+        return self.data_frames
+
+
+def _get_recorded(key: str, name: str) -> Optional[bytes]:
+    # Replaying and offline mode serve from the archive and never fall back to the network
+    archive = get_archive()
+    replaying = archive is not None and archive.replaying
+    if not (replaying or ClientConfig.OFFLINE):
+        return None
+    contents = archive.get(key) if archive is not None else None
+    if contents is not None:
+        return contents
+    if ClientConfig.OFFLINE:
+        raise CacheMissError(f"Offline: {name} is not in the local cache or archive")
+    raise ArchiveMissError(f"{name} is not in the archive")
+
+
+def _send_endpoint(request: Endpoint, key: str, retry: RetryPolicy = None) -> str:
+    url = NBAStatsHTTP.base_url.format(endpoint=request.endpoint)
+    # stats.nba.com is picky about parameter order
+    params = sorted(request.parameters.items())
+    headers = get_headers(request.headers or NBAStatsHTTP.headers)
+
+    contents = _get_recorded(key, f"{request.endpoint} {dict(params)}")
+    if contents is not None:
+        return NBAStatsHTTP().clean_contents(contents.decode("utf-8"))
+
+    responses = prefetched.get()
+    if responses is not None:
+        if key not in responses:
+            raise PendingRequest(key, url, params, headers, retry=retry)
+        text = responses[key]
+    else:
+        proxies = (
+            {"http": request.proxy, "https": request.proxy} if request.proxy else None
+        )
+        limiter = get_rate_limiter()
+
+        def send_once() -> requests.Response:
+            if limiter:
+                limiter.acquire()
+            return get_session().get(
+                url,
+                params=params,
+                headers=headers,
+                proxies=proxies,
+                timeout=SessionConfig.TIMEOUT,
+            )
+
+        text = send(url, send_once, retry).text
+
+    archive = get_archive()
+    if archive is not None:
+        archive.put(key, text.encode("utf-8"), url)
+    return NBAStatsHTTP().clean_contents(text)
+
+
+_refreshing: Dict[str, Future] = {}
+_refresh_lock = threading.Lock()
+_refresh_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_cached(cache, key: str, endpoint: str) -> Tuple[Optional[str], bool]:
+    # Returns the cached response and whether it's stale but still within its grace period
+    entry = cache.get_entry(key)
+    if entry is None:
+        return None, False
+    contents, expires = entry
+    now = time.time()
+    if expires is None or expires >= now:
+        return contents, False
+    if now - expires <= CachePolicy.get_stale(endpoint):
+        return contents, True
+    return None, False
+
+
+def _refresh(request: Endpoint, key: str, ttl: Optional[float], retry: RetryPolicy):
+    try:
+        contents = _send_endpoint(request, key, retry)
+        response = NBAStatsResponse(response=contents, status_code=200, url=None)
+        cache = get_cache()
+        if cache and response.valid_json():
+            cache.set(key, contents, ttl)
+    except Exception as error:
+        # The stale copy keeps being served until a refresh succeeds
+        logger.warning(f"Refreshing {request.endpoint} failed: {error!r}")
+    finally:
+        with _refresh_lock:
+            _refreshing.pop(key, None)
+
+
+def _refresh_later(
+    request: Endpoint, key: str, ttl: Optional[float], retry: RetryPolicy
+) -> None:
+    global _refresh_executor
+    with _refresh_lock:
+        if key in _refreshing:
+            return
+        if _refresh_executor is None:
+            _refresh_executor = ThreadPoolExecutor(
+                ClientConfig.REFRESH_WORKERS, thread_name_prefix="nbastatpy-refresh"
+            )
+        # Run outside the caller's context, so an async replay doesn't catch the request
+        future = _refresh_executor.submit(
+            contextvars.Context().run, _refresh, request, key, ttl, retry
+        )
+        _refreshing[key] = future
+
+
+def wait_for_refreshes(timeout: float = None) -> None:
+    """Waits for the background refreshes of stale cache entries to finish, e.g. before a script exits
+
+    Args:
+        timeout (float, optional): most seconds to wait. Defaults to None.
+    """
+    with _refresh_lock:
+        futures = list(_refreshing.values())
+    wait(futures, timeout)
+
+
+def get_endpoint(
+    endpoint: Type[Endpoint],
+    *args,
+    kind: str,
+    retry: RetryPolicy = None,
+    **kwargs,
+) -> EndpointResult:
+    """Builds an nba_api endpoint and loads its data, going through the caches when they are set
+
+    Args:
+        endpoint (Type[Endpoint]): nba_api endpoint class, e.g. ``nba.BoxScoreTraditionalV3``
+        kind (str): kind of data, used to pick the TTL from ``CachePolicy.TTL``
+        retry (RetryPolicy, optional): overrides the default retry policy. Defaults to None.
+        *args, **kwargs: passed on to the endpoint
+
+    Returns:
+        EndpointResult: the data frames for each result set
+    """
+    request = endpoint(*args, get_request=False, **kwargs)
+    key = make_key(request.endpoint, request.parameters)
+    ttl = CachePolicy.get_ttl(kind, request.parameters)
+
+    memory_cache = get_memory_cache()
+    if memory_cache:
+        data_frames = memory_cache.get(key)
+        if data_frames is not None:
+            return EndpointResult(data_frames)
+
+    def load() -> List[pd.DataFrame]:
+        cache = get_cache()
+        contents = None
+        stale = False
+        if cache:
+            # Offline, an expired response beats no response
+            if ClientConfig.OFFLINE:
+                contents = cache.get(key, allow_expired=True)
+            elif CachePolicy.get_stale(request.endpoint):
+                contents, stale = _get_cached(cache, key, request.endpoint)
+            else:
+                contents = cache.get(key)
+        cached = contents is not None
+        if stale:
+            # Serve the stale copy now and fetch a fresh one for the next caller
+            _refresh_later(request, key, ttl, retry)
+        if not cached:
+            contents = _send_endpoint(request, key, retry)
+
+        transform = None
+        if DtypeConfig.ENABLED:
+            transform = functools.partial(
+                optimize_frame, schema=SCHEMAS.get(request.endpoint.lower())
+            )
+
+        data_frames = None
+        if DecodeConfig.ENABLED:
+            data_frames = decode_lazy(request.endpoint, contents, transform)
+        valid = data_frames is not None
+        if data_frames is None:
+            # Let nba_api load it, and raise its usual errors
+            response = NBAStatsResponse(response=contents, status_code=200, url=None)
+            valid = response.valid_json()
+            request.nba_response = response
+            request.load_response()
+            data_frames = request.get_data_frames()
+            if DtypeConfig.ENABLED:
+                data_frames = optimize_frames(request.endpoint, data_frames)
+
+        if cache and not cached and valid:
+            cache.set(key, contents, ttl)
+
+        if memory_cache and not stale:
+            # The memory cache sizes and copies whole frames, so build them all up front
+            data_frames = list(data_frames)
+            memory_cache.set(key, data_frames, ttl)
+        return data_frames
+
+    if prefetched.get() is not None:
+        # Under the async API a miss raises PendingRequest instead of fetching, which
+        # threads waiting on the same key mustn't get
+        data_frames, shared = load(), False
+    else:
+        data_frames, shared = _in_flight.do(key, load)
+    if shared:
+        # Every caller gets its own frames, since methods add columns in place
+        if isinstance(data_frames, LazyFrames):
+            data_frames = data_frames.view()
+        else:
+            data_frames = [df.copy() for df in data_frames]
+    return EndpointResult(data_frames)
+
+
+def get_url(url: str, retry: RetryPolicy = None, kind: str = "static") -> bytes:
+    """Downloads a page or image (hoopshype, cdn.nba.com) through the shared session and cache
+
+    Args:
+        url (str): address to download
+        retry (RetryPolicy, optional): overrides the default retry policy. Defaults to None.
+        kind (str, optional): kind of data, used to pick the TTL from ``CachePolicy.TTL``. Defaults to "static".
+
+    Returns:
+        bytes: the response body
+    """
+    key = make_key(url, {})
+    cache = get_cache()
+    if cache:
+        # Bodies may be images, so they're kept base64-encoded.  Offline, an expired
+        # response beats no response.
+        contents = cache.get(key, allow_expired=ClientConfig.OFFLINE)
+        if contents is not None:
+            return base64.b64decode(contents)
+
+    contents = _get_recorded(key, url)
+    if contents is not None:
+        return contents
+
+    responses = prefetched.get()
+    if responses is not None:
+        if key not in responses:
+            raise PendingRequest(key, url, text=False, retry=retry)
+        contents = responses[key]
+    else:
+
+        def send_once() -> requests.Response:
+            return get_session().get(url, timeout=SessionConfig.TIMEOUT)
+
+        def download() -> bytes:
+            response = send(url, send_once, retry)
+            # Errors like 404 aren't retried, but they mustn't be cached or archived either
+            response.raise_for_status()
+            return response.content
+
+        contents = _in_flight.do(key, download)[0]
+
+    archive = get_archive()
+    if archive is not None:
+        archive.put(key, contents, url)
+    if cache:
+        cache.set(
+            key,
+            base64.b64encode(contents).decode("ascii"),
+            CachePolicy.get_ttl(kind),
+        )
+    return contents
+
+
+def map_concurrent(
+    func: Callable[[Any], Any],
+    items: Iterable,
+    max_workers: int = None,
+    description: str = "Working...",
+) -> List:
+    """Calls a function on each item in a bounded thread pool.  Requests still draw from the shared rate limit.
+
+    Args:
+        func (Callable[[Any], Any]): function to call, usually one that calls get_endpoint
+        items (Iterable): arguments, one call each
+        max_workers (int, optional): most calls running at once. Defaults to ClientConfig.MAX_WORKERS.
+        description (str, optional): progress bar label, None to hide the bar. Defaults to "Working...".
+
+    Returns:
+        List: results in the same order as the items
+    """
+    items = list(items)
+
+    if prefetched.get() is not None:
+        # Under the async API, collect every missing response so they're fetched together
+        results, pending = [], []
+        for item in items:
+            try:
+                results.append(func(item))
+            except PendingRequests as error:
+                pending.extend(error.requests)
+        if pending:
+            raise PendingRequests(pending)
+        return results
+
+    results = [None] * len(items)
+    with ThreadPoolExecutor(max_workers or ClientConfig.MAX_WORKERS) as pool:
+        futures = {
+            pool.submit(contextvars.copy_context().run, func, item): i
+            for i, item in enumerate(items)
+        }
+        completed = as_completed(futures)
+        if description is not None:
+            completed = track(completed, total=len(futures), description=description)
+        for future in completed:
+            results[futures[future]] = future.result()
+    return results
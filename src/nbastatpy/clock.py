@@ -0,0 +1,120 @@
+from typing import Iterable, Union
+
+import numpy as np
+import pandas as pd
+
+
+class ClockConfig:
+    """Game clock conversions, and whether ``Game`` adds the converted columns"""
+
+    ENABLED = False
+    PERIODS = 4
+    PERIOD_SECONDS = 12 * 60
+    OVERTIME_SECONDS = 5 * 60
+
+
+def configure_clock(enabled: bool = True) -> None:
+    """Turns on the seconds columns ``Game`` adds to play-by-play, rotations and boxscores"""
+    ClockConfig.ENABLED = enabled
+
+
+def _parse_unique(values: pd.Series) -> np.ndarray:
+    # ISO-8601 durations (PT11M32.00S) from V3 endpoints and MM:SS from the others
+    values = values.astype(str).str.strip()
+    iso = values.str.extract(r"^PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+(?:\.\d+)?)S)?$")
+    colon = values.str.extract(r"^(\d+):(\d+(?:\.\d+)?)$")
+    iso = iso.astype(float)
+    colon = colon.astype(float)
+
+    seconds = (
+        iso[0].fillna(0) * 3600 + iso[1].fillna(0) * 60 + iso[2].fillna(0)
+    ).where(iso.notna().any(axis=1))
+    seconds = seconds.fillna(colon[0] * 60 + colon[1])
+    return seconds.to_numpy(float)
+
+
+def parse_duration(values: Union[pd.Series, Iterable[str]]) -> np.ndarray:
+    """Converts clocks and minutes played to seconds, e.g. "PT11M32.00S" or "11:32" to 692.0
+
+    Each distinct value is parsed once, so millions of rows cost about as much as the
+    few thousand clock readings a season has.
+
+    Args:
+        values (Union[pd.Series, Iterable[str]]): ISO-8601 durations or MM:SS strings
+
+    Returns:
+        np.ndarray: seconds, NaN where a value is missing or can't be read
+    """
+    codes, uniques = pd.factorize(pd.Series(values), use_na_sentinel=True)
+    seconds = _parse_unique(pd.Series(uniques, dtype=object))
+    # A trailing NaN catches the missing values, which factorize codes as -1
+    return np.append(seconds, np.nan)[codes]
+
+
+def get_period_start(periods: Union[pd.Series, Iterable[int]]) -> np.ndarray:
+    """Seconds from tip-off to the start of each period, with five-minute overtimes"""
+    periods = np.asarray(periods, dtype=np.int64)
+    regulation = ClockConfig.PERIODS
+    return np.where(
+        periods <= regulation,
+        (periods - 1) * ClockConfig.PERIOD_SECONDS,
+        regulation * ClockConfig.PERIOD_SECONDS
+        + (periods - regulation - 1) * ClockConfig.OVERTIME_SECONDS,
+    )
+
+
+def get_elapsed(
+    periods: Union[pd.Series, Iterable[int]], clocks: Union[pd.Series, Iterable[str]]
+) -> np.ndarray:
+    """Converts the period and the time left on the clock to seconds since tip-off
+
+    Args:
+        periods (Union[pd.Series, Iterable[int]]): period of each action, 5 and up for overtime
+        clocks (Union[pd.Series, Iterable[str]]): time left in the period, e.g. "PT11M32.00S"
+
+    Returns:
+        np.ndarray: seconds since tip-off
+    """
+    return _get_elapsed(periods, parse_duration(clocks))
+
+
+def _get_elapsed(periods, remaining: np.ndarray) -> np.ndarray:
+    periods = np.asarray(periods, dtype=np.int64)
+    length = np.where(
+        periods <= ClockConfig.PERIODS,
+        ClockConfig.PERIOD_SECONDS,
+        ClockConfig.OVERTIME_SECONDS,
+    )
+    return get_period_start(periods) + length - remaining
+
+
+def tenths_to_seconds(times: Union[pd.Series, Iterable[float]]) -> np.ndarray:
+    """Converts ``GameRotation`` times, tenths of a second since tip-off, to seconds"""
+    return np.asarray(times, dtype=float) / 10
+
+
+def add_playbyplay_seconds(df: pd.DataFrame) -> pd.DataFrame:
+    """Adds ``clockSeconds`` (left in the period) and ``elapsedSeconds`` to PlayByPlayV3 actions"""
+    df = df.copy()
+    df["clockSeconds"] = parse_duration(df["clock"])
+    df["elapsedSeconds"] = _get_elapsed(df["period"], df["clockSeconds"].to_numpy())
+    return df
+
+
+def add_rotation_seconds(df: pd.DataFrame) -> pd.DataFrame:
+    """Adds ``IN_TIME_SECONDS`` and ``OUT_TIME_SECONDS`` to ``GameRotation`` stints"""
+    df = df.copy()
+    df["IN_TIME_SECONDS"] = tenths_to_seconds(df["IN_TIME_REAL"])
+    df["OUT_TIME_SECONDS"] = tenths_to_seconds(df["OUT_TIME_REAL"])
+    return df
+
+
+def add_minutes_seconds(df: pd.DataFrame) -> pd.DataFrame:
+    """Adds ``seconds`` played next to the ``minutes`` of a V3 boxscore, if it has them"""
+    if "minutes" not in df.columns:
+        return df
+    df = df.copy()
+    df.insert(
+        df.columns.get_loc("minutes") + 1, "seconds", parse_duration(df["minutes"])
+    )
+    return df
@@ -0,0 +1,261 @@
+import functools
+import json
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from nba_api.stats.endpoints._base import Endpoint
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    from nba_api.stats.endpoints._parsers import get_parser_for_endpoint
+except ImportError:  # pragma: no cover
+    get_parser_for_endpoint = None
+
+
+class DecodeConfig:
+    """Settings for turning stats.nba.com responses into data frames"""
+
+    # Build frames column by column instead of going through nba_api's row-based path
+    ENABLED = True
+
+
+def loads(contents: str) -> Any:
+    """Parses JSON with orjson when it's installed"""
+    if orjson is not None:
+        return orjson.loads(contents)
+    return json.loads(contents)
+
+
+def get_data_sets(endpoint: str, data: Dict) -> Optional[List[Dict]]:
+    """Gets the result sets of a parsed response the way nba_api would, in the same order
+
+    Args:
+        endpoint (str): nba_api endpoint name, e.g. "playergamelogs"
+        data (Dict): parsed response
+
+    Returns:
+        Optional[List[Dict]]: ``{"headers": ..., "data": ...}`` per result set, None if the format isn't known
+    """
+    if "resultSets" in data or "resultSet" in data:
+        results = data.get("resultSets", data.get("resultSet"))
+        if isinstance(results, dict):
+            results = [results] if "name" in results else []
+        return [
+            {"headers": result["headers"], "data": result["rowSet"]}
+            for result in results
+        ]
+
+    # V3 endpoints nest their data and nba_api has a parser for each of them
+    if get_parser_for_endpoint is None:
+        return None
+    try:
+        parser = get_parser_for_endpoint(endpoint, data)
+    except KeyError:
+        return None
+    return list(parser.get_data_sets().values())
+
+
+def _to_column(values: list):
+    # Numeric columns go straight into a NumPy array.  Anything numpy can't type
+    # (strings, missing values, mixed types) is inferred by pandas, like nba_api does.
+    first = values[0]
+    if type(first) in (int, float, bool):
+        array = np.array(values)
+        if array.dtype.kind in "biuf":
+            return array
+    return pd.Series(values)
+
+
+def build_frame(data_set: Dict) -> pd.DataFrame:
+    """Builds a data frame from a result set column by column
+
+    Args:
+        data_set (Dict): ``{"headers": ..., "data": ...}``
+
+    Returns:
+        pd.DataFrame: the same frame nba_api would build
+    """
+    headers, rows = data_set.get("headers"), data_set.get("data")
+    if (
+        not headers
+        or not rows
+        or not isinstance(headers[0], str)
+        or len(set(headers)) != len(headers)
+    ):
+        # Empty sets, multi-level and duplicate headers are rare, nba_api handles them
+        return Endpoint.DataSet(data=data_set).get_data_frame()
+
+    if any(len(row) != len(headers) for row in rows):
+        return Endpoint.DataSet(data=data_set).get_data_frame()
+    # One column at a time, so only a single column of references exists next to the rows
+    columns = {
+        header: _to_column([row[i] for row in rows]) for i, header in enumerate(headers)
+    }
+    return pd.DataFrame(columns)
+
+
+_UNBUILT = object()
+
+
+class LazyFrames(list):
+    def __init__(
+        self,
+        data_sets: List[Dict],
+        transform: Callable[[pd.DataFrame], pd.DataFrame] = None,
+    ):
+        """
+        List of data frames, one per result set, each built the first time it's accessed.
+        Methods that only use ``[0]`` never pay for the other result sets.  Anything that
+        needs the whole list (iterating aside) builds every frame first, so it behaves
+        like a plain list everywhere else, pickling and copying included.
+
+        Args:
+            data_sets (List[Dict]): ``{"headers": ..., "data": ...}`` per result set
+            transform (Callable[[pd.DataFrame], pd.DataFrame], optional): applied to each frame once it's built. Defaults to None.
+        """
+        super().__init__([_UNBUILT] * len(data_sets))
+        self._data_sets = list(data_sets)
+        self._transform = transform
+        self._lock = threading.Lock()
+        self._source = None
+
+    def _build(self, i: int) -> pd.DataFrame:
+        df = list.__getitem__(self, i)
+        if df is not _UNBUILT:
+            return df
+        with self._lock:
+            df = list.__getitem__(self, i)
+            if df is _UNBUILT:
+                if self._source is not None:
+                    df = self._source._build(i).copy()
+                else:
+                    df = build_frame(self._data_sets[i])
+                    if self._transform is not None:
+                        df = self._transform(df)
+                    # The parsed rows aren't needed anymore
+                    self._data_sets[i] = None
+                list.__setitem__(self, i, df)
+        return df
+
+    def _build_all(self) -> None:
+        for i in range(len(self)):
+            self._build(i)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._build(i) for i in range(len(self))[index]]
+        return self._build(range(len(self))[index])
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self._build(i)
+
+    def __reversed__(self):
+        for i in reversed(range(len(self))):
+            yield self._build(i)
+
+    def __radd__(self, other: list) -> list:
+        self._build_all()
+        return list(other) + list.copy(self)
+
+    def __reduce_ex__(self, protocol):
+        # Unpickles as a plain list, without the lock and the raw result sets
+        self._build_all()
+        return list, (list.copy(self),)
+
+    def view(self) -> "LazyFrames":
+        """Gets a view that shares the decoded data but hands out its own copies of the frames"""
+        view = LazyFrames([_UNBUILT] * len(self))
+        view._source = self
+        return view
+
+
+def _built(name: str):
+    method = getattr(list, name)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self._build_all()
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+# Everything else list does works on the frames themselves, so build them first
+for _name in [
+    "__add__",
+    "__contains__",
+    "__delitem__",
+    "__eq__",
+    "__ge__",
+    "__gt__",
+    "__iadd__",
+    "__imul__",
+    "__le__",
+    "__lt__",
+    "__mul__",
+    "__ne__",
+    "__repr__",
+    "__rmul__",
+    "__setitem__",
+    "append",
+    "clear",
+    "copy",
+    "count",
+    "extend",
+    "index",
+    "insert",
+    "pop",
+    "remove",
+    "reverse",
+    "sort",
+]:
+    setattr(LazyFrames, _name, _built(_name))
+
+
+def decode_lazy(
+    endpoint: str,
+    contents: str,
+    transform: Callable[[pd.DataFrame], pd.DataFrame] = None,
+) -> Optional[LazyFrames]:
+    """Parses a raw response, leaving each result set to be built when it's first accessed
+
+    Args:
+        endpoint (str): nba_api endpoint name, e.g. "playergamelogs"
+        contents (str): response body
+        transform (Callable[[pd.DataFrame], pd.DataFrame], optional): applied to each frame once it's built. Defaults to None.
+
+    Returns:
+        Optional[LazyFrames]: the frames, None if the response isn't valid JSON or has an unknown format
+    """
+    try:
+        data = loads(contents)
+    except ValueError:
+        return None
+    if not isinstance(data, dict):
+        return None
+
+    data_sets = get_data_sets(endpoint, data)
+    if data_sets is None:
+        return None
+    return LazyFrames(data_sets, transform)
+
+
+def decode(endpoint: str, contents: str) -> Optional[List[pd.DataFrame]]:
+    """Turns a raw response into one data frame per result set
+
+    Args:
+        endpoint (str): nba_api endpoint name, e.g. "playergamelogs"
+        contents (str): response body
+
+    Returns:
+        Optional[List[pd.DataFrame]]: the frames, None if the response isn't valid JSON or has an unknown format
+    """
+    frames = decode_lazy(endpoint, contents)
+    return None if frames is None else list(frames)
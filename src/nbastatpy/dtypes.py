@@ -0,0 +1,168 @@
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from nbastatpy.cache import get_memory_cache
+
+
+class DtypeConfig:
+    """Opt-in memory optimization for the data frames every class returns"""
+
+    ENABLED = False
+    # Strings become categoricals when there are at most this many distinct values per row
+    CATEGORY_RATIO = 0.5
+    # Smallest integer type used when a schema doesn't say otherwise, so that
+    # arithmetic on the columns doesn't overflow
+    MIN_INT = "int32"
+    DOWNCAST_FLOATS = True
+
+
+# Per-endpoint dtypes, keyed by the nba_api endpoint name.  Columns not listed here
+# go through the generic rules in DtypeConfig.
+SCHEMAS: Dict[str, Dict[str, str]] = {
+    "playbyplayv3": {
+        "actionNumber": "int32",
+        "period": "int8",
+        "teamTricode": "category",
+        "playerName": "category",
+        "playerNameI": "category",
+        "shotResult": "category",
+        "location": "category",
+        "actionType": "category",
+        "subType": "category",
+        "videoAvailable": "int8",
+        "isFieldGoal": "int8",
+        "shotDistance": "float32",
+        "xLegacy": "float32",
+        "yLegacy": "float32",
+    },
+    "playergamelogs": {
+        "SEASON_YEAR": "category",
+        "PLAYER_NAME": "category",
+        "TEAM_ABBREVIATION": "category",
+        "TEAM_NAME": "category",
+        "MATCHUP": "category",
+        "WL": "category",
+        "GAME_DATE": "category",
+    },
+    "leaguedashplayerstats": {
+        "TEAM_ABBREVIATION": "category",
+        "AGE": "float32",
+    },
+    "shotchartdetail": {
+        "GRID_TYPE": "category",
+        "PLAYER_NAME": "category",
+        "TEAM_NAME": "category",
+        "EVENT_TYPE": "category",
+        "ACTION_TYPE": "category",
+        "SHOT_TYPE": "category",
+        "SHOT_ZONE_BASIC": "category",
+        "SHOT_ZONE_AREA": "category",
+        "SHOT_ZONE_RANGE": "category",
+        "GAME_DATE": "category",
+        "HTM": "category",
+        "VTM": "category",
+        "PERIOD": "int8",
+        "MINUTES_REMAINING": "int8",
+        "SECONDS_REMAINING": "int8",
+        "SHOT_DISTANCE": "int16",
+        "LOC_X": "int16",
+        "LOC_Y": "int16",
+        "SHOT_ATTEMPTED_FLAG": "int8",
+        "SHOT_MADE_FLAG": "int8",
+    },
+}
+
+
+def configure_dtypes(
+    enabled: bool = True,
+    category_ratio: float = None,
+    min_int: str = None,
+    downcast_floats: bool = None,
+) -> None:
+    """Turns the dtype policy on or off.  The in-process cache is cleared so frames aren't mixed.
+
+    Args:
+        enabled (bool, optional): optimize the dtypes of returned frames. Defaults to True.
+        category_ratio (float, optional): most distinct values per row for a string column to become a categorical. Defaults to DtypeConfig.CATEGORY_RATIO.
+        min_int (str, optional): smallest integer type for columns without a schema. Defaults to DtypeConfig.MIN_INT.
+        downcast_floats (bool, optional): store floats as float32. Defaults to DtypeConfig.DOWNCAST_FLOATS.
+    """
+    DtypeConfig.ENABLED = enabled
+    if category_ratio is not None:
+        DtypeConfig.CATEGORY_RATIO = category_ratio
+    if min_int is not None:
+        DtypeConfig.MIN_INT = min_int
+    if downcast_floats is not None:
+        DtypeConfig.DOWNCAST_FLOATS = downcast_floats
+
+    memory_cache = get_memory_cache()
+    if memory_cache:
+        memory_cache.clear()
+
+
+def set_schema(endpoint: str, schema: Dict[str, str]) -> None:
+    """Sets the dtypes of some columns of an endpoint, e.g. ``set_schema("playbyplayv3", {"clock": "category"})``"""
+    SCHEMAS.setdefault(endpoint.lower(), {}).update(schema)
+
+
+def _is_string(series: pd.Series) -> bool:
+    return pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series)
+
+
+def _optimize_column(series: pd.Series) -> pd.Series:
+    if pd.api.types.is_bool_dtype(series):
+        return series
+    if pd.api.types.is_integer_dtype(series):
+        if len(series) == 0:
+            return series
+        small = np.dtype(DtypeConfig.MIN_INT)
+        info = np.iinfo(small)
+        if info.min <= series.min() and series.max() <= info.max:
+            return series.astype(small)
+        return series
+    if pd.api.types.is_float_dtype(series):
+        return series.astype("float32") if DtypeConfig.DOWNCAST_FLOATS else series
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series
+    if _is_string(series) and len(series):
+        if series.nunique(dropna=False) / len(series) <= DtypeConfig.CATEGORY_RATIO:
+            return series.astype("category")
+    return series
+
+
+def optimize_frame(df: pd.DataFrame, schema: Dict[str, str] = None) -> pd.DataFrame:
+    """Converts repetitive strings to categoricals and downcasts numbers
+
+    Args:
+        df (pd.DataFrame): frame to optimize
+        schema (Dict[str, str], optional): dtypes for some columns, the rest use the generic rules. Defaults to None.
+
+    Returns:
+        pd.DataFrame: the optimized frame
+    """
+    schema = schema or {}
+    if len(df.columns) == 0:
+        return df
+    columns = []
+    for i, column in enumerate(df.columns):
+        series = df.iloc[:, i]
+        dtype = schema.get(column)
+        if dtype is not None:
+            try:
+                columns.append(series.astype(dtype))
+                continue
+            except (TypeError, ValueError):
+                # Missing values in an integer column, or an unexpected string; fall back
+                pass
+        columns.append(_optimize_column(series))
+    return pd.concat(columns, axis=1).set_axis(df.columns, axis=1)
+
+
+def optimize_frames(
+    endpoint: str, data_frames: List[pd.DataFrame]
+) -> List[pd.DataFrame]:
+    """Optimizes every result set of an endpoint with its schema"""
+    schema = SCHEMAS.get(endpoint.lower())
+    return [optimize_frame(df, schema) for df in data_frames]
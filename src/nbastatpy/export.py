@@ -0,0 +1,331 @@
+import os
+import tempfile
+from pathlib import Path
+from typing import Iterable, List, Union
+from urllib.parse import quote
+
+import pandas as pd
+
+from nbastatpy.utils import Formatter
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover
+    pa = None
+
+
+class ExportConfig:
+    """Defaults for exported datasets"""
+
+    FORMAT = "parquet"
+    COMPRESSION = "zstd"
+    # Partition columns, outermost first.  game_date is only written with by_date=True
+    PARTITIONS = ["endpoint", "season", "season_type", "game_date"]
+    # Rows per file when streaming
+    CHUNK_ROWS = 250_000
+    EXTENSIONS = {"parquet": ".parquet", "arrow": ".arrow"}
+    DATE_COLUMNS = ["GAME_DATE", "gameDate", "GAME_DATE_EST"]
+
+
+def _check_pyarrow() -> None:
+    if pa is None:
+        raise ImportError("Exporting needs pyarrow: pip install 'nbastatpy[export]'")
+
+
+def _check_format(format: str) -> str:
+    format = (format or ExportConfig.FORMAT).lower()
+    if format not in ExportConfig.EXTENSIONS:
+        raise ValueError(f"Format: {format} not found")
+    return format
+
+
+def _get_game_dates(df: pd.DataFrame) -> pd.Series:
+    for column in ExportConfig.DATE_COLUMNS:
+        if column in df.columns:
+            return pd.to_datetime(df[column], format="mixed").dt.strftime("%Y-%m-%d")
+    raise ValueError(
+        f"by_date needs one of these columns: {', '.join(ExportConfig.DATE_COLUMNS)}"
+    )
+
+
+def _write_file(
+    df: pd.DataFrame,
+    directory: Path,
+    format: str,
+    compression: str,
+    name: str = "part-0",
+) -> str:
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{name}{ExportConfig.EXTENSIONS[format]}"
+    table = pa.Table.from_pandas(df, preserve_index=False)
+
+    # Write next to the target and swap it in, so readers never see half a file.  The
+    # dot prefix keeps the temporary file out of dataset discovery.
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+    os.close(fd)
+    try:
+        if format == "parquet":
+            pq.write_table(table, temp_path, compression=compression)
+        else:
+            feather.write_feather(table, temp_path, compression=compression)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+    return str(path)
+
+
+def _get_partition(
+    path: Union[str, Path], endpoint: str, season: str, season_type: str
+) -> Path:
+    directory = Path(path)
+    for name, value in zip(ExportConfig.PARTITIONS, [endpoint, season, season_type]):
+        directory = directory / f"{name}={quote(str(value), safe='')}"
+    return directory
+
+
+def _remove_stale(directory: Path, format: str, written: List[str]) -> None:
+    # Files left from an earlier write of the partition with more chunks
+    for file in directory.glob(f"part-*{ExportConfig.EXTENSIONS[format]}"):
+        if str(file) not in written:
+            file.unlink(missing_ok=True)
+
+
+def write_dataset(
+    df: pd.DataFrame,
+    path: Union[str, Path],
+    endpoint: str,
+    season: str,
+    season_type: str = "Regular Season",
+    by_date: bool = False,
+    format: str = None,
+    compression: str = None,
+) -> List[str]:
+    """Writes a data frame to a partitioned dataset, replacing the partitions it covers
+
+    Files are laid out hive style, e.g.
+    ``endpoint=player_games/season=2023-24/season_type=Regular%20Season/part-0.parquet``,
+    so any Parquet/Arrow reader can discover the partitions.
+
+    Args:
+        df (pd.DataFrame): data to write
+        path (Union[str, Path]): root directory of the dataset
+        endpoint (str): name of the data, e.g. "player_games"
+        season (str): season the data belongs to, e.g. "2023-24"
+        season_type (str, optional): season type the data belongs to. Defaults to "Regular Season".
+        by_date (bool, optional): also partition by game date. Defaults to False.
+        format (str, optional): "parquet" or "arrow" (Arrow IPC). Defaults to ExportConfig.FORMAT.
+        compression (str, optional): codec for the files. Defaults to ExportConfig.COMPRESSION.
+
+    Returns:
+        List[str]: paths of the files written
+    """
+    _check_pyarrow()
+    format = _check_format(format)
+    compression = compression or ExportConfig.COMPRESSION
+
+    directory = _get_partition(path, endpoint, season, season_type)
+    if not by_date:
+        written = [_write_file(df, directory, format, compression)]
+        _remove_stale(directory, format, written)
+        return written
+
+    written = []
+    for game_date, group in df.groupby(_get_game_dates(df), sort=True):
+        written.append(
+            _write_file(
+                group, directory / f"game_date={game_date}", format, compression
+            )
+        )
+    return written
+
+
+def write_stream(
+    frames: Iterable[pd.DataFrame],
+    path: Union[str, Path],
+    endpoint: str,
+    season: str,
+    season_type: str = "Regular Season",
+    chunk_rows: int = None,
+    format: str = None,
+    compression: str = None,
+) -> List[str]:
+    """Writes data frames to a dataset as they come, one file per chunk of rows, e.g.
+    every game of a season from ``Game.stream``.  Only one chunk is held in memory at a
+    time, however many frames there are.
+
+    The files replace whatever the partition held before.
+
+    Args:
+        frames (Iterable[pd.DataFrame]): data to write, usually a generator
+        path (Union[str, Path]): root directory of the dataset
+        endpoint (str): name of the data, e.g. "playbyplay"
+        season (str): season the data belongs to, e.g. "2023-24"
+        season_type (str, optional): season type the data belongs to. Defaults to "Regular Season".
+        chunk_rows (int, optional): rows per file. Defaults to ExportConfig.CHUNK_ROWS.
+        format (str, optional): "parquet" or "arrow" (Arrow IPC). Defaults to ExportConfig.FORMAT.
+        compression (str, optional): codec for the files. Defaults to ExportConfig.COMPRESSION.
+
+    Returns:
+        List[str]: paths of the files written
+    """
+    _check_pyarrow()
+    format = _check_format(format)
+    compression = compression or ExportConfig.COMPRESSION
+    chunk_rows = chunk_rows or ExportConfig.CHUNK_ROWS
+    directory = _get_partition(path, endpoint, season, season_type)
+
+    written = []
+    chunk, rows = [], 0
+
+    def flush():
+        df = pd.concat(chunk, ignore_index=True)
+        chunk.clear()
+        written.append(
+            _write_file(df, directory, format, compression, f"part-{len(written)}")
+        )
+
+    for df in frames:
+        chunk.append(df)
+        rows += len(df)
+        if rows >= chunk_rows:
+            flush()
+            rows = 0
+    if chunk:
+        flush()
+
+    _remove_stale(directory, format, written)
+    return written
+
+
+def export(
+    source,
+    name: str,
+    path: Union[str, Path],
+    by_date: bool = False,
+    format: str = None,
+    compression: str = None,
+) -> List[str]:
+    """Runs a ``get_*`` method and writes what it returns to a partitioned dataset
+
+    The season and season type come from the object (or from the game ID for a Game).
+    Methods that return several data frames are written as ``<name>_0``, ``<name>_1``, ...
+
+    Args:
+        source: Game, Player, Season or Team
+        name (str): method to run without the ``get_`` prefix, e.g. "player_games"
+        path (Union[str, Path]): root directory of the dataset
+        by_date (bool, optional): also partition by game date. Defaults to False.
+        format (str, optional): "parquet" or "arrow" (Arrow IPC). Defaults to ExportConfig.FORMAT.
+        compression (str, optional): codec for the files. Defaults to ExportConfig.COMPRESSION.
+
+    Returns:
+        List[str]: paths of the files written
+    """
+    result = getattr(source, f"get_{name}")()
+    if hasattr(source, "season"):
+        season, season_type = source.season, source.season_type
+    else:
+        season, season_type = Formatter.get_game_season(source.game_id)
+
+    if isinstance(result, pd.DataFrame):
+        frames = {name: result}
+    else:
+        frames = {f"{name}_{i}": df for i, df in enumerate(result)}
+
+    written = []
+    for endpoint, df in frames.items():
+        written.extend(
+            write_dataset(
+                df,
+                path,
+                endpoint,
+                season,
+                season_type,
+                by_date=by_date,
+                format=format,
+                compression=compression,
+            )
+        )
+    return written
+
+
+def _as_list(value: Union[str, Iterable[str]]) -> List[str]:
+    return [value] if isinstance(value, str) else list(value)
+
+
+def read_dataset(
+    path: Union[str, Path],
+    endpoint: Union[str, Iterable[str]] = None,
+    season: Union[str, Iterable[str]] = None,
+    season_type: Union[str, Iterable[str]] = None,
+    date_from: str = None,
+    date_to: str = None,
+    columns: List[str] = None,
+    format: str = None,
+) -> pd.DataFrame:
+    """Reads a dataset written by ``write_dataset``.  Filters are applied to the partitions,
+    so files that can't match are never opened.
+
+    Args:
+        path (Union[str, Path]): root directory of the dataset
+        endpoint (Union[str, Iterable[str]], optional): endpoint name(s) to read. Defaults to None.
+        season (Union[str, Iterable[str]], optional): season(s) to read, e.g. "2023-24". Defaults to None.
+        season_type (Union[str, Iterable[str]], optional): season type(s) to read. Defaults to None.
+        date_from (str, optional): first game date to read (YYYY-MM-DD), needs by_date partitions. Defaults to None.
+        date_to (str, optional): last game date to read (YYYY-MM-DD), needs by_date partitions. Defaults to None.
+        columns (List[str], optional): columns to read. Defaults to all.
+        format (str, optional): "parquet" or "arrow" (Arrow IPC). Defaults to ExportConfig.FORMAT.
+
+    Returns:
+        pd.DataFrame: the matching rows, without the partition columns
+    """
+    _check_pyarrow()
+    format = _check_format(format)
+
+    partitioning = ds.partitioning(
+        pa.schema([(name, pa.string()) for name in ExportConfig.PARTITIONS]),
+        flavor="hive",
+    )
+    file_format = "parquet" if format == "parquet" else "ipc"
+    dataset = ds.dataset(path, format=file_format, partitioning=partitioning)
+
+    conditions = []
+    for name, value in [
+        ("endpoint", endpoint),
+        ("season", season),
+        ("season_type", season_type),
+    ]:
+        if value is not None:
+            conditions.append(ds.field(name).isin(_as_list(value)))
+    if date_from is not None:
+        conditions.append(ds.field("game_date") >= date_from)
+    if date_to is not None:
+        conditions.append(ds.field("game_date") <= date_to)
+    expression = None
+    for condition in conditions:
+        expression = condition if expression is None else expression & condition
+
+    # Only partition values are checked here, no file is opened yet
+    fragments = list(dataset.get_fragments(filter=expression))
+    if not fragments:
+        return pd.DataFrame(columns=columns)
+
+    # Columns come and go between endpoints, seasons and streamed chunks, so merge the
+    # schema of every file rather than trusting the first one.  Only footers are read.
+    schema = pa.unify_schemas(
+        [fragment.physical_schema for fragment in fragments],
+        promote_options="permissive",
+    )
+
+    dataset = ds.dataset(
+        [fragment.path for fragment in fragments],
+        schema=schema,
+        format=file_format,
+    )
+    if columns is None:
+        columns = [name for name in schema.names if name not in ExportConfig.PARTITIONS]
+    return dataset.to_table(columns=columns).to_pandas()
@@ -1,27 +1,91 @@
-from typing import List
+import contextvars
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple, Union
 
 import nba_api.stats.endpoints as nba
 import pandas as pd
-
+import requests
+from loguru import logger
+
+from nbastatpy.cache import CachePolicy
+from nbastatpy.client import (
+    ClientConfig,
+    PendingRequests,
+    get_endpoint,
+    map_concurrent,
+)
+from nbastatpy.clock import (
+    ClockConfig,
+    add_minutes_seconds,
+    add_playbyplay_seconds,
+    add_rotation_seconds,
+)
+from nbastatpy.possessions import get_possessions
+from nbastatpy.retry import RetryPolicy
+from nbastatpy.stints import get_stints
 from nbastatpy.utils import Formatter
 
 
+def add_boxscore_seconds(data_frames: List[pd.DataFrame]) -> List[pd.DataFrame]:
+    # Boxscores are left as they are (and lazy) unless the clock columns are on
+    if not ClockConfig.ENABLED:
+        return data_frames
+    return [add_minutes_seconds(df) for df in data_frames]
+
+
 class Game:
-    def __init__(self, game_id: str):
+    KINDS = {
+        "boxscore": "get_boxscore",
+        "advanced": "get_advanced",
+        "defense": "get_defense",
+        "four_factors": "get_four_factors",
+        "hustle": "get_hustle",
+        "matchups": "get_matchups",
+        "misc": "get_misc",
+        "scoring": "get_scoring",
+        "usage": "get_usage",
+        "playertrack": "get_playertrack",
+        "rotations": "get_rotations",
+        "playbyplay": "get_playbyplay",
+        "win_probability": "get_win_probability",
+    }
+    # Kinds whose method returns a single data frame rather than a list of them
+    FRAME_KINDS = {"rotations", "playbyplay", "win_probability"}
+
+    def __init__(self, game_id: str, retry: RetryPolicy = None):
         """This represents a game.  Given an ID, you can get boxscore (and other) information through one of the 'get' methods
 
         Args:
             game_id (str): string with 10 digits
+            retry (RetryPolicy, optional): retry policy for every request this object makes. Defaults to RetryConfig.POLICY.
         """
+        self.retry = retry
         self.game_id = Formatter.format_game_id(game_id)
 
+    def is_final(self) -> bool:
+        """Checks whether the game is over, so its data won't change anymore.  See ``CachePolicy.is_final``."""
+        return CachePolicy.is_final(self.game_id)
+
+    def _get_kind(self) -> str:
+        # Games still in progress are only cached briefly
+        return "game" if self.is_final() else "live_game"
+
     def get_boxscore(self) -> List[pd.DataFrame]:
         """Gets traditional boxscore
 
         Returns:
             List[pd.DataFrame]: list of dataframes (players, starters/bench, team)
         """
-        self.boxscore = nba.BoxScoreTraditionalV3(self.game_id).get_data_frames()
+        self.boxscore = add_boxscore_seconds(
+            get_endpoint(
+                nba.BoxScoreTraditionalV3,
+                self.game_id,
+                kind=self._get_kind(),
+                retry=self.retry,
+            ).get_data_frames()
+        )
         return self.boxscore
 
     def get_advanced(self):
@@ -31,7 +95,14 @@ class Game:
         Returns:
             pandas.DataFrame: The advanced box score data for the game.
         """
-        self.adv_box = nba.BoxScoreAdvancedV3(self.game_id).get_data_frames()
+        self.adv_box = add_boxscore_seconds(
+            get_endpoint(
+                nba.BoxScoreAdvancedV3,
+                self.game_id,
+                kind=self._get_kind(),
+                retry=self.retry,
+            ).get_data_frames()
+        )
         return self.adv_box
 
     def get_defense(self):
@@ -41,7 +112,14 @@ class Game:
         Returns:
             def_box (pandas.DataFrame): DataFrame containing the defensive statistics.
         """
-        self.def_box = nba.BoxScoreDefensiveV2(self.game_id).get_data_frames()
+        self.def_box = add_boxscore_seconds(
+            get_endpoint(
+                nba.BoxScoreDefensiveV2,
+                self.game_id,
+                kind=self._get_kind(),
+                retry=self.retry,
+            ).get_data_frames()
+        )
         return self.def_box
 
     def get_four_factors(self):
@@ -51,7 +129,14 @@ class Game:
         Returns:
             pandas.DataFrame: The four factors data for the game.
         """
-        self.four_factors = nba.BoxScoreFourFactorsV3(self.game_id).get_data_frames()
+        self.four_factors = add_boxscore_seconds(
+            get_endpoint(
+                nba.BoxScoreFourFactorsV3,
+                self.game_id,
+                kind=self._get_kind(),
+                retry=self.retry,
+            ).get_data_frames()
+        )
         return self.four_factors
 
     def get_hustle(self) -> List[pd.DataFrame]:
@@ -60,7 +145,14 @@ class Game:
         Returns:
             List[pd.DataFrame]: list of two dataframes (players, teams)
         """
-        self.hustle = nba.BoxScoreHustleV2(self.game_id).get_data_frames()
+        self.hustle = add_boxscore_seconds(
+            get_endpoint(
+                nba.BoxScoreHustleV2,
+                self.game_id,
+                kind=self._get_kind(),
+                retry=self.retry,
+            ).get_data_frames()
+        )
         return self.hustle
 
     def get_matchups(self):
@@ -70,7 +162,14 @@ class Game:
         Returns:
             pandas.DataFrame: The matchups data for the game.
         """
-        self.matchups = nba.BoxScoreMatchupsV3(self.game_id).get_data_frames()
+        self.matchups = add_boxscore_seconds(
+            get_endpoint(
+                nba.BoxScoreMatchupsV3,
+                self.game_id,
+                kind=self._get_kind(),
+                retry=self.retry,
+            ).get_data_frames()
+        )
         return self.matchups
 
     def get_misc(self):
@@ -80,7 +179,14 @@ class Game:
         Returns:
             pandas.DataFrame: The miscellaneous box score data.
         """
-        self.misc = nba.BoxScoreMiscV3(self.game_id).get_data_frames()
+        self.misc = add_boxscore_seconds(
+            get_endpoint(
+                nba.BoxScoreMiscV3,
+                self.game_id,
+                kind=self._get_kind(),
+                retry=self.retry,
+            ).get_data_frames()
+        )
         return self.misc
 
     def get_scoring(self):
@@ -90,7 +196,14 @@ class Game:
         Returns:
             pandas.DataFrame: The scoring data for the game.
         """
-        self.scoring = nba.BoxScoreScoringV3(self.game_id).get_data_frames()
+        self.scoring = add_boxscore_seconds(
+            get_endpoint(
+                nba.BoxScoreScoringV3,
+                self.game_id,
+                kind=self._get_kind(),
+                retry=self.retry,
+            ).get_data_frames()
+        )
         return self.scoring
 
     def get_usage(self) -> List[pd.DataFrame]:
@@ -99,7 +212,14 @@ class Game:
         Returns:
             List[pd.DataFrame]: list of two dataframes (players, teams)
         """
-        self.usage = nba.BoxScoreUsageV3(self.game_id).get_data_frames()
+        self.usage = add_boxscore_seconds(
+            get_endpoint(
+                nba.BoxScoreUsageV3,
+                self.game_id,
+                kind=self._get_kind(),
+                retry=self.retry,
+            ).get_data_frames()
+        )
         return self.usage
 
     def get_playertrack(self):
@@ -109,7 +229,14 @@ class Game:
         Returns:
             playertrack (pandas.DataFrame): The player tracking data for the game.
         """
-        self.playertrack = nba.BoxScorePlayerTrackV3(self.game_id).get_data_frames()
+        self.playertrack = add_boxscore_seconds(
+            get_endpoint(
+                nba.BoxScorePlayerTrackV3,
+                self.game_id,
+                kind=self._get_kind(),
+                retry=self.retry,
+            ).get_data_frames()
+        )
         return self.playertrack
 
     def get_rotations(self):
@@ -120,8 +247,15 @@ class Game:
             pandas.DataFrame: The rotations data for the game.
         """
         self.rotations = pd.concat(
-            nba.GameRotation(game_id=self.game_id).get_data_frames()
+            get_endpoint(
+                nba.GameRotation,
+                game_id=self.game_id,
+                kind=self._get_kind(),
+                retry=self.retry,
+            ).get_data_frames()
         )
+        if ClockConfig.ENABLED:
+            self.rotations = add_rotation_seconds(self.rotations)
         return self.rotations
 
     def get_playbyplay(self) -> pd.DataFrame:
@@ -131,9 +265,33 @@ class Game:
         Returns:
             pd.DataFrame: The play-by-play data as a pandas DataFrame.
         """
-        self.playbyplay = nba.PlayByPlayV3(self.game_id).get_data_frames()[0]
+        self.playbyplay = get_endpoint(
+            nba.PlayByPlayV3, self.game_id, kind=self._get_kind(), retry=self.retry
+        ).get_data_frames()[0]
+        if ClockConfig.ENABLED:
+            self.playbyplay = add_playbyplay_seconds(self.playbyplay)
         return self.playbyplay
 
+    def get_possessions(self) -> pd.DataFrame:
+        """
+        Splits the play-by-play into possessions.  See ``nbastatpy.possessions``.
+
+        Returns:
+            pd.DataFrame: one row per possession with the offensive team, start and end clock and points.
+        """
+        self.possessions = get_possessions(self.get_playbyplay())
+        return self.possessions
+
+    def get_stints(self) -> pd.DataFrame:
+        """
+        Combines the rotations and play-by-play into lineup stints.  See ``nbastatpy.stints``.
+
+        Returns:
+            pd.DataFrame: two rows per stint, one per team, with the lineups, start and end, possessions and points for and against.
+        """
+        self.stints = get_stints(self.get_rotations(), self.get_playbyplay())
+        return self.stints
+
     def get_win_probability(self) -> pd.DataFrame:
         """
         Retrieves the win probability data for the game.
@@ -141,11 +299,249 @@ class Game:
         Returns:
             pd.DataFrame: The win probability data as a pandas DataFrame.
         """
-        self.win_probability = nba.WinProbabilityPBP(
-            game_id=self.game_id
+        self.win_probability = get_endpoint(
+            nba.WinProbabilityPBP,
+            game_id=self.game_id,
+            kind=self._get_kind(),
+            retry=self.retry,
         ).get_data_frames()[0]
         return self.win_probability
 
+    def get_all(
+        self, kinds: List[str] = None, max_workers: int = None
+    ) -> Dict[str, Union[pd.DataFrame, List[pd.DataFrame]]]:
+        """
+        Retrieves every boxscore variant, the rotations, play-by-play and win probability in parallel.
+
+        The requests still draw from the shared rate limit.  The default budget (a burst of
+        5, then 1 per second) spreads the 13 requests over about 8 seconds, so raise the
+        burst to ``len(Game.KINDS)`` with ``configure_rate_limit`` to send them all at once.
+
+        Args:
+            kinds (List[str], optional): keys of ``Game.KINDS``. Defaults to all of them.
+            max_workers (int, optional): most requests running at once. Defaults to one per kind.
+
+        Returns:
+            Dict[str, Union[pd.DataFrame, List[pd.DataFrame]]]: the result of each ``get_*`` method, by kind
+        """
+        kinds = kinds or list(Game.KINDS)
+        for kind in kinds:
+            if kind not in Game.KINDS:
+                raise ValueError(f"Kind: {kind} not found")
+
+        results = map_concurrent(
+            lambda kind: getattr(self, Game.KINDS[kind])(),
+            kinds,
+            max_workers or len(kinds),
+            description=None,
+        )
+        self.all = dict(zip(kinds, results))
+        return self.all
+
+    @staticmethod
+    def many(
+        game_ids: Iterable[str],
+        kinds: List[str] = None,
+        max_workers: int = None,
+        retries: int = 2,
+        retry: RetryPolicy = None,
+    ) -> Dict[str, Union[pd.DataFrame, List[pd.DataFrame]]]:
+        """
+        Fetches the same data for many games at once.  See ``GameBatch``.
+
+        Args:
+            game_ids (Iterable[str]): games to fetch
+            kinds (List[str], optional): keys of ``Game.KINDS``. Defaults to ["boxscore"].
+            max_workers (int, optional): most requests running at once. Defaults to ClientConfig.MAX_WORKERS.
+            retries (int, optional): extra attempts for each request failing transiently. Defaults to 2.
+            retry (RetryPolicy, optional): retry policy for each request. Defaults to RetryConfig.POLICY.
+
+        Returns:
+            Dict[str, Union[pd.DataFrame, List[pd.DataFrame]]]: data for every game, by kind
+        """
+        return GameBatch(game_ids, kinds, max_workers, retries, retry=retry).get()
+
+    @staticmethod
+    def stream(
+        game_ids: Iterable[str],
+        kind: str = "playbyplay",
+        transforms: Iterable[Callable[[pd.DataFrame], pd.DataFrame]] = None,
+        max_workers: int = None,
+        retries: int = 2,
+        retry: RetryPolicy = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Yields one game at a time, in order, instead of concatenating them all like ``many``.
+        Only a few games are fetched ahead, so memory stays flat however many games there
+        are.  Pair it with ``nbastatpy.export.write_stream`` to load seasons to disk.
+
+        Args:
+            game_ids (Iterable[str]): games to fetch
+            kind (str, optional): key of ``Game.KINDS`` whose method returns a single data frame. Defaults to "playbyplay".
+            transforms (Iterable[Callable[[pd.DataFrame], pd.DataFrame]], optional): applied to each game in turn, e.g. ``tag_possessions``. Defaults to None.
+            max_workers (int, optional): most requests running at once. Defaults to ClientConfig.MAX_WORKERS.
+            retries (int, optional): extra attempts for each request failing transiently. Defaults to 2.
+            retry (RetryPolicy, optional): retry policy for each request. Defaults to RetryConfig.POLICY.
+
+        Yields:
+            pd.DataFrame: each game's data, tagged with ``GAME_ID``
+        """
+        transforms = list(transforms or [])
+        batch = GameBatch(game_ids, [kind], max_workers, retries, retry=retry)
+        for _, _, df in batch.iter():
+            for transform in transforms:
+                df = transform(df)
+            yield df
+
+
+class GameBatch:
+    # Errors worth another attempt once the transport has given up
+    TRANSIENT_ERRORS = (
+        ConnectionError,
+        TimeoutError,
+        requests.ConnectionError,
+        requests.Timeout,
+    )
+
+    def __init__(
+        self,
+        game_ids: Iterable[str],
+        kinds: List[str] = None,
+        max_workers: int = None,
+        retries: int = 2,
+        backoff: float = 1.0,
+        retry: RetryPolicy = None,
+    ):
+        """
+        Fetches boxscore (and other) data for many games concurrently.
+
+        Args:
+            game_ids (Iterable[str]): games to fetch
+            kinds (List[str], optional): keys of ``Game.KINDS``. Defaults to ["boxscore"].
+            max_workers (int, optional): most requests running at once. Defaults to ClientConfig.MAX_WORKERS.
+            retries (int, optional): extra attempts for each request failing with a connection error, timeout, 429 or 5xx. Defaults to 2.
+            backoff (float, optional): seconds to wait before the first retry, doubled after each one. Defaults to 1.0.
+            retry (RetryPolicy, optional): retry policy for each request. Defaults to RetryConfig.POLICY.
+        """
+        self.game_ids = [Formatter.format_game_id(game_id) for game_id in game_ids]
+        self.kinds = kinds or ["boxscore"]
+        for kind in self.kinds:
+            if kind not in Game.KINDS:
+                raise ValueError(f"Kind: {kind} not found")
+        self.max_workers = max_workers
+        self.retries = retries
+        self.backoff = backoff
+        self.retry = retry
+        self.failed = {}
+
+    @staticmethod
+    def _is_transient(error: Exception) -> bool:
+        # Outages can outlast the transport's own retries.  Open circuits, bad responses
+        # and misses in offline mode fail the same way every time.
+        if isinstance(error, requests.HTTPError):
+            response = error.response
+            return response is not None and (
+                response.status_code == 429 or response.status_code >= 500
+            )
+        return isinstance(error, GameBatch.TRANSIENT_ERRORS)
+
+    def _fetch(self, job):
+        game_id, kind = job
+        method = getattr(Game(game_id, self.retry), Game.KINDS[kind])
+        for attempt in range(self.retries + 1):
+            try:
+                return method()
+            except PendingRequests:
+                raise
+            except Exception as error:
+                if attempt == self.retries or not self._is_transient(error):
+                    logger.warning(f"Giving up on {kind} for {game_id}: {error}")
+                    self.failed[(game_id, kind)] = error
+                    return None
+                time.sleep(self.backoff * 2**attempt)
+
+    def get(self) -> Dict[str, Union[pd.DataFrame, List[pd.DataFrame]]]:
+        """
+        Fetches every kind for every game.
+
+        Each kind comes back in the same shape as the ``Game`` method (a data frame or a list
+        of them) with the frames from every game concatenated and tagged with ``GAME_ID``.
+        Requests that still fail after the retries are skipped and recorded in ``failed``.
+
+        Returns:
+            Dict[str, Union[pd.DataFrame, List[pd.DataFrame]]]: data for every game, by kind
+        """
+        self.failed = {}
+        jobs = [(game_id, kind) for game_id in self.game_ids for kind in self.kinds]
+        results = map_concurrent(
+            self._fetch, jobs, self.max_workers, description="Fetching games..."
+        )
+
+        by_kind = {kind: [] for kind in self.kinds}
+        for (game_id, kind), result in zip(jobs, results):
+            if result is None:
+                continue
+            if kind in Game.FRAME_KINDS:
+                result = [result]
+            by_kind[kind].append([self._tag(df, game_id) for df in result])
+
+        self.data = {}
+        for kind, game_frames in by_kind.items():
+            frames = [pd.concat(dfs, ignore_index=True) for dfs in zip(*game_frames)]
+            if kind in Game.FRAME_KINDS:
+                # Every game failed: keep the shape callers expect
+                frames = frames[0] if frames else pd.DataFrame()
+            self.data[kind] = frames
+        return self.data
+
+    def iter(
+        self,
+    ) -> Iterator[Tuple[str, str, Union[pd.DataFrame, List[pd.DataFrame]]]]:
+        """
+        Fetches every kind for every game like ``get``, but yields each result as soon as
+        it and the ones before it are in, holding at most ``max_workers`` of them at once.
+
+        Yields:
+            Tuple[str, str, Union[pd.DataFrame, List[pd.DataFrame]]]: game ID, kind and data tagged with ``GAME_ID``
+        """
+        self.failed = {}
+        jobs = iter(
+            [(game_id, kind) for game_id in self.game_ids for kind in self.kinds]
+        )
+        max_workers = self.max_workers or ClientConfig.MAX_WORKERS
+
+        with ThreadPoolExecutor(max_workers) as pool:
+
+            def submit(job):
+                future = pool.submit(contextvars.copy_context().run, self._fetch, job)
+                window.append((job, future))
+
+            window = deque()
+            for job in jobs:
+                submit(job)
+                if len(window) == max_workers:
+                    break
+
+            while window:
+                (game_id, kind), future = window.popleft()
+                result = future.result()
+                job = next(jobs, None)
+                if job is not None:
+                    submit(job)
+                if result is None:
+                    continue
+                if isinstance(result, pd.DataFrame):
+                    yield game_id, kind, self._tag(result, game_id)
+                else:
+                    yield game_id, kind, [self._tag(df, game_id) for df in result]
+
+    @staticmethod
+    def _tag(df: pd.DataFrame, game_id: str) -> pd.DataFrame:
+        if "GAME_ID" not in df.columns:
+            df = df.copy()
+            df.insert(0, "GAME_ID", game_id)
+        return df
+
 
 if __name__ == "__main__":
     GAME_ID = "0022301148"
@@ -0,0 +1,133 @@
+import functools
+import threading
+from typing import Any, Iterable, List
+
+from nbastatpy.client import map_concurrent
+from nbastatpy.game import Game
+from nbastatpy.player import Player
+from nbastatpy.season import Season
+from nbastatpy.team import Team
+
+_UNSET = object()
+
+
+class LazyResult:
+    def __init__(self, method, *args, **kwargs):
+        """
+        Deferred result of a ``get_*`` method.  Nothing is requested until the result is
+        used: indexing, iterating, ``len`` or any data frame attribute fetch it, and
+        ``resolve_all`` fetches many at once.
+
+        Args:
+            method: bound ``get_*`` method of a Game, Player, Season or Team
+        """
+        self._method = method
+        self._args = args
+        self._kwargs = kwargs
+        self._value = _UNSET
+        self._lock = threading.Lock()
+
+    @property
+    def resolved(self) -> bool:
+        return self._value is not _UNSET
+
+    def resolve(self) -> Any:
+        """Runs the method the first time it's called
+
+        Returns:
+            Any: whatever the method returns
+        """
+        if self._value is _UNSET:
+            with self._lock:
+                if self._value is _UNSET:
+                    self._value = self._method(*self._args, **self._kwargs)
+        return self._value
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for names LazyResult doesn't have.  Dunders are left alone so
+        # copy/pickle probes don't trigger a request, but _repr_html_ and friends go through.
+        if name.startswith("__") or name in (
+            "_method",
+            "_args",
+            "_kwargs",
+            "_value",
+            "_lock",
+        ):
+            raise AttributeError(name)
+        return getattr(self.resolve(), name)
+
+    def __getitem__(self, key) -> Any:
+        return self.resolve()[key]
+
+    def __len__(self) -> int:
+        return len(self.resolve())
+
+    def __iter__(self):
+        return iter(self.resolve())
+
+    def __repr__(self) -> str:
+        if not self.resolved:
+            name = getattr(self._method, "__qualname__", repr(self._method))
+            return f"<LazyResult {name} (not fetched)>"
+        return repr(self._value)
+
+
+def resolve_all(results: Iterable[LazyResult], max_workers: int = None) -> List[Any]:
+    """Fetches deferred results together in one concurrent dispatch
+
+    Args:
+        results (Iterable[LazyResult]): results to fetch, ones already fetched are skipped
+        max_workers (int, optional): most requests running at once. Defaults to ClientConfig.MAX_WORKERS.
+
+    Returns:
+        List[Any]: the values, in the same order as the results
+    """
+    results = list(results)
+    pending = [result for result in results if not result.resolved]
+    if pending:
+        map_concurrent(
+            LazyResult.resolve, pending, max_workers, description="Resolving..."
+        )
+    return [result.resolve() for result in results]
+
+
+class _LazyWrapper:
+    sync_class = None
+
+    def __init__(self, *args, **kwargs):
+        self._sync = self.sync_class(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._sync, name)
+        if name.startswith("get_") and callable(attr):
+
+            @functools.wraps(attr)
+            def method(*args, **kwargs):
+                return LazyResult(attr, *args, **kwargs)
+
+            return method
+        return attr
+
+
+class LazyGame(_LazyWrapper):
+    """Deferred version of ``Game``: ``LazyGame(game_id).get_boxscore()`` fetches on first use"""
+
+    sync_class = Game
+
+
+class LazyPlayer(_LazyWrapper):
+    """Deferred version of ``Player``: ``LazyPlayer("Giannis").get_awards()`` fetches on first use"""
+
+    sync_class = Player
+
+
+class LazySeason(_LazyWrapper):
+    """Deferred version of ``Season``: ``LazySeason("2023").get_player_stats()`` fetches on first use"""
+
+    sync_class = Season
+
+
+class LazyTeam(_LazyWrapper):
+    """Deferred version of ``Team``: ``LazyTeam("MIL").get_roster()`` fetches on first use"""
+
+    sync_class = Team
@@ -0,0 +1,126 @@
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from nbastatpy.clock import tenths_to_seconds
+from nbastatpy.stints import SPAN, Lineup, build_stints, find_stints
+
+
+class OnCourtIndex:
+    def __init__(self, rotations: pd.DataFrame):
+        """
+        Index of who was on the floor, over one game or a whole season of
+        ``Game.get_rotations``.  Every lookup is a binary search on sorted arrays, so
+        attributing millions of play-by-play actions to lineups takes a few calls.
+
+        Times are seconds since tip-off, e.g. ``clock.get_elapsed(period, clock)``.
+
+        Args:
+            rotations (pd.DataFrame): ``Game.get_rotations`` of one game or many
+        """
+        self.stints = build_stints(rotations)
+        self._team_ids = [
+            self.stints[f"TEAM_ID_{i}"].to_numpy(np.int64) for i in (0, 1)
+        ]
+        self._lineups = [self.stints[f"LINEUP_{i}"].to_numpy() for i in (0, 1)]
+
+        # Every player's own stretches on the floor, sorted on the same game/time key
+        games = pd.unique(self.stints["GAME_ID"])
+        codes = (
+            pd.Index(games).get_indexer(rotations["GAME_ID"]).astype(np.int64) * SPAN
+        )
+        intervals = pd.DataFrame(
+            {
+                "PERSON_ID": rotations["PERSON_ID"].to_numpy(np.int64),
+                "START": codes + tenths_to_seconds(rotations["IN_TIME_REAL"]),
+                "END": codes + tenths_to_seconds(rotations["OUT_TIME_REAL"]),
+            }
+        ).sort_values("START", kind="stable")
+        self._players: Dict[int, Tuple[np.ndarray, np.ndarray]] = {
+            player: (group["START"].to_numpy(), group["END"].to_numpy())
+            for player, group in intervals.groupby("PERSON_ID", sort=False)
+        }
+        self._game_ids = np.asarray(games)
+
+    def find(self, game_ids: Iterable[str], seconds: Iterable[float]) -> np.ndarray:
+        """Finds the row of ``stints`` for many moments at once
+
+        Args:
+            game_ids (Iterable[str]): game of each moment
+            seconds (Iterable[float]): seconds since tip-off of each moment
+
+        Returns:
+            np.ndarray: row of ``stints`` for each moment, -1 where the game isn't indexed or is already over
+        """
+        return find_stints(self.stints, game_ids, seconds)
+
+    def players_at(self, game_id: str, seconds: float) -> Lineup:
+        """Gets the ten players on the floor at one moment, as a sorted tuple of player IDs"""
+        stint = self.find([game_id], [seconds])[0]
+        if stint < 0:
+            return ()
+        return tuple(sorted(self._lineups[0][stint] + self._lineups[1][stint]))
+
+    def lineups_at(
+        self,
+        game_ids: Iterable[str],
+        seconds: Iterable[float],
+        team_ids: Iterable[int],
+    ) -> List[Lineup]:
+        """Gets a team's lineup at many moments at once, e.g. the offense of every action
+
+        Args:
+            game_ids (Iterable[str]): game of each moment
+            seconds (Iterable[float]): seconds since tip-off of each moment
+            team_ids (Iterable[int]): team to get the lineup of at each moment
+
+        Returns:
+            List[Lineup]: sorted tuples of player IDs, None where the team or game isn't indexed
+        """
+        stint = self.find(game_ids, seconds)
+        team_ids = np.asarray(team_ids, dtype=np.int64)
+        lineups = np.full(len(stint), None, dtype=object)
+        for i in (0, 1):
+            rows = (stint >= 0) & (self._team_ids[i][stint] == team_ids)
+            lineups[rows] = self._lineups[i][stint[rows]]
+        return lineups.tolist()
+
+    def shared(self, player_a: int, player_b: int) -> pd.DataFrame:
+        """Gets the stretches two players were on the floor together
+
+        Args:
+            player_a (int): player ID
+            player_b (int): player ID
+
+        Returns:
+            pd.DataFrame: ``GAME_ID``, ``START`` and ``END`` in seconds since tip-off, and ``SECONDS`` of each stretch
+        """
+        empty = (np.empty(0), np.empty(0))
+        starts_a, ends_a = self._players.get(player_a, empty)
+        starts_b, ends_b = self._players.get(player_b, empty)
+
+        # A player's stretches never overlap, so the ones of b overlapping a stretch of a
+        # are a contiguous run found by two binary searches
+        first = np.searchsorted(ends_b, starts_a, side="right")
+        last = np.searchsorted(starts_b, ends_a, side="left")
+        counts = np.maximum(last - first, 0)
+        a = np.repeat(np.arange(len(starts_a)), counts)
+        offsets = np.arange(counts.sum()) - np.repeat(
+            np.cumsum(counts) - counts, counts
+        )
+        b = np.repeat(first, counts) + offsets
+
+        starts = np.maximum(starts_a[a], starts_b[b])
+        ends = np.minimum(ends_a[a], ends_b[b])
+        overlap = ends > starts
+        starts, ends = starts[overlap], ends[overlap]
+        games = (starts // SPAN).astype(np.int64)
+        return pd.DataFrame(
+            {
+                "GAME_ID": self._game_ids[games],
+                "START": starts - games * SPAN,
+                "END": ends - games * SPAN,
+                "SECONDS": ends - starts,
+            }
+        )
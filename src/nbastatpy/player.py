@@ -1,14 +1,16 @@
 from io import BytesIO
+from typing import List
 
 import nba_api.stats.endpoints as nba
 import pandas as pd
-import requests
 from bs4 import BeautifulSoup
 from loguru import logger
 from nba_api.stats.endpoints import leaguegamefinder
 from nba_api.stats.static import players, teams
 from PIL import Image
 
+from nbastatpy.client import get_endpoint, get_url
+from nbastatpy.retry import RetryPolicy
 from nbastatpy.utils import Formatter, PlayTypes
 
 
@@ -19,6 +21,7 @@ class Player:
         season_year: str = None,
         playoffs: bool = False,
         permode: str = "PERGAME",
+        retry: RetryPolicy = None,
     ):
         """
         Initializes a Player object.
@@ -28,7 +31,9 @@ class Player:
             season_year (str, optional): The season year. Defaults to None.
             playoffs (bool, optional): Whether to retrieve playoff data. Defaults to False.
             permode (str, optional): The per mode for the player's stats. Defaults to "PERGAME".
+            retry (RetryPolicy, optional): retry policy for every request this object makes. Defaults to RetryConfig.POLICY.
         """
+        self.retry = retry
         self.permode = PlayTypes.PERMODE[
             permode.replace("_", "").replace("-", "").upper()
         ]
@@ -59,15 +64,17 @@ class Player:
         if playoffs:
             self.season_type = "Playoffs"
 
-
     def get_common_info(self) -> pd.DataFrame:
         """Gets common info like height, weight, draft_year, etc. and sets as class attr
-        
+
         Returns:
             pd.DataFrame: A DataFrame containing the common information of the player.
         """
         self.common_info = (
-            nba.CommonPlayerInfo(self.id).get_data_frames()[0].iloc[0].to_dict()
+            get_endpoint(nba.CommonPlayerInfo, self.id, kind="player", retry=self.retry)
+            .get_data_frames()[0]
+            .iloc[0]
+            .to_dict()
         )
 
         for attr_name, value in self.common_info.items():
@@ -83,28 +90,37 @@ class Player:
             pd.DataFrame: A DataFrame containing the salary information for the player.
         """
         salary_url = f"https://hoopshype.com/player/{self.first_name}-{self.last_name}/salary/".lower()
-        result = requests.get(salary_url)
-        soup = BeautifulSoup(result.content, features="html.parser")
+        result = get_url(salary_url, kind="salary", retry=self.retry)
+        soup = BeautifulSoup(result, features="html.parser")
         tables = soup.find_all("table")
         if len(tables) > 1:
             # Get the table rows
-            rows = [[cell.text.strip() for cell in row.find_all('td')] for row in tables[0].find_all('tr')]
+            rows = [
+                [cell.text.strip() for cell in row.find_all("td")]
+                for row in tables[0].find_all("tr")
+            ]
+
+            rows2 = [
+                [cell.text.strip() for cell in row.find_all("td")]
+                for row in tables[1].find_all("tr")
+            ]
 
-            rows2 = [[cell.text.strip() for cell in row.find_all('td')] for row in tables[1].find_all('tr')]
-            
             projected = pd.DataFrame(rows[1:], columns=rows[0])
             projected["Team"] = projected.columns[1]
-            projected = projected.rename(columns={projected.columns[1]:"Salary"})
+            projected = projected.rename(columns={projected.columns[1]: "Salary"})
             projected["Salary_Type"] = "Projected"
-            
+
             historical = pd.DataFrame(rows2[1:], columns=rows2[0])
             historical["Salary_Type"] = "Historical"
-            
+
             self.salary_df = pd.concat([projected, historical])
-            
+
         else:
             # Get the table rows
-            rows = [[cell.text.strip() for cell in row.find_all('td')] for row in tables[0].find_all('tr')]
+            rows = [
+                [cell.text.strip() for cell in row.find_all("td")]
+                for row in tables[0].find_all("tr")
+            ]
             self.salary_df = pd.DataFrame(rows[1:], columns=rows[0])
 
         return self.salary_df
@@ -117,8 +133,8 @@ class Player:
             PIL.Image.Image: The headshot image of the player.
         """
         pic_url = f"https://cdn.nba.com/headshots/nba/latest/1040x760/{self.id}.png"
-        pic = requests.get(pic_url)
-        self.headshot = Image.open(BytesIO(pic.content))
+        pic = get_url(pic_url, retry=self.retry)
+        self.headshot = Image.open(BytesIO(pic))
         return self.headshot
 
     def get_season_career_totals(self) -> pd.DataFrame:
@@ -127,20 +143,37 @@ class Player:
         Returns:
             pd.DataFrame: 2 dataframes, season totals and career
         """
-        df_list = nba.PlayerCareerStats(player_id=self.id).get_data_frames()
+        df_list = get_endpoint(
+            nba.PlayerCareerStats, player_id=self.id, kind="player", retry=self.retry
+        ).get_data_frames()
         self.career_totals = df_list[1]
         self.season_totals = df_list[0]
         return self.season_totals, self.career_totals
 
+    def _get_season_teams(self) -> List[int]:
+        """Gets the IDs of the teams the player played for during the season"""
+        if not hasattr(self, "season_totals"):
+            logger.info("Getting Teams")
+            teams = self.get_season_career_totals()[0]
+        else:
+            teams = self.season_totals.copy()
+
+        return teams[(teams["SEASON_ID"] == self.season) & (teams["TEAM_ID"] != 0)][
+            "TEAM_ID"
+        ].tolist()
+
     def get_splits(self) -> pd.DataFrame:
         """Gets all splits for a given season"""
 
         self.splits_data = pd.concat(
-            nba.PlayerDashboardByGeneralSplits(
+            get_endpoint(
+                nba.PlayerDashboardByGeneralSplits,
                 self.id,
                 season=self.season,
                 season_type_playoffs=self.season_type,
                 per_mode_detailed=self.permode,
+                kind="season",
+                retry=self.retry,
             ).get_data_frames()
         )
 
@@ -154,11 +187,14 @@ class Player:
         """
 
         self.game_splits = pd.concat(
-            nba.PlayerDashboardByGameSplits(
+            get_endpoint(
+                nba.PlayerDashboardByGameSplits,
                 self.id,
                 season=self.season,
                 season_type_playoffs=self.season_type,
                 per_mode_detailed=self.permode,
+                kind="season",
+                retry=self.retry,
             ).get_data_frames()
         )
         return self.game_splits
@@ -166,11 +202,14 @@ class Player:
     def get_shooting_splits(self) -> pd.DataFrame:
 
         self.shooting_splits = pd.concat(
-            nba.PlayerDashboardByShootingSplits(
+            get_endpoint(
+                nba.PlayerDashboardByShootingSplits,
                 self.id,
                 season=self.season,
                 season_type_playoffs=self.season_type,
                 per_mode_detailed=self.permode,
+                kind="season",
+                retry=self.retry,
             ).get_data_frames()
         )
         return self.shooting_splits
@@ -182,16 +221,25 @@ class Player:
         ):  # Check if we know the player's draft year yet
             self.get_common_info()
 
-        self.combine_stats = nba.DraftCombineStats(
-            season_all_time=self.draft_year
+        self.combine_stats = get_endpoint(
+            nba.DraftCombineStats,
+            season_all_time=self.draft_year,
+            kind="season",
+            retry=self.retry,
         ).get_data_frames()[0]
 
-        self.combine_nonstationary_shooting = nba.DraftCombineNonStationaryShooting(
-            season_year=self.draft_year
+        self.combine_nonstationary_shooting = get_endpoint(
+            nba.DraftCombineNonStationaryShooting,
+            season_year=self.draft_year,
+            kind="season",
+            retry=self.retry,
         ).get_data_frames()[0]
 
-        self.combine_spot_shooting = nba.DraftCombineSpotShooting(
-            season_year=self.draft_year
+        self.combine_spot_shooting = get_endpoint(
+            nba.DraftCombineSpotShooting,
+            season_year=self.draft_year,
+            kind="season",
+            retry=self.retry,
         ).get_data_frames()[0]
 
         return [
@@ -206,7 +254,9 @@ class Player:
         Returns:
             pd.DataFrame: A DataFrame containing the player's awards.
         """
-        self.awards = nba.PlayerAwards(self.id).get_data_frames()[0]
+        self.awards = get_endpoint(
+            nba.PlayerAwards, self.id, kind="player", retry=self.retry
+        ).get_data_frames()[0]
         return self.awards
 
     def get_games_boxscore(self) -> pd.DataFrame:
@@ -216,10 +266,13 @@ class Player:
         Returns:
             pd.DataFrame: The boxscore data for the player's games.
         """
-        self.games_boxscore = leaguegamefinder.LeagueGameFinder(
+        self.games_boxscore = get_endpoint(
+            leaguegamefinder.LeagueGameFinder,
             player_id_nullable=self.id,
             season_nullable=self.season,
             season_type_nullable=self.season_type,
+            kind="game_log",
+            retry=self.retry,
         ).get_data_frames()[0]
         return self.games_boxscore
 
@@ -228,25 +281,31 @@ class Player:
         Retrieves the matchups data for the player.
 
         Args:
-            defense (bool, optional): If True, retrieves the defensive matchups data. 
+            defense (bool, optional): If True, retrieves the defensive matchups data.
                 If False, retrieves the offensive matchups data. Defaults to False.
 
         Returns:
             pd.DataFrame: The matchups data for the player.
         """
         if defense:
-            self.matchups = nba.LeagueSeasonMatchups(
+            self.matchups = get_endpoint(
+                nba.LeagueSeasonMatchups,
                 def_player_id_nullable=self.id,
                 season=self.season,
                 season_type_playoffs=self.season_type,
                 per_mode_simple=self.permode,
+                kind="season",
+                retry=self.retry,
             ).get_data_frames()[0]
         else:
-            self.matchups = nba.LeagueSeasonMatchups(
+            self.matchups = get_endpoint(
+                nba.LeagueSeasonMatchups,
                 off_player_id_nullable=self.id,
                 season=self.season,
                 season_type_playoffs=self.season_type,
                 per_mode_simple=self.permode,
+                kind="season",
+                retry=self.retry,
             ).get_data_frames()[0]
         return self.matchups
 
@@ -257,11 +316,14 @@ class Player:
             pd.DataFrame: dataframe with a given year of clutch segments
         """
         self.clutch = pd.concat(
-            nba.PlayerDashboardByClutch(
+            get_endpoint(
+                nba.PlayerDashboardByClutch,
                 player_id=self.id,
                 season=self.season,
                 season_type_playoffs=self.season_type,
                 per_mode_detailed=self.permode,
+                kind="season",
+                retry=self.retry,
             ).get_data_frames()
         )
         return self.clutch
@@ -273,27 +335,22 @@ class Player:
         Returns:
             pd.DataFrame: A DataFrame containing the passing statistics for the player.
         """
-        if not hasattr(self, "season_totals"):
-            logger.info("Getting Teams")
-            teams = self.get_season_career_totals()[0]
-        else:
-            teams = self.season_totals.copy()
-
-        teams = teams[(teams["SEASON_ID"] == self.season) & (teams["TEAM_ID"] != 0)][
-            "TEAM_ID"
-        ].tolist()
+        teams = self._get_season_teams()
 
         if len(teams) > 1:
             self.pt_pass = []
             for team in teams:
                 self.pt_pass.append(
                     pd.concat(
-                        nba.PlayerDashPtPass(
+                        get_endpoint(
+                            nba.PlayerDashPtPass,
                             player_id=self.id,
                             team_id=team,
                             season=self.season,
                             season_type_all_star=self.season_type,
                             per_mode_simple=self.permode,
+                            kind="season",
+                            retry=self.retry,
                         ).get_data_frames()
                     )
                 )
@@ -302,12 +359,15 @@ class Player:
 
         else:
             self.pt_pass = pd.concat(
-                nba.PlayerDashPtPass(
+                get_endpoint(
+                    nba.PlayerDashPtPass,
                     player_id=self.id,
                     team_id=teams[0],
                     season=self.season,
                     season_type_all_star=self.season_type,
                     per_mode_simple=self.permode,
+                    kind="season",
+                    retry=self.retry,
                 ).get_data_frames()
             )
 
@@ -326,27 +386,22 @@ class Player:
         Returns:
             pd.DataFrame: A DataFrame containing the rebounds data.
         """
-        if not hasattr(self, "season_totals"):
-            logger.info("Getting Teams")
-            teams = self.get_season_career_totals()[0]
-        else:
-            teams = self.season_totals.copy()
-
-        teams = teams[(teams["SEASON_ID"] == self.season) & (teams["TEAM_ID"] != 0)][
-            "TEAM_ID"
-        ].tolist()
+        teams = self._get_season_teams()
 
         if len(teams) > 1:
             self.pt_reb = []
             for team in teams:
                 self.pt_reb.append(
                     pd.concat(
-                        nba.PlayerDashPtReb(
+                        get_endpoint(
+                            nba.PlayerDashPtReb,
                             player_id=self.id,
                             team_id=team,
                             season=self.season,
                             season_type_all_star=self.season_type,
                             per_mode_simple=self.permode,
+                            kind="season",
+                            retry=self.retry,
                         ).get_data_frames()
                     )
                 )
@@ -355,12 +410,15 @@ class Player:
 
         else:
             self.pt_reb = pd.concat(
-                nba.PlayerDashPtReb(
+                get_endpoint(
+                    nba.PlayerDashPtReb,
                     player_id=self.id,
                     team_id=teams[0],
                     season=self.season,
                     season_type_all_star=self.season_type,
                     per_mode_simple=self.permode,
+                    kind="season",
+                    retry=self.retry,
                 ).get_data_frames()
             )
 
@@ -390,12 +448,15 @@ class Player:
         """
         opp_tm_id = teams.find_team_by_abbreviation(opposing_team)["id"]
 
-        self.defense_against_team = nba.PlayerDashPtShotDefend(
+        self.defense_against_team = get_endpoint(
+            nba.PlayerDashPtShotDefend,
             player_id=self.id,
             team_id=opp_tm_id,
             season=self.season,
             season_type_all_star=self.season_type,
             per_mode_simple=self.permode,
+            kind="season",
+            retry=self.retry,
         ).get_data_frames()[0]
         return self.defense_against_team
 
@@ -406,27 +467,22 @@ class Player:
         Returns:
             pd.DataFrame: The shots data for the player.
         """
-        if not hasattr(self, "season_totals"):
-            logger.info("Getting Teams")
-            teams = self.get_season_career_totals()[0]
-        else:
-            teams = self.season_totals.copy()
-
-        teams = teams[(teams["SEASON_ID"] == self.season) & (teams["TEAM_ID"] != 0)][
-            "TEAM_ID"
-        ].tolist()
+        teams = self._get_season_teams()
 
         if len(teams) > 1:
             self.pt_shots = []
             for team in teams:
                 self.pt_shots.append(
                     pd.concat(
-                        nba.PlayerDashPtShots(
+                        get_endpoint(
+                            nba.PlayerDashPtShots,
                             player_id=self.id,
                             team_id=team,
                             season=self.season,
                             season_type_all_star=self.season_type,
                             per_mode_simple=self.permode,
+                            kind="season",
+                            retry=self.retry,
                         ).get_data_frames()
                     )
                 )
@@ -435,12 +491,15 @@ class Player:
 
         else:
             self.pt_shots = pd.concat(
-                nba.PlayerDashPtShots(
+                get_endpoint(
+                    nba.PlayerDashPtShots,
                     player_id=self.id,
                     team_id=teams[0],
                     season=self.season,
                     season_type_all_star=self.season_type,
                     per_mode_simple=self.permode,
+                    kind="season",
+                    retry=self.retry,
                 ).get_data_frames()
             )
 
@@ -465,36 +524,34 @@ class Player:
         Returns:
             pd.DataFrame: The shot chart data for the player.
         """
-        if not hasattr(self, "season_totals"):
-            logger.info("Getting Teams")
-            teams = self.get_season_career_totals()[0]
-        else:
-            teams = self.season_totals.copy()
-
-        teams = teams[(teams["SEASON_ID"] == self.season) & (teams["TEAM_ID"] != 0)][
-            "TEAM_ID"
-        ].tolist()
+        teams = self._get_season_teams()
 
         if len(teams) > 1:
             self.shot_chart = []
             for team in teams:
                 self.shot_chart.append(
-                    nba.ShotChartDetail(
+                    get_endpoint(
+                        nba.ShotChartDetail,
                         player_id=self.id,
                         team_id=team,
                         season_nullable=self.season,
                         season_type_all_star=self.season_type,
+                        kind="season",
+                        retry=self.retry,
                     ).get_data_frames()[0]
                 )
 
             self.shot_chart = pd.concat(self.shot_chart)
 
         else:
-            self.shot_chart = nba.ShotChartDetail(
+            self.shot_chart = get_endpoint(
+                nba.ShotChartDetail,
                 player_id=self.id,
                 team_id=teams[0],
                 season_nullable=self.season,
                 season_type_all_star=self.season_type,
+                kind="season",
+                retry=self.retry,
             ).get_data_frames()[0]
 
         return self.shot_chart
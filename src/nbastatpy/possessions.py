@@ -0,0 +1,107 @@
+import numpy as np
+import pandas as pd
+
+
+class PossessionConfig:
+    """Rules for splitting PlayByPlayV3 actions into possessions"""
+
+    # Actions whose team has the ball.  A defensive rebound hands the ball over, an
+    # offensive one keeps it, so rebounds count for the rebounding team.
+    OFFENSE_ACTIONS = ["Made Shot", "Missed Shot", "Free Throw", "Turnover", "Rebound"]
+    # Free throws shot by whichever team, without changing who has the ball
+    NEUTRAL_FREE_THROWS = ["Technical"]
+
+
+def _new_segments(games: np.ndarray, periods: np.ndarray) -> np.ndarray:
+    # True on the first action of every game and every period
+    starts = np.ones(len(games), dtype=bool)
+    starts[1:] = (games[1:] != games[:-1]) | (periods[1:] != periods[:-1])
+    return starts
+
+
+def get_points(playbyplay: pd.DataFrame) -> np.ndarray:
+    """Points scored on each action, by whichever team scored them"""
+    action = playbyplay["actionType"]
+    shot_value = pd.to_numeric(playbyplay["shotValue"], errors="coerce").fillna(0)
+    made_shot = action.eq("Made Shot").to_numpy()
+    made_free_throw = (
+        action.eq("Free Throw")
+        & ~playbyplay["description"].astype(str).str.startswith("MISS")
+    ).to_numpy()
+    return np.where(made_shot, shot_value.to_numpy(), 0) + made_free_throw
+
+
+def tag_possessions(playbyplay: pd.DataFrame) -> pd.DataFrame:
+    """Labels every action with the possession it belongs to
+
+    Works on one game or many (e.g. ``Game.many(game_ids, kinds=["playbyplay"])``), with
+    the actions of each game in the order stats.nba.com returns them.
+
+    Args:
+        playbyplay (pd.DataFrame): PlayByPlayV3 actions
+
+    Returns:
+        pd.DataFrame: a copy with ``possessionId`` (counted from 1 in each game), ``offenseTeamId`` and the ``points`` the offense scored on each action
+    """
+    df = playbyplay.reset_index(drop=True)
+    games = df["gameId"].to_numpy()
+    periods = df["period"].to_numpy()
+    teams = pd.to_numeric(df["teamId"], errors="coerce").fillna(0).to_numpy(np.int64)
+
+    action = df["actionType"]
+    has_ball = action.isin(PossessionConfig.OFFENSE_ACTIONS) & (teams != 0)
+    neutral = action.eq("Free Throw") & df["subType"].astype(str).str.contains(
+        "|".join(PossessionConfig.NEUTRAL_FREE_THROWS)
+    )
+    has_ball = (has_ball & ~neutral).to_numpy()
+
+    # Fouls, timeouts, substitutions and the like belong to whoever has the ball;
+    # the actions before the first shot of a period belong to the first team with it
+    segments = np.cumsum(_new_segments(games, periods))
+    offense = pd.Series(np.where(has_ball, teams, np.nan))
+    offense = offense.groupby(segments).ffill().groupby(segments).bfill()
+    offense = offense.fillna(0).to_numpy(np.int64)
+
+    changes = _new_segments(games, periods)
+    changes[1:] |= offense[1:] != offense[:-1]
+    possessions = np.cumsum(changes)
+    game_starts = np.ones(len(games), dtype=bool)
+    game_starts[1:] = games[1:] != games[:-1]
+    first_possession = np.maximum.accumulate(np.where(game_starts, possessions, 0))
+
+    points = get_points(df)
+    df["possessionId"] = possessions - first_possession + 1
+    df["offenseTeamId"] = pd.Series(offense, dtype="Int64").mask(offense == 0)
+    df["points"] = np.where(teams == offense, points, 0).astype(np.int16)
+    return df
+
+
+def get_possessions(playbyplay: pd.DataFrame) -> pd.DataFrame:
+    """Splits play-by-play into possessions
+
+    Args:
+        playbyplay (pd.DataFrame): PlayByPlayV3 actions of one game or many
+
+    Returns:
+        pd.DataFrame: one row per possession with its period, offensive team, start and end clock, points and number of actions
+    """
+    df = tag_possessions(playbyplay)
+    possessions = (
+        df.groupby(["gameId", "possessionId"], sort=False)
+        .agg(
+            period=("period", "first"),
+            offenseTeamId=("offenseTeamId", "first"),
+            firstClock=("clock", "first"),
+            endClock=("clock", "last"),
+            points=("points", "sum"),
+            actions=("actionNumber", "size"),
+        )
+        .reset_index()
+    )
+
+    # A possession starts when the one before it in the period ends
+    previous_end = possessions.groupby(["gameId", "period"], sort=False)[
+        "endClock"
+    ].shift()
+    possessions.insert(4, "startClock", previous_end.fillna(possessions["firstClock"]))
+    return possessions.drop(columns="firstClock")
@@ -0,0 +1,90 @@
+import asyncio
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: float = 1):
+        """
+        Thread-safe token bucket.  Tokens refill at ``rate`` per second up to ``burst``.
+
+        Args:
+            rate (float): requests allowed per second
+            burst (float, optional): requests allowed back to back after an idle period. Defaults to 1.
+        """
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be positive and burst at least 1")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens: float) -> float:
+        # Take the tokens now, letting the balance go negative, and return how long
+        # the caller has to wait for them.  Waiting outside the lock keeps callers in
+        # the order they arrived and spends exactly the budget.
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= tokens
+            return max(0.0, -self._tokens / self.rate)
+
+    def acquire(self, tokens: float = 1) -> float:
+        """Blocks until the tokens are available
+
+        Returns:
+            float: seconds waited
+        """
+        wait = self._reserve(tokens)
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, tokens: float = 1) -> float:
+        """Awaits until the tokens are available
+
+        Returns:
+            float: seconds waited
+        """
+        wait = self._reserve(tokens)
+        if wait:
+            await asyncio.sleep(wait)
+        return wait
+
+
+class RateLimitConfig:
+    """Default budget for requests to stats.nba.com"""
+
+    RATE = 1.0
+    BURST = 5
+
+
+_limiter: Optional[TokenBucket] = TokenBucket(
+    RateLimitConfig.RATE, RateLimitConfig.BURST
+)
+
+
+def configure_rate_limit(rate: Optional[float], burst: float = None) -> None:
+    """Sets the request budget shared by every class, thread and event loop
+
+    Args:
+        rate (Optional[float]): requests per second, None to turn the limit off
+        burst (float, optional): requests allowed back to back. Defaults to RateLimitConfig.BURST.
+    """
+    global _limiter
+    if rate is None:
+        _limiter = None
+        return
+    RateLimitConfig.RATE = rate
+    if burst is not None:
+        RateLimitConfig.BURST = burst
+    _limiter = TokenBucket(RateLimitConfig.RATE, RateLimitConfig.BURST)
+
+
+def get_rate_limiter() -> Optional[TokenBucket]:
+    return _limiter
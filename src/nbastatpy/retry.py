@@ -0,0 +1,249 @@
+import asyncio
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Dict, Optional, Tuple, Type
+from urllib.parse import urlsplit
+
+import requests
+from loguru import logger
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of sending a request while a host's circuit breaker is open"""
+
+
+class RetryPolicy:
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff: float = 1.0,
+        max_backoff: float = 30.0,
+        jitter: bool = True,
+        retry_statuses: Tuple[int, ...] = (429, 500, 502, 503, 504),
+        respect_retry_after: bool = True,
+    ):
+        """
+        How failed requests are retried.
+
+        Args:
+            max_attempts (int, optional): attempts per request, including the first. Defaults to 3.
+            backoff (float, optional): seconds before the first retry, doubled after each one. Defaults to 1.0.
+            max_backoff (float, optional): longest wait between attempts. Defaults to 30.0.
+            jitter (bool, optional): wait a random time up to the backoff ("full jitter"). Defaults to True.
+            retry_statuses (Tuple[int, ...], optional): HTTP statuses worth retrying. Defaults to (429, 500, 502, 503, 504).
+            respect_retry_after (bool, optional): wait at least as long as the server's Retry-After header. Defaults to True.
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = retry_statuses
+        self.respect_retry_after = respect_retry_after
+
+    def get_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Gets the seconds to wait after a failed attempt (counting from 0)"""
+        delay = min(self.max_backoff, self.backoff * 2**attempt)
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        if self.respect_retry_after and retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 60.0):
+        """
+        Stops sending requests to a host after repeated failures, then lets one through
+        after ``reset_timeout`` to see if it has recovered.
+
+        Args:
+            failure_threshold (int, optional): consecutive failures that open the circuit. Defaults to 5.
+            reset_timeout (float, optional): seconds to fail fast before trying again. Defaults to 60.0.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    def before_request(self, host: str = "") -> None:
+        with self._lock:
+            if self.state == "open":
+                raise CircuitOpenError(
+                    f"{host or 'Upstream'} failed {self.failures} times in a row, "
+                    f"not sending requests for {self.reset_timeout:.0f}s"
+                )
+            if self.state == "half-open":
+                # Let this request through as the probe and fail fast for the rest
+                self.opened_at = time.monotonic()
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+
+class RetryConfig:
+    """Defaults for retries and circuit breakers"""
+
+    POLICY = RetryPolicy()
+    FAILURE_THRESHOLD = 5
+    RESET_TIMEOUT = 60.0
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def configure_retry(
+    policy: RetryPolicy = None,
+    failure_threshold: int = None,
+    reset_timeout: float = None,
+) -> None:
+    """Sets the default retry policy and circuit breaker settings.  Existing breakers are reset.
+
+    Args:
+        policy (RetryPolicy, optional): policy used when a call doesn't pass its own. Defaults to None.
+        failure_threshold (int, optional): consecutive failures that open a host's circuit. Defaults to None.
+        reset_timeout (float, optional): seconds an open circuit fails fast. Defaults to None.
+    """
+    if policy is not None:
+        RetryConfig.POLICY = policy
+    if failure_threshold is not None:
+        RetryConfig.FAILURE_THRESHOLD = failure_threshold
+    if reset_timeout is not None:
+        RetryConfig.RESET_TIMEOUT = reset_timeout
+    with _breakers_lock:
+        _breakers.clear()
+
+
+def get_circuit_breaker(url: str) -> CircuitBreaker:
+    """Gets the circuit breaker for a URL's host"""
+    host = urlsplit(url).netloc
+    with _breakers_lock:
+        if host not in _breakers:
+            _breakers[host] = CircuitBreaker(
+                RetryConfig.FAILURE_THRESHOLD, RetryConfig.RESET_TIMEOUT
+            )
+        return _breakers[host]
+
+
+def _get_retry_after(headers) -> Optional[float]:
+    value = headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def send(
+    url: str,
+    request: Callable[[], requests.Response],
+    policy: RetryPolicy = None,
+    errors: Tuple[Type[Exception], ...] = (requests.ConnectionError, requests.Timeout),
+) -> requests.Response:
+    """Sends a request, retrying failures and tripping the host's circuit breaker
+
+    Args:
+        url (str): address being requested, used to pick the circuit breaker
+        request (Callable[[], requests.Response]): sends one attempt
+        policy (RetryPolicy, optional): overrides the default policy. Defaults to None.
+        errors (Tuple[Type[Exception], ...], optional): exceptions worth retrying. Defaults to connection errors and timeouts.
+
+    Returns:
+        requests.Response: the first successful (or non-retryable) response
+    """
+    policy = policy or RetryConfig.POLICY
+    breaker = get_circuit_breaker(url)
+    host = urlsplit(url).netloc
+
+    for attempt in range(policy.max_attempts):
+        breaker.before_request(host)
+        retry_after = None
+        try:
+            response = request()
+        except errors as error:
+            breaker.record_failure()
+            if attempt + 1 == policy.max_attempts:
+                raise
+            logger.warning(f"{host}: {error}, retrying")
+        else:
+            if response.status_code not in policy.retry_statuses:
+                breaker.record_success()
+                return response
+            # Throttling means the host is up, so only server errors count against it
+            if response.status_code >= 500:
+                breaker.record_failure()
+            if attempt + 1 == policy.max_attempts:
+                response.raise_for_status()
+            retry_after = _get_retry_after(response.headers)
+            logger.warning(f"{host}: HTTP {response.status_code}, retrying")
+        time.sleep(policy.get_delay(attempt, retry_after))
+
+
+async def send_async(
+    url: str,
+    request: Callable[[], Awaitable],
+    policy: RetryPolicy = None,
+    errors: Tuple[Type[Exception], ...] = (),
+):
+    """Async version of ``send`` for httpx responses
+
+    Args:
+        url (str): address being requested, used to pick the circuit breaker
+        request (Callable[[], Awaitable]): sends one attempt
+        policy (RetryPolicy, optional): overrides the default policy. Defaults to None.
+        errors (Tuple[Type[Exception], ...], optional): exceptions worth retrying. Defaults to ().
+
+    Returns:
+        httpx.Response: the first successful (or non-retryable) response
+    """
+    policy = policy or RetryConfig.POLICY
+    breaker = get_circuit_breaker(url)
+    host = urlsplit(url).netloc
+
+    for attempt in range(policy.max_attempts):
+        breaker.before_request(host)
+        retry_after = None
+        try:
+            response = await request()
+        except errors as error:
+            breaker.record_failure()
+            if attempt + 1 == policy.max_attempts:
+                raise
+            logger.warning(f"{host}: {error}, retrying")
+        else:
+            if response.status_code not in policy.retry_statuses:
+                breaker.record_success()
+                return response
+            if response.status_code >= 500:
+                breaker.record_failure()
+            if attempt + 1 == policy.max_attempts:
+                response.raise_for_status()
+            retry_after = _get_retry_after(response.headers)
+            logger.warning(f"{host}: HTTP {response.status_code}, retrying")
+        await asyncio.sleep(policy.get_delay(attempt, retry_after))
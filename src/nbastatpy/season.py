@@ -1,17 +1,20 @@
-from time import sleep
-
 import nba_api.stats.endpoints as nba
 import pandas as pd
-import requests
 from bs4 import BeautifulSoup
-from rich.progress import track
 
+from nbastatpy.cache import CachePolicy
+from nbastatpy.client import get_endpoint, get_url, map_concurrent
+from nbastatpy.retry import RetryPolicy
 from nbastatpy.utils import Formatter, PlayTypes
 
 
 class Season:
     def __init__(
-        self, season_year: str = None, playoffs=False, permode: str = "PERGAME"
+        self,
+        season_year: str = None,
+        playoffs=False,
+        permode: str = "PERGAME",
+        retry: RetryPolicy = None,
     ):
         """
         Initialize a Season object.
@@ -20,7 +23,9 @@ class Season:
             season_year (str, optional): The year of the season. Defaults to None.
             playoffs (bool, optional): Indicates if the season is for playoffs. Defaults to False.
             permode (str, optional): The per mode for the season. Defaults to "PERGAME".
+            retry (RetryPolicy, optional): retry policy for every request this object makes. Defaults to RetryConfig.POLICY.
         """
+        self.retry = retry
         self.permode = PlayTypes.PERMODE[
             permode.replace("_", "").replace("-", "").upper()
         ]
@@ -45,18 +50,21 @@ class Season:
         season_string = year + "-" + str(int(year) + 1)
 
         url = f"https://hoopshype.com/salaries/players/{season_string}/"
-        result = requests.get(url)
-        soup = BeautifulSoup(result.content, features="html.parser")
+        result = get_url(url, kind="salary", retry=self.retry)
+        soup = BeautifulSoup(result, features="html.parser")
         tables = soup.find_all("table")[0]
-        
+
         # # Get the table rows
-        rows = [[cell.text.strip() for cell in row.find_all('td')] for row in tables.find_all('tr')]
+        rows = [
+            [cell.text.strip() for cell in row.find_all("td")]
+            for row in tables.find_all("tr")
+        ]
 
         self.salary_df = pd.DataFrame(rows[1:], columns=rows[0])
-        if '' in self.salary_df.columns:
+        if "" in self.salary_df.columns:
             self.salary_df = self.salary_df.drop(columns=[""])
-            
-        self.salary_df['Season'] = self.salary_df.columns[1].replace("/", "_")
+
+        self.salary_df["Season"] = self.salary_df.columns[1].replace("/", "_")
         self.salary_df.columns = ["Player", "Salary", "Adj_Salary", "Season"]
 
         return self.salary_df
@@ -68,10 +76,13 @@ class Season:
         Returns:
             pandas.DataFrame: The lineups data for the specified season, season type, and per mode.
         """
-        self.lineups = nba.LeagueDashLineups(
+        self.lineups = get_endpoint(
+            nba.LeagueDashLineups,
             season=self.season,
             season_type_all_star=self.season_type,
             per_mode_detailed=self.permode,
+            kind="season",
+            retry=self.retry,
         ).get_data_frames()[0]
         return self.lineups
 
@@ -82,11 +93,14 @@ class Season:
         Returns:
             pandas.DataFrame: The lineup details for the specified season.
         """
-        self.lineup_details = nba.LeagueLineupViz(
+        self.lineup_details = get_endpoint(
+            nba.LeagueLineupViz,
             season=self.season,
             season_type_all_star=self.season_type,
             minutes_min=1,
             per_mode_detailed=self.permode,
+            kind="season",
+            retry=self.retry,
         ).get_data_frames()[0]
         return self.lineup_details
 
@@ -97,10 +111,13 @@ class Season:
         Returns:
             pandas.DataFrame: The opponent shooting statistics for the season.
         """
-        self.opponent_shooting = nba.LeagueDashOppPtShot(
+        self.opponent_shooting = get_endpoint(
+            nba.LeagueDashOppPtShot,
             season=self.season,
             season_type_all_star=self.season_type,
             per_mode_simple=self.permode,
+            kind="season",
+            retry=self.retry,
         ).get_data_frames()[0]
         return self.opponent_shooting
 
@@ -111,10 +128,13 @@ class Season:
         Returns:
             pandas.DataFrame: The player clutch data for the specified season.
         """
-        self.player_clutch = nba.LeagueDashPlayerClutch(
+        self.player_clutch = get_endpoint(
+            nba.LeagueDashPlayerClutch,
             season=self.season,
             season_type_all_star=self.season_type,
             per_mode_detailed=self.permode,
+            kind="season",
+            retry=self.retry,
         ).get_data_frames()[0]
         return self.player_clutch
 
@@ -125,10 +145,13 @@ class Season:
         Returns:
             pandas.DataFrame: The player shots data.
         """
-        self.player_shots = nba.LeagueDashPlayerPtShot(
+        self.player_shots = get_endpoint(
+            nba.LeagueDashPlayerPtShot,
             season=self.season,
             season_type_all_star=self.season_type,
             per_mode_simple=self.permode,
+            kind="season",
+            retry=self.retry,
         ).get_data_frames()[0]
         return self.player_shots
 
@@ -139,10 +162,13 @@ class Season:
         Returns:
             pandas.DataFrame: A DataFrame containing the shot locations data for the players.
         """
-        self.player_shot_locations = nba.LeagueDashPlayerShotLocations(
+        self.player_shot_locations = get_endpoint(
+            nba.LeagueDashPlayerShotLocations,
             season=self.season,
             season_type_all_star=self.season_type,
             per_mode_detailed=self.permode,
+            kind="season",
+            retry=self.retry,
         ).get_data_frames()[0]
         return self.player_shot_locations
 
@@ -153,10 +179,13 @@ class Season:
         Returns:
             pandas.DataFrame: A DataFrame containing the player statistics.
         """
-        self.player_stats = nba.LeagueDashPlayerStats(
+        self.player_stats = get_endpoint(
+            nba.LeagueDashPlayerStats,
             season=self.season,
             season_type_all_star=self.season_type,
             per_mode_detailed=self.permode,
+            kind="season",
+            retry=self.retry,
         ).get_data_frames()[0]
         return self.player_stats
 
@@ -167,10 +196,13 @@ class Season:
         Returns:
             pandas.DataFrame: A DataFrame containing the clutch statistics for teams.
         """
-        self.team_clutch = nba.LeagueDashTeamClutch(
+        self.team_clutch = get_endpoint(
+            nba.LeagueDashTeamClutch,
             season=self.season,
             season_type_all_star=self.season_type,
             per_mode_detailed=self.permode,
+            kind="season",
+            retry=self.retry,
         ).get_data_frames()[0]
         return self.team_clutch
 
@@ -181,10 +213,13 @@ class Season:
         Returns:
             pandas.DataFrame: The team shots by point data.
         """
-        self.team_shots_bypoint = nba.LeagueDashTeamPtShot(
+        self.team_shots_bypoint = get_endpoint(
+            nba.LeagueDashTeamPtShot,
             season=self.season,
             season_type_all_star=self.season_type,
             per_mode_simple=self.permode,
+            kind="season",
+            retry=self.retry,
         ).get_data_frames()[0]
         return self.team_shots_bypoint
 
@@ -195,10 +230,13 @@ class Season:
         Returns:
             pandas.DataFrame: The shot locations data for teams.
         """
-        self.team_shot_locations = nba.LeagueDashTeamShotLocations(
+        self.team_shot_locations = get_endpoint(
+            nba.LeagueDashTeamShotLocations,
             season=self.season,
             season_type_all_star=self.season_type,
             per_mode_detailed=self.permode,
+            kind="season",
+            retry=self.retry,
         ).get_data_frames()[0]
         return self.team_shot_locations
 
@@ -209,39 +247,63 @@ class Season:
         Returns:
             pandas.DataFrame: A DataFrame containing the team statistics.
         """
-        self.team_stats = nba.LeagueDashTeamStats(
+        self.team_stats = get_endpoint(
+            nba.LeagueDashTeamStats,
             season=self.season,
             season_type_all_star=self.season_type,
             per_mode_detailed=self.permode,
+            kind="season",
+            retry=self.retry,
         ).get_data_frames()[0]
         return self.team_stats
 
-    def get_player_games(self) -> pd.DataFrame:
+    def get_player_games(self, date_from=None, date_to=None) -> pd.DataFrame:
         """
         Retrieves the player games data for the specified season, season type, and per mode.
 
+        Args:
+            date_from (optional): only games on or after this date. Defaults to None.
+            date_to (optional): only games on or before this date. Defaults to None.
+
         Returns:
             pd.DataFrame: A DataFrame containing the player games data.
         """
-        self.player_games = nba.PlayerGameLogs(
+        self.player_games = get_endpoint(
+            nba.PlayerGameLogs,
             season_nullable=self.season,
             season_type_nullable=self.season_type,
             per_mode_simple_nullable=self.permode,
+            date_from_nullable=Formatter.format_date(date_from),
+            date_to_nullable=Formatter.format_date(date_to),
+            kind="game_log",
+            retry=self.retry,
         ).get_data_frames()[0]
+        # Games only show up in the logs once they're over
+        CachePolicy.mark_final(self.player_games["GAME_ID"])
         return self.player_games
 
-    def get_team_games(self):
+    def get_team_games(self, date_from=None, date_to=None):
         """
         Retrieves the game log for a specific team in a given season.
 
+        Args:
+            date_from (optional): only games on or after this date. Defaults to None.
+            date_to (optional): only games on or before this date. Defaults to None.
+
         Returns:
             pandas.DataFrame: The game log data for the team.
         """
-        self.team_games = nba.LeagueGameLog(
+        self.team_games = get_endpoint(
+            nba.LeagueGameLog,
             season=self.season,
             season_type_all_star=self.season_type,
             player_or_team_abbreviation="T",
+            date_from_nullable=Formatter.format_date(date_from),
+            date_to_nullable=Formatter.format_date(date_to),
+            kind="game_log",
+            retry=self.retry,
         ).get_data_frames()[0]
+        CachePolicy.mark_final(self.team_games["GAME_ID"])
         return self.team_games
 
     def get_player_hustle(self):
@@ -251,9 +313,12 @@ class Season:
         Returns:
             pandas.DataFrame: A DataFrame containing the player hustle stats.
         """
-        self.player_hustle = nba.LeagueHustleStatsPlayer(
+        self.player_hustle = get_endpoint(
+            nba.LeagueHustleStatsPlayer,
             season=self.season,
             season_type_all_star=self.season_type,
+            kind="season",
+            retry=self.retry,
         ).get_data_frames()[0]
         return self.player_hustle
 
@@ -264,9 +329,12 @@ class Season:
         Returns:
             pandas.DataFrame: The team hustle stats for the specified season and season type.
         """
-        self.team_hustle = nba.LeagueHustleStatsTeam(
+        self.team_hustle = get_endpoint(
+            nba.LeagueHustleStatsTeam,
             season=self.season,
             season_type_all_star=self.season_type,
+            kind="season",
+            retry=self.retry,
         ).get_data_frames()[0]
         return self.team_hustle
 
@@ -277,10 +345,13 @@ class Season:
         Returns:
             pandas.DataFrame: The player matchups data for the current season.
         """
-        self.player_matchups = nba.LeagueSeasonMatchups(
+        self.player_matchups = get_endpoint(
+            nba.LeagueSeasonMatchups,
             season=self.season,
             season_type_playoffs=self.season_type,
             per_mode_simple=self.permode,
+            kind="season",
+            retry=self.retry,
         ).get_data_frames()[0]
         return self.player_matchups
 
@@ -291,9 +362,12 @@ class Season:
         Returns:
             pandas.DataFrame: A DataFrame containing the estimated metrics for players.
         """
-        self.player_estimated_metrics = nba.PlayerEstimatedMetrics(
+        self.player_estimated_metrics = get_endpoint(
+            nba.PlayerEstimatedMetrics,
             season=self.season,
             season_type=self.season_type,
+            kind="season",
+            retry=self.retry,
         ).get_data_frames()[0]
         return self.player_estimated_metrics
 
@@ -319,31 +393,34 @@ class Season:
             self.off_def = "defensive"
 
         if isinstance(self.play_type, str):
-            self.synergy = nba.SynergyPlayTypes(
+            self.synergy = get_endpoint(
+                nba.SynergyPlayTypes,
                 season=self.season,
                 per_mode_simple=self.permode,
                 play_type_nullable=self.play_type,
                 type_grouping_nullable=self.off_def,
                 player_or_team_abbreviation="P",
                 season_type_all_star=self.season_type,
+                kind="season",
+                retry=self.retry,
             ).get_data_frames()[0]
 
         else:
-            df_list = []
-            for play in track(self.play_type):
 
-                temp_df = nba.SynergyPlayTypes(
+            def get_play(play: str) -> pd.DataFrame:
+                return get_endpoint(
+                    nba.SynergyPlayTypes,
                     season=self.season,
                     per_mode_simple=self.permode,
                     play_type_nullable=play,
                     type_grouping_nullable=self.off_def,
                     player_or_team_abbreviation="P",
                     season_type_all_star=self.season_type,
+                    kind="season",
+                    retry=self.retry,
                 ).get_data_frames()[0]
-                df_list.append(temp_df)
-                sleep(1)
 
-            self.synergy = pd.concat(df_list)
+            self.synergy = pd.concat(map_concurrent(get_play, self.play_type))
 
         return self.synergy
 
@@ -373,30 +450,34 @@ class Season:
             self.off_def = "defensive"
 
         if isinstance(self.play_type, str):
-            self.synergy = nba.SynergyPlayTypes(
+            self.synergy = get_endpoint(
+                nba.SynergyPlayTypes,
                 season=self.season,
                 per_mode_simple=self.permode,
                 play_type_nullable=self.play_type,
                 type_grouping_nullable=self.off_def,
                 player_or_team_abbreviation="T",
                 season_type_all_star=self.season_type,
+                kind="season",
+                retry=self.retry,
             ).get_data_frames()[0]
 
         else:
-            df_list = []
-            for play in track(self.play_type):
-                temp_df = nba.SynergyPlayTypes(
+
+            def get_play(play: str) -> pd.DataFrame:
+                return get_endpoint(
+                    nba.SynergyPlayTypes,
                     season=self.season,
                     per_mode_simple=self.permode,
                     play_type_nullable=play,
                     type_grouping_nullable=self.off_def,
                     player_or_team_abbreviation="T",
                     season_type_all_star=self.season_type,
+                    kind="season",
+                    retry=self.retry,
                 ).get_data_frames()[0]
-                df_list.append(temp_df)
-                sleep(1)
 
-            self.synergy = pd.concat(df_list)
+            self.synergy = pd.concat(map_concurrent(get_play, self.play_type))
 
         return self.synergy
 
@@ -418,29 +499,32 @@ class Season:
         )
 
         if isinstance(self.play_type, str):
-            self.tracking = nba.LeagueDashPtStats(
+            self.tracking = get_endpoint(
+                nba.LeagueDashPtStats,
                 season=self.season,
                 per_mode_simple=self.permode,
                 pt_measure_type=self.play_type,
                 player_or_team="Player",
                 season_type_all_star=self.season_type,
+                kind="season",
+                retry=self.retry,
             ).get_data_frames()[0]
 
         else:
-            df_list = []
-            for play in track(self.play_type):
 
-                temp_df = nba.LeagueDashPtStats(
+            def get_play(play: str) -> pd.DataFrame:
+                return get_endpoint(
+                    nba.LeagueDashPtStats,
                     season=self.season,
                     per_mode_simple=self.permode,
                     pt_measure_type=play,
                     player_or_team="Player",
                     season_type_all_star=self.season_type,
+                    kind="season",
+                    retry=self.retry,
                 ).get_data_frames()[0]
-                df_list.append(temp_df)
-                sleep(1)
 
-            self.tracking = pd.concat(df_list)
+            self.tracking = pd.concat(map_concurrent(get_play, self.play_type))
 
         return self.tracking
 
@@ -460,29 +544,32 @@ class Season:
         self.play_type = Formatter.check_playtype(track_type, PlayTypes.TRACKING_TYPES)
 
         if isinstance(self.play_type, str):
-            self.tracking = nba.LeagueDashPtStats(
+            self.tracking = get_endpoint(
+                nba.LeagueDashPtStats,
                 season=self.season,
                 per_mode_simple=self.permode,
                 pt_measure_type=self.play_type,
                 player_or_team="Team",
                 season_type_all_star=self.season_type,
+                kind="season",
+                retry=self.retry,
             ).get_data_frames()[0]
 
         else:
-            df_list = []
-            for play in track(self.play_type):
 
-                temp_df = nba.LeagueDashPtStats(
+            def get_play(play: str) -> pd.DataFrame:
+                return get_endpoint(
+                    nba.LeagueDashPtStats,
                     season=self.season,
                     per_mode_simple=self.permode,
                     pt_measure_type=play,
                     player_or_team="Team",
                     season_type_all_star=self.season_type,
+                    kind="season",
+                    retry=self.retry,
                 ).get_data_frames()[0]
-                df_list.append(temp_df)
-                sleep(1)
 
-            self.tracking = pd.concat(df_list)
+            self.tracking = pd.concat(map_concurrent(get_play, self.play_type))
 
         return self.tracking
 
@@ -505,27 +592,30 @@ class Season:
         )
 
         if isinstance(self.play_type, str):
-            self.defense = nba.LeagueDashPtDefend(
+            self.defense = get_endpoint(
+                nba.LeagueDashPtDefend,
                 season=self.season,
                 per_mode_simple=self.permode,
                 defense_category=self.play_type,
                 season_type_all_star=self.season_type,
+                kind="season",
+                retry=self.retry,
             ).get_data_frames()[0]
 
         else:
-            df_list = []
-            for play in track(self.play_type):
 
-                temp_df = nba.LeagueDashPtDefend(
+            def get_play(play: str) -> pd.DataFrame:
+                return get_endpoint(
+                    nba.LeagueDashPtDefend,
                     season=self.season,
                     per_mode_simple=self.permode,
                     defense_category=play,
                     season_type_all_star=self.season_type,
+                    kind="season",
+                    retry=self.retry,
                 ).get_data_frames()[0]
-                df_list.append(temp_df)
-                sleep(1)
 
-            self.defense = pd.concat(df_list)
+            self.defense = pd.concat(map_concurrent(get_play, self.play_type))
 
         return self.defense
 
@@ -547,27 +637,30 @@ class Season:
         )
 
         if isinstance(self.play_type, str):
-            self.defense = nba.LeagueDashPtTeamDefend(
+            self.defense = get_endpoint(
+                nba.LeagueDashPtTeamDefend,
                 season=self.season,
                 per_mode_simple=self.permode,
                 defense_category=self.play_type,
                 season_type_all_star=self.season_type,
+                kind="season",
+                retry=self.retry,
             ).get_data_frames()[0]
 
         else:
-            df_list = []
-            for play in track(self.play_type):
 
-                temp_df = nba.LeagueDashPtTeamDefend(
+            def get_play(play: str) -> pd.DataFrame:
+                return get_endpoint(
+                    nba.LeagueDashPtTeamDefend,
                     season=self.season,
                     per_mode_simple=self.permode,
                     defense_category=play,
                     season_type_all_star=self.season_type,
+                    kind="season",
+                    retry=self.retry,
                 ).get_data_frames()[0]
-                df_list.append(temp_df)
-                sleep(1)
 
-            self.defense = pd.concat(df_list)
+            self.defense = pd.concat(map_concurrent(get_play, self.play_type))
 
         return self.defense
 
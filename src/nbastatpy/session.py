@@ -0,0 +1,103 @@
+import threading
+from typing import Dict, Optional
+
+import requests
+from nba_api.stats.library.http import NBAStatsHTTP
+from requests.adapters import HTTPAdapter
+
+
+class SessionConfig:
+    """Settings for the HTTP session shared by every request"""
+
+    POOL_CONNECTIONS = 10
+    POOL_MAXSIZE = 32
+    TIMEOUT = 30
+    COMPRESSION = True
+
+
+_session: Optional[requests.Session] = None
+_lock = threading.Lock()
+
+
+def _accept_encoding() -> str:
+    encodings = ["gzip", "deflate"]
+    try:
+        import brotli  # noqa: F401
+
+        encodings.append("br")
+    except ImportError:
+        pass
+    return ", ".join(encodings)
+
+
+def configure_session(
+    pool_connections: int = None,
+    pool_maxsize: int = None,
+    timeout: float = None,
+    compression: bool = None,
+    headers: Dict[str, str] = None,
+) -> requests.Session:
+    """Builds the pooled session used by nbastatpy and nba_api, replacing the current one
+
+    Args:
+        pool_connections (int, optional): number of hosts to keep pools for. Defaults to SessionConfig.POOL_CONNECTIONS.
+        pool_maxsize (int, optional): connections kept alive per host. Defaults to SessionConfig.POOL_MAXSIZE.
+        timeout (float, optional): seconds to wait on the server. Defaults to SessionConfig.TIMEOUT.
+        compression (bool, optional): ask for gzip/deflate (and brotli if installed) responses. Defaults to SessionConfig.COMPRESSION.
+        headers (Dict[str, str], optional): extra headers sent with every request. Defaults to None.
+
+    Returns:
+        requests.Session: the new session
+    """
+    if pool_connections is not None:
+        SessionConfig.POOL_CONNECTIONS = pool_connections
+    if pool_maxsize is not None:
+        SessionConfig.POOL_MAXSIZE = pool_maxsize
+    if timeout is not None:
+        SessionConfig.TIMEOUT = timeout
+    if compression is not None:
+        SessionConfig.COMPRESSION = compression
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=SessionConfig.POOL_CONNECTIONS,
+        pool_maxsize=SessionConfig.POOL_MAXSIZE,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Connection"] = "keep-alive"
+    session.headers["Accept-Encoding"] = (
+        _accept_encoding() if SessionConfig.COMPRESSION else "identity"
+    )
+    if headers:
+        session.headers.update(headers)
+
+    set_session(session)
+    return session
+
+
+def set_session(session: requests.Session) -> None:
+    """Uses an existing session for every request, including the ones nba_api sends"""
+    global _session
+    old_session = _session
+    _session = session
+    NBAStatsHTTP.set_session(session)
+    if old_session is not None and old_session is not session:
+        old_session.close()
+
+
+def get_session() -> requests.Session:
+    if _session is None:
+        with _lock:
+            if _session is None:
+                configure_session()
+    return _session
+
+
+def get_headers(headers: Dict[str, str] = None) -> Dict[str, str]:
+    """Merges request headers with the session's compression setting"""
+    headers = dict(headers or {})
+    headers["Accept-Encoding"] = get_session().headers.get(
+        "Accept-Encoding", _accept_encoding()
+    )
+    return headers
@@ -0,0 +1,176 @@
+from typing import Dict, Iterable, Tuple
+
+import numpy as np
+import pandas as pd
+
+from nbastatpy.clock import get_elapsed, tenths_to_seconds
+from nbastatpy.possessions import get_points, tag_possessions
+
+# Lineups are sorted tuples of player IDs, shared between every stint with the same five
+Lineup = Tuple[int, ...]
+# Spacing between games when one sorted key covers a whole season, longer than any game
+SPAN = 100000
+
+
+def _get_game_stints(
+    rotations: pd.DataFrame, lineups: Dict[Lineup, Lineup]
+) -> pd.DataFrame:
+    # Rotation times are in tenths of a second since tip-off
+    teams = pd.unique(rotations["TEAM_ID"])
+    team_ids = rotations["TEAM_ID"].to_numpy()
+    players = rotations["PERSON_ID"].to_numpy(np.int64)
+    ins = tenths_to_seconds(rotations["IN_TIME_REAL"])
+    outs = tenths_to_seconds(rotations["OUT_TIME_REAL"])
+
+    # Between two consecutive substitution times nobody checks in or out
+    bounds = np.unique(np.concatenate([ins, outs]))
+    middles = (bounds[:-1] + bounds[1:]) / 2
+    on_court = (ins[:, None] <= middles) & (middles < outs[:, None])
+
+    team_lineups = []
+    for team in teams:
+        rows = team_ids == team
+        team_players, team_on_court = players[rows], on_court[rows]
+        team_lineups.append(
+            [
+                lineups.setdefault(lineup, lineup)
+                for lineup in (
+                    tuple(sorted(team_players[column].tolist()))
+                    for column in team_on_court.T
+                )
+            ]
+        )
+
+    # Merge intervals where neither lineup changed
+    keys = list(zip(*team_lineups))
+    starts = [i for i in range(len(keys)) if i == 0 or keys[i] != keys[i - 1]]
+    ends = starts[1:] + [len(keys)]
+    return pd.DataFrame(
+        {
+            "START": bounds[starts],
+            "END": bounds[ends],
+            **{
+                f"LINEUP_{i}": [team_lineups[i][start] for start in starts]
+                for i in range(len(teams))
+            },
+            **{f"TEAM_ID_{i}": team for i, team in enumerate(teams)},
+        }
+    )
+
+
+def build_stints(rotations: pd.DataFrame) -> pd.DataFrame:
+    """Builds the stints of one game or many with both teams side by side
+
+    Args:
+        rotations (pd.DataFrame): ``Game.get_rotations`` of one game or many
+
+    Returns:
+        pd.DataFrame: one row per stint, in game and then time order, with ``LINEUP_0``/``TEAM_ID_0`` and ``LINEUP_1``/``TEAM_ID_1``
+    """
+    lineups: Dict[Lineup, Lineup] = {}
+    games = []
+    for game_id, game_rotations in rotations.groupby("GAME_ID", sort=False):
+        game = _get_game_stints(game_rotations, lineups)
+        game.insert(0, "GAME_ID", game_id)
+        games.append(game)
+    stints = pd.concat(games, ignore_index=True)
+    stints.insert(1, "STINT", stints.groupby("GAME_ID", sort=False).cumcount() + 1)
+    return stints
+
+
+def find_stints(
+    stints: pd.DataFrame, game_ids: Iterable[str], seconds: Iterable[float]
+) -> np.ndarray:
+    """Finds the stint each moment of a game falls in with one binary search per moment
+
+    A moment at a substitution time goes to the lineup coming in, since substitutions
+    happen before the free throws or inbound that follow them.
+
+    Args:
+        stints (pd.DataFrame): ``build_stints`` output
+        game_ids (Iterable[str]): game of each moment
+        seconds (Iterable[float]): seconds since tip-off of each moment
+
+    Returns:
+        np.ndarray: row of ``stints`` for each moment, -1 for games without stints or times after the last one
+    """
+    # Stints are in game order and then in time order, so one sorted key covers every game
+    games = pd.unique(stints["GAME_ID"])
+    stint_games = pd.Categorical(stints["GAME_ID"], categories=games).codes.astype(
+        np.int64
+    )
+    moment_games = pd.Index(games).get_indexer(np.asarray(game_ids)).astype(np.int64)
+    seconds = np.asarray(seconds, dtype=float)
+    keys = stint_games * SPAN + stints["START"].to_numpy()
+
+    stint = np.searchsorted(keys, moment_games * SPAN + seconds, side="right") - 1
+    first_stint = np.searchsorted(stint_games, np.arange(len(games)))
+    known = moment_games >= 0
+    stint = np.where(known, np.maximum(stint, first_stint[moment_games]), -1)
+    known &= seconds <= stints["END"].to_numpy()[stint]
+    return np.where(known, stint, -1)
+
+
+def get_stints(
+    rotations: pd.DataFrame, playbyplay: pd.DataFrame = None
+) -> pd.DataFrame:
+    """Reconstructs the stints of a game, or a season of games: the stretches where
+    neither team's lineup changes
+
+    Args:
+        rotations (pd.DataFrame): ``Game.get_rotations`` of one game or many, e.g. ``Game.many(game_ids, kinds=["rotations"])``
+        playbyplay (pd.DataFrame, optional): PlayByPlayV3 actions of the same games, for possessions and points. Defaults to None.
+
+    Returns:
+        pd.DataFrame: two rows per stint, one from each team's side, with the lineups as sorted tuples of player IDs, start and end in seconds since tip-off and, given play-by-play, possessions and points for and against
+    """
+    stints = build_stints(rotations)
+
+    if playbyplay is not None:
+        stints = _add_playbyplay(stints, playbyplay)
+
+    # One row per team, so lineups can be grouped on directly
+    sides = []
+    for team, opponent in ((0, 1), (1, 0)):
+        side = stints[["GAME_ID", "STINT", "START", "END"]].copy()
+        side["TEAM_ID"] = stints[f"TEAM_ID_{team}"]
+        side["LINEUP"] = stints[f"LINEUP_{team}"]
+        side["OPP_TEAM_ID"] = stints[f"TEAM_ID_{opponent}"]
+        side["OPP_LINEUP"] = stints[f"LINEUP_{opponent}"]
+        if playbyplay is not None:
+            side["POSS"] = stints[f"POSS_{team}"]
+            side["OPP_POSS"] = stints[f"POSS_{opponent}"]
+            side["PTS"] = stints[f"PTS_{team}"]
+            side["OPP_PTS"] = stints[f"PTS_{opponent}"]
+        sides.append(side)
+
+    stints = pd.concat(sides).sort_index(kind="stable").reset_index(drop=True)
+    stints.insert(4, "SECONDS", stints["END"] - stints["START"])
+    return stints
+
+
+def _add_playbyplay(stints: pd.DataFrame, playbyplay: pd.DataFrame) -> pd.DataFrame:
+    actions = tag_possessions(playbyplay)
+    teams = (
+        pd.to_numeric(actions["teamId"], errors="coerce").fillna(0).to_numpy(np.int64)
+    )
+    points = get_points(actions)
+    first_action = ~actions.duplicated(["gameId", "possessionId"]).to_numpy()
+    offense = actions["offenseTeamId"].fillna(0).to_numpy(np.int64)
+
+    stint = find_stints(
+        stints, actions["gameId"], get_elapsed(actions["period"], actions["clock"])
+    )
+    known = stint >= 0
+
+    stints = stints.copy()
+    n = len(stints)
+    team_ids = [stints[f"TEAM_ID_{i}"].to_numpy(np.int64) for i in (0, 1)]
+    for i in (0, 1):
+        scored = known & (teams == team_ids[i][stint])
+        stints[f"PTS_{i}"] = np.bincount(
+            stint[scored], weights=points[scored], minlength=n
+        ).astype(np.int64)
+        started = known & first_action & (offense == team_ids[i][stint])
+        stints[f"POSS_{i}"] = np.bincount(stint[started], minlength=n)
+    return stints
@@ -2,21 +2,23 @@ from typing import List
 
 import nba_api.stats.endpoints as nba
 import pandas as pd
-import requests
 from bs4 import BeautifulSoup
 from nba_api.stats.static import teams
 
+from nbastatpy.client import get_endpoint, get_url
+from nbastatpy.retry import RetryPolicy
 from nbastatpy.utils import Formatter, PlayTypes
 
 
 class Team:
     def __init__(
-            self,
-            team_abbreviation: str,
-            season_year: str = None,
-            playoffs=False,
-            permode: str = "PerGame",
-        ):
+        self,
+        team_abbreviation: str,
+        season_year: str = None,
+        playoffs=False,
+        permode: str = "PerGame",
+        retry: RetryPolicy = None,
+    ):
         """
         Initializes a Team object.
 
@@ -25,6 +27,7 @@ class Team:
         - season_year (str, optional): The season year. If not provided, the current season year will be used.
         - playoffs (bool, optional): Specifies whether the team's statistics are for playoffs. Default is False.
         - permode (str, optional): The mode for the team's statistics. Default is "PerGame".
+        - retry (RetryPolicy, optional): The retry policy for every request the team makes. Default is RetryConfig.POLICY.
 
         Attributes:
         - permode (str): The formatted permode for the team's statistics.
@@ -33,6 +36,7 @@ class Team:
         - season (str): The formatted season.
         - season_type (str): The type of season (Regular Season or Playoffs).
         """
+        self.retry = retry
         self.permode = PlayTypes.PERMODE[
             permode.replace("_", "").replace("-", "").upper()
         ]
@@ -59,8 +63,8 @@ class Team:
             PIL.Image.Image: The logo image of the NBA team.
         """
         pic_url = f"https://cdn.nba.com/logos/nba/{self.id}/primary/L/logo.svg"
-        pic = requests.get(pic_url)
-        self.logo = pic.content
+        pic = get_url(pic_url, retry=self.retry)
+        self.logo = pic
         return self.logo
 
     def get_roster(self) -> List[pd.DataFrame]:
@@ -70,9 +74,12 @@ class Team:
         Returns:
             List[pd.DataFrame]: A list of pandas DataFrames containing the roster data.
         """
-        self.roster = nba.CommonTeamRoster(
+        self.roster = get_endpoint(
+            nba.CommonTeamRoster,
             self.id,
             season=self.season,
+            kind="team",
+            retry=self.retry,
         ).get_data_frames()
         return self.roster
 
@@ -88,16 +95,19 @@ class Team:
         season_string = year + "-" + str(int(year) + 1)
         self.salary_url = f"https://hoopshype.com/salaries/{tm_name}/{season_string}/"
 
-        result = requests.get(self.salary_url)
-        soup = BeautifulSoup(result.content, features="html.parser")
+        result = get_url(self.salary_url, kind="salary", retry=self.retry)
+        soup = BeautifulSoup(result, features="html.parser")
         tables = soup.find_all("table")
-        
-        rows = [[cell.text.strip() for cell in row.find_all('td')] for row in tables[0].find_all('tr')]
-        
+
+        rows = [
+            [cell.text.strip() for cell in row.find_all("td")]
+            for row in tables[0].find_all("tr")
+        ]
+
         if not rows[0]:
             rows.pop(0)
             if not rows:
-                raise(ValueError(f"Season data unavailable for: {season_string}"))
+                raise (ValueError(f"Season data unavailable for: {season_string}"))
         self.salary_df = pd.DataFrame(rows[1:], columns=rows[0])
         self.salary_df["Season"] = self.salary_df.columns[1].replace("/", "_")
         self.salary_df.columns = ["Player", "Salary", "Adjusted Salary", "Season"]
@@ -111,8 +121,12 @@ class Team:
         Returns:
             pd.DataFrame: The year-by-year statistics for the team.
         """
-        self.year_by_year = nba.TeamYearByYearStats(
-            team_id=self.id, per_mode_simple=self.permode
+        self.year_by_year = get_endpoint(
+            nba.TeamYearByYearStats,
+            team_id=self.id,
+            per_mode_simple=self.permode,
+            kind="team",
+            retry=self.retry,
         ).get_data_frames()[0]
         return self.year_by_year
 
@@ -131,11 +145,14 @@ class Team:
             "TEAM_DAYS_REST_RANGE",
         ]
         self.general_splits = pd.concat(
-            nba.TeamDashboardByGeneralSplits(
+            get_endpoint(
+                nba.TeamDashboardByGeneralSplits,
                 team_id=self.id,
                 season=self.season,
                 season_type_all_star=self.season_type,
                 per_mode_detailed=self.permode,
+                kind="season",
+                retry=self.retry,
             ).get_data_frames()
         ).drop(columns=drop_cols)
         return self.general_splits
@@ -148,11 +165,14 @@ class Team:
             pd.DataFrame: The shooting splits data for the team.
         """
         self.shooting_splits = pd.concat(
-            nba.TeamDashboardByShootingSplits(
+            get_endpoint(
+                nba.TeamDashboardByShootingSplits,
                 team_id=self.id,
                 season=self.season,
                 season_type_all_star=self.season_type,
                 per_mode_detailed=self.permode,
+                kind="season",
+                retry=self.retry,
             ).get_data_frames()
         )
         return self.shooting_splits
@@ -164,7 +184,9 @@ class Team:
         Returns:
             pd.DataFrame: The franchise leaders data for the team.
         """
-        self.leaders = nba.FranchiseLeaders(team_id=self.id).get_data_frames()[0]
+        self.leaders = get_endpoint(
+            nba.FranchiseLeaders, team_id=self.id, kind="team", retry=self.retry
+        ).get_data_frames()[0]
         return self.leaders
 
     def get_franchise_players(self) -> pd.DataFrame:
@@ -174,8 +196,11 @@ class Team:
         Returns:
             pd.DataFrame: A DataFrame containing the franchise players' data.
         """
-        self.franchise_players = nba.FranchisePlayers(
-            team_id=self.id
+        self.franchise_players = get_endpoint(
+            nba.FranchisePlayers,
+            team_id=self.id,
+            kind="team",
+            retry=self.retry,
         ).get_data_frames()[0]
         return self.franchise_players
 
@@ -186,11 +211,14 @@ class Team:
         Returns:
             pd.DataFrame: A DataFrame containing the season lineups data.
         """
-        self.season_lineups = nba.LeagueDashLineups(
+        self.season_lineups = get_endpoint(
+            nba.LeagueDashLineups,
             team_id_nullable=self.id,
             season=self.season,
             season_type_all_star=self.season_type,
             per_mode_detailed=self.permode,
+            kind="season",
+            retry=self.retry,
         ).get_data_frames()[0]
         self.season_lineups["season"] = self.season
         self.season_lineups["season_type"] = self.season_type
@@ -204,11 +232,14 @@ class Team:
         Returns:
             pd.DataFrame: DataFrame containing the opponent shooting statistics.
         """
-        self.opponent_shooting = nba.LeagueDashOppPtShot(
+        self.opponent_shooting = get_endpoint(
+            nba.LeagueDashOppPtShot,
             team_id_nullable=self.id,
             season=self.season,
             season_type_all_star=self.season_type,
             per_mode_simple=self.permode,
+            kind="season",
+            retry=self.retry,
         ).get_data_frames()[0]
         self.opponent_shooting["season"] = self.season
         self.opponent_shooting["season_type"] = self.season_type
@@ -222,11 +253,14 @@ class Team:
         Returns:
             pd.DataFrame: A DataFrame containing the clutch statistics for the players of the team.
         """
-        self.player_clutch = nba.LeagueDashPlayerClutch(
+        self.player_clutch = get_endpoint(
+            nba.LeagueDashPlayerClutch,
             team_id_nullable=self.id,
             season=self.season,
             season_type_all_star=self.season_type,
             per_mode_detailed=self.permode,
+            kind="season",
+            retry=self.retry,
         ).get_data_frames()[0]
         self.player_clutch["season"] = self.season
         self.player_clutch["season_type"] = self.season_type
@@ -240,11 +274,14 @@ class Team:
         Returns:
             pd.DataFrame: The player shots data for the team.
         """
-        self.player_shots = nba.LeagueDashPlayerPtShot(
+        self.player_shots = get_endpoint(
+            nba.LeagueDashPlayerPtShot,
             team_id_nullable=self.id,
             season=self.season,
             season_type_all_star=self.season_type,
             per_mode_simple=self.permode,
+            kind="season",
+            retry=self.retry,
         ).get_data_frames()[0]
         self.player_shots["season"] = self.season
         self.player_shots["season_type"] = self.season_type
@@ -258,11 +295,14 @@ class Team:
         Returns:
             pd.DataFrame: A DataFrame containing the shot locations data for the players.
         """
-        self.player_shot_locations = nba.LeagueDashPlayerShotLocations(
+        self.player_shot_locations = get_endpoint(
+            nba.LeagueDashPlayerShotLocations,
             team_id_nullable=self.id,
             season=self.season,
             season_type_all_star=self.season_type,
             per_mode_detailed=self.permode,
+            kind="season",
+            retry=self.retry,
         ).get_data_frames()[0]
         self.player_shot_locations["season"] = self.season
         self.player_shot_locations["season_type"] = self.season_type
@@ -276,11 +316,14 @@ class Team:
         Returns:
             pd.DataFrame: A DataFrame containing the player statistics.
         """
-        self.player_stats = nba.LeagueDashPlayerStats(
+        self.player_stats = get_endpoint(
+            nba.LeagueDashPlayerStats,
             team_id_nullable=self.id,
             season=self.season,
             season_type_all_star=self.season_type,
             per_mode_detailed=self.permode,
+            kind="season",
+            retry=self.retry,
         ).get_data_frames()[0]
         self.player_stats["season"] = self.season
         self.player_stats["season_type"] = self.season_type
@@ -294,11 +337,14 @@ class Team:
         Returns:
             pd.DataFrame: The player point defense data for the team.
         """
-        self.player_point_defend = nba.LeagueDashPtDefend(
+        self.player_point_defend = get_endpoint(
+            nba.LeagueDashPtDefend,
             team_id_nullable=self.id,
             season=self.season,
             season_type_all_star=self.season_type,
             per_mode_simple=self.permode,
+            kind="season",
+            retry=self.retry,
         ).get_data_frames()[0]
         self.player_point_defend["season"] = self.season
         self.player_point_defend["season_type"] = self.season_type
@@ -312,10 +358,13 @@ class Team:
         Returns:
             pd.DataFrame: A DataFrame containing the hustle stats for the players.
         """
-        self.player_hustle = nba.LeagueHustleStatsPlayer(
+        self.player_hustle = get_endpoint(
+            nba.LeagueHustleStatsPlayer,
             team_id_nullable=self.id,
             season=self.season,
             season_type_all_star=self.season_type,
+            kind="season",
+            retry=self.retry,
         ).get_data_frames()[0]
         self.player_hustle["season"] = self.season
         self.player_hustle["season_type"] = self.season_type
@@ -329,12 +378,15 @@ class Team:
         Returns:
             pd.DataFrame: The lineup details for the team.
         """
-        self.lineup_details = nba.LeagueLineupViz(
+        self.lineup_details = get_endpoint(
+            nba.LeagueLineupViz,
             team_id_nullable=self.id,
             season=self.season,
             season_type_all_star=self.season_type,
             minutes_min=1,
             per_mode_detailed=self.permode,
+            kind="season",
+            retry=self.retry,
         ).get_data_frames()[0]
         self.lineup_details["season"] = self.season
         self.lineup_details["season_type"] = self.season_type
@@ -348,11 +400,14 @@ class Team:
         Returns:
             pd.DataFrame: A DataFrame containing the player on-court details.
         """
-        self.player_on_details = nba.LeaguePlayerOnDetails(
+        self.player_on_details = get_endpoint(
+            nba.LeaguePlayerOnDetails,
             team_id=self.id,
             season=self.season,
             season_type_all_star=self.season_type,
             per_mode_detailed=self.permode,
+            kind="season",
+            retry=self.retry,
         ).get_data_frames()[0]
         self.player_on_details["season"] = self.season
         self.player_on_details["season_type"] = self.season_type
@@ -370,18 +425,24 @@ class Team:
             pd.DataFrame: DataFrame containing player matchups for the team.
         """
         if defense:
-            self.player_matchups = nba.LeagueSeasonMatchups(
+            self.player_matchups = get_endpoint(
+                nba.LeagueSeasonMatchups,
                 def_team_id_nullable=self.id,
                 season=self.season,
                 season_type_playoffs=self.season_type,
                 per_mode_simple=self.permode,
+                kind="season",
+                retry=self.retry,
             ).get_data_frames()[0]
         else:
-            self.player_matchups = nba.LeagueSeasonMatchups(
+            self.player_matchups = get_endpoint(
+                nba.LeagueSeasonMatchups,
                 off_team_id_nullable=self.id,
                 season=self.season,
                 season_type_playoffs=self.season_type,
                 per_mode_simple=self.permode,
+                kind="season",
+                retry=self.retry,
             ).get_data_frames()[0]
 
         self.player_matchups["season"] = self.season
@@ -397,11 +458,14 @@ class Team:
             pd.DataFrame: The player passes data for the team.
         """
         self.player_passes = pd.concat(
-            nba.TeamDashPtPass(
+            get_endpoint(
+                nba.TeamDashPtPass,
                 team_id=self.id,
                 season=self.season,
                 season_type_all_star=self.season_type,
                 per_mode_simple=self.permode,
+                kind="season",
+                retry=self.retry,
             ).get_data_frames()
         )
 
@@ -420,11 +484,14 @@ class Team:
             pd.DataFrame: A DataFrame containing the on-off court details for the players.
         """
         self.player_onoff = pd.concat(
-            nba.TeamPlayerOnOffDetails(
-                team_id=team.id,
+            get_endpoint(
+                nba.TeamPlayerOnOffDetails,
+                team_id=self.id,
                 season=self.season,
                 season_type_all_star=self.season_type,
                 per_mode_detailed=self.permode,
+                kind="season",
+                retry=self.retry,
             ).get_data_frames()[1:]
         )
         return self.player_onoff.reset_index(drop=True)
@@ -4,7 +4,6 @@ import pandas as pd
 
 
 class PlayTypes:
-
     PERMODE = {
         "PERGAME": "PerGame",
         "PER36": "Per36",
@@ -68,7 +67,6 @@ class PlayTypes:
 
 
 class Formatter:
-
     def get_current_season_year() -> str:
         current_datetime = datetime.now()
         current_season_year = current_datetime.year
@@ -82,6 +80,27 @@ class Formatter:
     def format_game_id(game_id) -> str:
         return str(game_id).zfill(10)
 
+    def format_date(date) -> str:
+        """Formats a date the way stats.nba.com takes it (MM/DD/YYYY), or "" for no date"""
+        if date is None or date == "":
+            return ""
+        return pd.Timestamp(date).strftime("%m/%d/%Y")
+
+    def get_game_season(game_id) -> tuple:
+        """Reads the season and season type out of a game ID, e.g. 0022300001 -> ("2023-24", "Regular Season")"""
+        game_id = Formatter.format_game_id(game_id)
+        year = int(game_id[3:5])
+        year += 1900 if year >= 46 else 2000
+        season_types = {
+            "1": "Pre Season",
+            "2": "Regular Season",
+            "3": "All Star",
+            "4": "Playoffs",
+            "5": "PlayIn",
+            "6": "IST",
+        }
+        return Formatter.format_season(year), season_types.get(game_id[2], "Unknown")
+
     def combine_strings(row) -> str:
         return next(value for value in row if pd.notna(value))
 
@@ -90,7 +109,7 @@ class Formatter:
         play = play.replace("_", "").replace("-", "").upper()
 
         if play == "ALL":
-            return list(set(playtypes.values()))
+            return list(dict.fromkeys(playtypes.values()))
 
         if play not in set(playtypes.keys()):
             raise ValueError(f"Playtype: {play} not found")
@@ -0,0 +1,301 @@
+import sqlite3
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Union
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from nbastatpy.game import GameBatch
+from nbastatpy.season import Season
+
+
+class Warehouse:
+    # Primary key of each table
+    TABLES = {
+        "player_games": ["PLAYER_ID", "GAME_ID"],
+        "team_games": ["TEAM_ID", "GAME_ID"],
+        "player_stats": ["PLAYER_ID", "SEASON", "SEASON_TYPE", "PER_MODE"],
+        "team_stats": ["TEAM_ID", "SEASON", "SEASON_TYPE", "PER_MODE"],
+        "boxscore_players": ["gameId", "personId"],
+        "boxscore_teams": ["gameId", "teamId"],
+        "sync_state": ["SEASON", "SEASON_TYPE"],
+    }
+
+    # Extra indexes for the usual dashboard lookups
+    INDEXES = {
+        "player_games": [
+            ["GAME_DATE"],
+            ["TEAM_ID", "GAME_DATE"],
+            ["SEASON", "SEASON_TYPE"],
+        ],
+        "team_games": [["GAME_DATE"], ["SEASON", "SEASON_TYPE"]],
+        "player_stats": [["TEAM_ID"]],
+        "boxscore_players": [["personId"], ["teamId"]],
+    }
+
+    def __init__(self, path: Union[str, Path] = ":memory:"):
+        """
+        Local SQLite copy of season data, so dashboards can run SQL instead of calling stats.nba.com.
+
+        Args:
+            path (Union[str, Path], optional): database file. Defaults to an in-memory database.
+        """
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = str(path)
+        self.connection = sqlite3.connect(self.path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        # Games whose boxscores couldn't be fetched by the last sync, with the error
+        self.failed: Dict[str, Exception] = {}
+
+    def __enter__(self) -> "Warehouse":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.connection.close()
+
+    @staticmethod
+    def _quote(name: str) -> str:
+        return '"' + name.replace('"', '""') + '"'
+
+    @staticmethod
+    def _sql_type(dtype) -> str:
+        if pd.api.types.is_bool_dtype(dtype) or pd.api.types.is_integer_dtype(dtype):
+            return "INTEGER"
+        if pd.api.types.is_float_dtype(dtype):
+            return "REAL"
+        return "TEXT"
+
+    def get_columns(self, table: str) -> List[str]:
+        rows = self.connection.execute(f"PRAGMA table_info({self._quote(table)})")
+        return [row[1] for row in rows]
+
+    def _prepare_table(self, table: str, df: pd.DataFrame, keys: List[str]) -> None:
+        quote = self._quote
+        columns = self.get_columns(table)
+        if not columns:
+            definitions = [
+                f"{quote(column)} {self._sql_type(dtype)}"
+                for column, dtype in df.dtypes.items()
+            ]
+            primary_key = ", ".join(quote(key) for key in keys)
+            self.connection.execute(
+                f"CREATE TABLE {quote(table)} "
+                f"({', '.join(definitions)}, PRIMARY KEY ({primary_key}))"
+            )
+            for index in self.INDEXES.get(table, []):
+                if set(index) <= set(df.columns):
+                    name = quote(f"{table}_{'_'.join(index)}")
+                    self.connection.execute(
+                        f"CREATE INDEX IF NOT EXISTS {name} ON {quote(table)} "
+                        f"({', '.join(quote(column) for column in index)})"
+                    )
+            return
+
+        # stats.nba.com adds columns now and then, older rows get NULL
+        for column, dtype in df.dtypes.items():
+            if column not in columns:
+                self.connection.execute(
+                    f"ALTER TABLE {quote(table)} ADD COLUMN "
+                    f"{quote(column)} {self._sql_type(dtype)}"
+                )
+
+    def upsert(self, table: str, df: pd.DataFrame, keys: List[str] = None) -> int:
+        """Inserts new rows and updates existing ones, leaving unchanged rows alone
+
+        Args:
+            table (str): table to write to, created from the frame if it doesn't exist
+            df (pd.DataFrame): rows to write
+            keys (List[str], optional): primary key columns. Defaults to Warehouse.TABLES[table].
+
+        Returns:
+            int: rows inserted or changed
+        """
+        keys = keys or self.TABLES[table]
+        df = df.drop_duplicates(subset=keys, keep="last")
+        if df.empty:
+            return 0
+
+        quote = self._quote
+        columns = list(df.columns)
+        values = [col for col in columns if col not in keys]
+        sql = (
+            f"INSERT INTO {quote(table)} ({', '.join(quote(col) for col in columns)}) "
+            f"VALUES ({', '.join('?' for _ in columns)}) "
+            f"ON CONFLICT ({', '.join(quote(key) for key in keys)}) "
+        )
+        if values:
+            sql += (
+                f"DO UPDATE SET {', '.join(f'{quote(col)} = excluded.{quote(col)}' for col in values)} "
+                f"WHERE {' OR '.join(f'{quote(col)} IS NOT excluded.{quote(col)}' for col in values)}"
+            )
+        else:
+            sql += "DO NOTHING"
+
+        # sqlite3 only binds plain Python values
+        rows = df.astype(object).where(df.notna(), None)
+        rows = [
+            tuple(
+                value.item() if isinstance(value, np.generic) else value
+                for value in row
+            )
+            for row in rows.itertuples(index=False, name=None)
+        ]
+
+        with self.connection:
+            self._prepare_table(table, df, keys)
+            before = self.connection.total_changes
+            self.connection.executemany(sql, rows)
+            changed = self.connection.total_changes - before
+        logger.debug(f"{table}: {changed} of {len(rows)} rows changed")
+        return changed
+
+    def query(self, sql: str, params=None) -> pd.DataFrame:
+        """Runs a SQL query against the warehouse
+
+        Args:
+            sql (str): query to run
+            params (optional): query parameters. Defaults to None.
+
+        Returns:
+            pd.DataFrame: the result
+        """
+        return pd.read_sql_query(sql, self.connection, params=params)
+
+    @staticmethod
+    def _tag(df: pd.DataFrame, season: Season, per_mode: bool = False) -> pd.DataFrame:
+        df = df.copy()
+        df["SEASON"] = season.season
+        df["SEASON_TYPE"] = season.season_type
+        if per_mode:
+            df["PER_MODE"] = season.permode
+        return df
+
+    def get_high_water_mark(self, season: Season) -> Optional[str]:
+        """Gets the last game date synced for a season, as YYYY-MM-DD
+
+        Args:
+            season (Season): season to look up
+
+        Returns:
+            Optional[str]: the date, or None if the season hasn't been synced
+        """
+        if not self.get_columns("sync_state"):
+            return None
+        row = self.connection.execute(
+            'SELECT "LAST_GAME_DATE" FROM "sync_state" '
+            'WHERE "SEASON" = ? AND "SEASON_TYPE" = ?',
+            (season.season, season.season_type),
+        ).fetchone()
+        return row[0] if row else None
+
+    def get_synced_game_ids(self) -> Set[str]:
+        """Gets the games whose boxscores are in the warehouse"""
+        if not self.get_columns("boxscore_teams"):
+            return set()
+        rows = self.connection.execute('SELECT DISTINCT "gameId" FROM "boxscore_teams"')
+        return {row[0] for row in rows}
+
+    def sync_season(
+        self,
+        season: Season,
+        boxscores: bool = True,
+        max_workers: int = None,
+        incremental: bool = False,
+    ) -> Dict[str, int]:
+        """Loads a season's game logs, stats and (optionally) every game's boxscore into the warehouse
+
+        With ``incremental``, game logs are only requested from the last game date synced
+        (that day included, for games that finished late) and boxscores only for games that
+        aren't in the warehouse yet, so a nightly run costs about as much as the night's games.
+        Games whose boxscores fail are left in ``failed`` and the last synced date stops at
+        the earliest of them, so the next incremental run picks them up again.
+
+        Args:
+            season (Season): season to sync
+            boxscores (bool, optional): also sync the boxscore of every game. Defaults to True.
+            max_workers (int, optional): most boxscore requests running at once. Defaults to ClientConfig.MAX_WORKERS.
+            incremental (bool, optional): only fetch games since the last sync. Defaults to False.
+
+        Returns:
+            Dict[str, int]: rows inserted or changed, by table
+        """
+        date_from = self.get_high_water_mark(season) if incremental else None
+        team_games = season.get_team_games(date_from=date_from)
+        player_games = season.get_player_games(date_from=date_from)
+        changed = {
+            "player_games": self.upsert(
+                "player_games", self._tag(player_games, season)
+            ),
+            "team_games": self.upsert("team_games", self._tag(team_games, season)),
+            "player_stats": self.upsert(
+                "player_stats", self._tag(season.get_player_stats(), season, True)
+            ),
+            "team_stats": self.upsert(
+                "team_stats", self._tag(season.get_team_stats(), season, True)
+            ),
+        }
+        if boxscores:
+            game_ids = team_games["GAME_ID"].unique()
+            if incremental:
+                synced = self.get_synced_game_ids()
+                game_ids = [game_id for game_id in game_ids if game_id not in synced]
+            changed.update(self.sync_boxscores(game_ids, max_workers))
+
+        if not team_games.empty:
+            game_dates = pd.to_datetime(team_games["GAME_DATE"], format="mixed")
+            if boxscores and self.failed:
+                game_dates = game_dates[team_games["GAME_ID"].isin(self.failed)]
+                last_game_date = game_dates.min().strftime("%Y-%m-%d")
+            else:
+                last_game_date = game_dates.max().strftime("%Y-%m-%d")
+            if date_from is None or last_game_date > date_from:
+                self.upsert(
+                    "sync_state",
+                    pd.DataFrame(
+                        {
+                            "SEASON": [season.season],
+                            "SEASON_TYPE": [season.season_type],
+                            "LAST_GAME_DATE": [last_game_date],
+                        }
+                    ),
+                )
+        return changed
+
+    def sync_boxscores(
+        self, game_ids: List[str], max_workers: int = None
+    ) -> Dict[str, int]:
+        """Loads the traditional boxscores of some games into the warehouse
+
+        Args:
+            game_ids (List[str]): games to sync
+            max_workers (int, optional): most requests running at once. Defaults to ClientConfig.MAX_WORKERS.
+
+        Games that still fail after the retries are skipped and recorded in ``failed``.
+
+        Returns:
+            Dict[str, int]: rows inserted or changed, by table
+        """
+        self.failed = {}
+        boxscore = []
+        if len(game_ids):
+            batch = GameBatch(game_ids, ["boxscore"], max_workers)
+            boxscore = batch.get()["boxscore"]
+            self.failed = {
+                game_id: error for (game_id, _), error in batch.failed.items()
+            }
+            if self.failed:
+                logger.warning(
+                    f"{len(self.failed)} boxscores failed: {', '.join(sorted(self.failed))}"
+                )
+        if not boxscore:
+            return {"boxscore_players": 0, "boxscore_teams": 0}
+        players, _, teams = boxscore
+        return {
+            "boxscore_players": self.upsert("boxscore_players", players),
+            "boxscore_teams": self.upsert("boxscore_teams", teams),
+        }
@@ -0,0 +1,55 @@
+import json
+
+import pandas as pd
+import pytest
+from helpers import AWAY, GAME_ID, HOME
+
+import nbastatpy.client
+
+AWARDS = {
+    "resultSets": [
+        {"name": "PlayerAwards", "headers": ["DESCRIPTION"], "rowSet": [["MVP"]]}
+    ]
+}
+
+
+class FakeResponse:
+    text = json.dumps(AWARDS)
+    content = b"\x89PNG image"
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeNetwork:
+    def __init__(self):
+        """Answers every request with the same awards and image until it's disconnected"""
+        self.sent = []
+        self.connected = True
+
+    def send(self, *args) -> FakeResponse:
+        if not self.connected:
+            raise AssertionError("went to the network")
+        self.sent.append(args)
+        return FakeResponse()
+
+
+@pytest.fixture
+def network(monkeypatch) -> FakeNetwork:
+    network = FakeNetwork()
+    monkeypatch.setattr(nbastatpy.client, "send", network.send)
+    return network
+
+
+@pytest.fixture
+def rotations() -> pd.DataFrame:
+    """GameRotation of one game where a single substitution happens, six minutes in"""
+    rows = [(AWAY, player, 0, 28800) for player in range(11, 16)]
+    rows += [(HOME, player, 0, 28800) for player in range(1, 5)]
+    # Player 5 checks out six minutes in and player 6 takes his place
+    rows += [(HOME, 5, 0, 3600), (HOME, 6, 3600, 28800)]
+    df = pd.DataFrame(
+        rows, columns=["TEAM_ID", "PERSON_ID", "IN_TIME_REAL", "OUT_TIME_REAL"]
+    )
+    df.insert(0, "GAME_ID", GAME_ID)
+    return df
@@ -0,0 +1,3 @@
+# IDs shared by the lineup, stint and possession tests: one Bucks-Celtics game
+GAME_ID = "0022300001"
+HOME, AWAY = 1610612749, 1610612738
@@ -0,0 +1,47 @@
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("httpx")
+
+import httpx
+
+from nbastatpy.aio import AsyncGame, configure_async
+from nbastatpy.game import Game
+
+GAME_ID = "0021800836"
+
+
+def test_async_game():
+    payload = {
+        "resultSets": [
+            {
+                "name": "WinProbPBP",
+                "headers": ["GAME_ID", "HOME_PCT"],
+                "rowSet": [[GAME_ID, 0.5], [GAME_ID, 0.75]],
+            },
+            {"name": "GameInfo", "headers": ["GAME_ID"], "rowSet": [[GAME_ID]]},
+        ]
+    }
+    urls = []
+
+    def handler(request):
+        urls.append(str(request.url))
+        return httpx.Response(200, text=json.dumps(payload))
+
+    async def main():
+        configure_async(
+            client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        )
+        game = AsyncGame(GAME_ID)
+        return game, await game.get_win_probability()
+
+    try:
+        game, win_probability = asyncio.run(main())
+    finally:
+        configure_async()
+
+    assert "winprobabilitypbp" in urls[0]
+    assert win_probability["HOME_PCT"].tolist() == [0.5, 0.75]
+    assert game.game_id == Game(GAME_ID).game_id
@@ -0,0 +1,41 @@
+import pytest
+
+from nbastatpy.archive import Archive, ArchiveMissError, set_archive
+from nbastatpy.client import get_url
+from nbastatpy.player import Player
+
+
+@pytest.fixture
+def archive_dir(tmp_path):
+    yield tmp_path / "archive"
+    set_archive(None)
+
+
+def test_record_and_replay(network, archive_dir):
+    set_archive(Archive(archive_dir, mode="record"))
+    recorded = Player("LeBron James").get_awards()
+    get_url("https://cdn.nba.com/headshots/nba/latest/1040x760/2544.png")
+    get_url("https://cdn.nba.com/headshots/nba/latest/1040x760/copy.png")
+
+    # Identical bodies are stored once
+    assert len(list((archive_dir / "objects").glob("*/*.gz"))) == 2
+
+    network.connected = False
+    archive = Archive(archive_dir, mode="replay")
+    set_archive(archive)
+    assert len(archive) == 3
+    assert Player("LeBron James").get_awards().equals(recorded)
+    assert (
+        get_url("https://cdn.nba.com/headshots/nba/latest/1040x760/2544.png")
+        == b"\x89PNG image"
+    )
+
+    with pytest.raises(ArchiveMissError):
+        Player("Giannis").get_awards()
+    with pytest.raises(ArchiveMissError):
+        get_url("https://hoopshype.com/salaries/players/")
+
+
+def test_bad_mode(tmp_path):
+    with pytest.raises(ValueError):
+        Archive(tmp_path, mode="write")
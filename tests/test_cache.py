@@ -0,0 +1,121 @@
+import json
+
+import pandas as pd
+from nba_api.stats.endpoints import CommonTeamRoster, PlayerAwards
+
+import nbastatpy.client
+from nbastatpy.cache import CachePolicy, DiskCache, MemoryCache, make_key, set_cache
+from nbastatpy.client import wait_for_refreshes
+from nbastatpy.player import Player
+from nbastatpy.team import Team
+
+PLAYER_NAME = "LeBron James"
+
+
+def test_disk_cache(tmp_path):
+    cache = DiskCache(tmp_path)
+    cache.set("abc", "payload")
+    assert cache.get("abc") == "payload"
+    cache.set("old", "payload", ttl=-1)
+    assert cache.get("old") is None
+
+
+def test_key_normalization():
+    assert make_key("PlayerAwards", {"PlayerID": 2544, "Season": None}) == make_key(
+        "playerawards", {"Season": "", "PlayerID": "2544"}
+    )
+
+
+def test_finished_seasons_kept_forever():
+    assert CachePolicy.get_ttl("season", {"Season": "2020-21"}) is None
+    assert CachePolicy.get_ttl("season", {}) == CachePolicy.TTL["season"]
+
+
+def test_stale_only_for_listed_endpoints():
+    assert CachePolicy.get_stale(CommonTeamRoster.endpoint) == 24 * 60 * 60
+    assert CachePolicy.get_stale("LeagueDashPlayerStats") == 24 * 60 * 60
+    # Other season and team endpoints wait for a fresh copy
+    assert CachePolicy.get_stale("leaguedashlineups") == 0
+    assert CachePolicy.get_stale("teamyearbyyearstats") == 0
+
+
+def test_player_served_from_cache(tmp_path):
+    player = Player(PLAYER_NAME)
+    request = PlayerAwards(player.id, get_request=False)
+    payload = {
+        "resultSets": [
+            {"name": "PlayerAwards", "headers": ["DESCRIPTION"], "rowSet": [["MVP"]]}
+        ]
+    }
+    cache = DiskCache(tmp_path)
+    cache.set(make_key(request.endpoint, request.parameters), json.dumps(payload))
+    set_cache(cache)
+    try:
+        assert player.get_awards()["DESCRIPTION"].tolist() == ["MVP"]
+    finally:
+        set_cache(None)
+
+
+def test_memory_cache_evicts_least_recently_used():
+    df = pd.DataFrame({"PTS": range(1000)})
+    nbytes = df.memory_usage(deep=True).sum()
+    cache = MemoryCache(max_bytes=int(nbytes * 2.5))
+    cache.set("a", [df])
+    cache.set("b", [df])
+    cache.get("a")
+    cache.set("c", [df])
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["hits"] == 2
+    assert cache.size <= cache.max_bytes
+
+
+def test_memory_cache_returns_copies():
+    cache = MemoryCache()
+    cache.set("a", [pd.DataFrame({"PTS": [1, 2]})])
+    df = cache.get("a")[0]
+    df["season"] = "2020-21"
+    assert list(cache.get("a")[0].columns) == ["PTS"]
+
+
+def roster_payload(name: str) -> str:
+    return json.dumps(
+        {
+            "resultSets": [
+                {"name": "CommonTeamRoster", "headers": ["PLAYER"], "rowSet": [[name]]}
+            ]
+        }
+    )
+
+
+def test_stale_roster_served_while_refreshing(monkeypatch, tmp_path):
+    team = Team("MIL")
+    request = CommonTeamRoster(team.id, season=team.season, get_request=False)
+    key = make_key(request.endpoint, request.parameters)
+    cache = DiskCache(tmp_path)
+    cache.set(key, roster_payload("Old"), ttl=-60)
+
+    class FakeResponse:
+        text = roster_payload("New")
+
+    sent = []
+    monkeypatch.setattr(
+        nbastatpy.client, "send", lambda *args: sent.append(args) or FakeResponse()
+    )
+    set_cache(cache)
+    try:
+        assert team.get_roster()[0]["PLAYER"].tolist() == ["Old"]
+        wait_for_refreshes()
+        assert len(sent) == 1
+        assert team.get_roster()[0]["PLAYER"].tolist() == ["New"]
+
+        # Past the grace period the caller waits for a fresh copy
+        cache.set(
+            key, roster_payload("Old"), ttl=-CachePolicy.STALE["commonteamroster"] - 60
+        )
+        assert team.get_roster()[0]["PLAYER"].tolist() == ["New"]
+        assert len(sent) == 2
+    finally:
+        set_cache(None)
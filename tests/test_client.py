@@ -0,0 +1,120 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+
+import nbastatpy.client
+import nbastatpy.season
+from nbastatpy.client import (
+    EndpointResult,
+    PendingRequest,
+    PendingRequests,
+    SingleFlight,
+    map_concurrent,
+)
+from nbastatpy.player import Player
+from nbastatpy.season import Season
+from nbastatpy.utils import PlayTypes
+
+
+def test_map_concurrent_keeps_order():
+    def slow_square(x):
+        time.sleep(0.05 * (5 - x))
+        return x * x
+
+    start = time.monotonic()
+    assert map_concurrent(slow_square, range(5), max_workers=5) == [0, 1, 4, 9, 16]
+    assert time.monotonic() - start < 0.4
+
+
+def test_season_tracking_all(monkeypatch):
+    def fake_get_endpoint(endpoint, kind, **kwargs):
+        time.sleep(0.05)
+        return EndpointResult(
+            [pd.DataFrame({"PT_MEASURE_TYPE": [kwargs["pt_measure_type"]]})]
+        )
+
+    monkeypatch.setattr(nbastatpy.season, "get_endpoint", fake_get_endpoint)
+    tracking = Season("2020").get_tracking_player("ALL")
+    assert tracking["PT_MEASURE_TYPE"].tolist() == list(
+        dict.fromkeys(PlayTypes.TRACKING_TYPES.values())
+    )
+
+
+def test_single_flight_shares_result():
+    calls = []
+
+    def slow_call():
+        calls.append(1)
+        time.sleep(0.1)
+        return "payload"
+
+    single_flight = SingleFlight()
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda _: single_flight.do("key", slow_call), range(4)))
+
+    assert len(calls) == 1
+    assert all(result == ("payload", True) for result in results)
+
+
+def test_concurrent_identical_requests_coalesced(monkeypatch):
+    calls = []
+    payload = {
+        "resultSets": [
+            {"name": "PlayerAwards", "headers": ["DESCRIPTION"], "rowSet": [["MVP"]]}
+        ]
+    }
+
+    def fake_send_endpoint(request, key, retry=None):
+        calls.append(key)
+        time.sleep(0.2)
+        return json.dumps(payload)
+
+    def get_awards(player):
+        barrier.wait()
+        return player.get_awards()
+
+    monkeypatch.setattr(nbastatpy.client, "_send_endpoint", fake_send_endpoint)
+    players = [Player("LeBron James") for _ in range(4)]
+    barrier = threading.Barrier(len(players))
+    with ThreadPoolExecutor(max_workers=len(players)) as pool:
+        awards = list(pool.map(get_awards, players))
+
+    assert len(calls) == 1
+    assert all(df["DESCRIPTION"].tolist() == ["MVP"] for df in awards)
+
+
+def test_async_requests_skip_single_flight(monkeypatch):
+    payload = {
+        "resultSets": [
+            {"name": "PlayerAwards", "headers": ["DESCRIPTION"], "rowSet": [["MVP"]]}
+        ]
+    }
+    started, release = threading.Event(), threading.Event()
+
+    def fake_send_endpoint(request, key, retry=None):
+        if nbastatpy.client.prefetched.get() is None:
+            started.set()
+            release.wait(5)
+            return json.dumps(payload)
+        raise PendingRequest(key, "url")
+
+    def get_prefetched():
+        token = nbastatpy.client.prefetched.set({})
+        try:
+            Player("LeBron James").get_awards()
+        finally:
+            nbastatpy.client.prefetched.reset(token)
+
+    monkeypatch.setattr(nbastatpy.client, "_send_endpoint", fake_send_endpoint)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        sync = pool.submit(Player("LeBron James").get_awards)
+        started.wait(5)
+        # Neither waits on the other's request, nor gets its result or its PendingRequest
+        with pytest.raises(PendingRequests):
+            pool.submit(get_prefetched).result(timeout=1)
+        release.set()
+        assert sync.result()["DESCRIPTION"].tolist() == ["MVP"]
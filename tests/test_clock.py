@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+
+import nbastatpy.game
+from nbastatpy.client import EndpointResult
+from nbastatpy.clock import configure_clock, get_elapsed, parse_duration
+from nbastatpy.game import Game
+
+
+def test_parse_duration():
+    seconds = parse_duration(
+        ["PT11M32.00S", "PT00M05.40S", "36:12", "PT12M", "", None, "PT11M32.00S"]
+    )
+    np.testing.assert_allclose(
+        seconds, [692.0, 5.4, 2172.0, 720.0, np.nan, np.nan, 692.0]
+    )
+
+
+def test_elapsed_with_overtime():
+    elapsed = get_elapsed(
+        pd.Series([1, 4, 5, 6]),
+        pd.Series(["PT12M00.00S", "PT00M00.00S", "PT04M30.00S", "PT00M00.00S"]),
+    )
+    assert elapsed.tolist() == [0.0, 2880.0, 2910.0, 3480.0]
+
+
+def test_game_adds_seconds(monkeypatch):
+    frames = {
+        "playbyplayv3": [
+            pd.DataFrame({"period": [1, 2], "clock": ["PT11M00.00S", "PT06M00.00S"]})
+        ],
+        "gamerotation": [
+            pd.DataFrame({"IN_TIME_REAL": [0], "OUT_TIME_REAL": [3600]}),
+            pd.DataFrame({"IN_TIME_REAL": [3600], "OUT_TIME_REAL": [28800]}),
+        ],
+        "boxscoretraditionalv3": [
+            pd.DataFrame({"personId": [1, 2], "minutes": ["35:24", ""]})
+        ],
+    }
+
+    def fake_get_endpoint(endpoint, *args, kind, **kwargs):
+        return EndpointResult(frames[endpoint.endpoint])
+
+    monkeypatch.setattr(nbastatpy.game, "get_endpoint", fake_get_endpoint)
+    game = Game("0022300001")
+    assert "elapsedSeconds" not in game.get_playbyplay().columns
+
+    configure_clock()
+    try:
+        playbyplay = game.get_playbyplay()
+        assert playbyplay["clockSeconds"].tolist() == [660.0, 360.0]
+        assert playbyplay["elapsedSeconds"].tolist() == [60.0, 1080.0]
+        assert game.get_rotations()["OUT_TIME_SECONDS"].tolist() == [360.0, 2880.0]
+        boxscore = game.get_boxscore()[0]
+        assert list(boxscore.columns) == ["personId", "minutes", "seconds"]
+        assert boxscore["seconds"].iloc[0] == 2124.0
+    finally:
+        configure_clock(False)
@@ -0,0 +1,128 @@
+import copy
+import json
+import pickle
+
+import nba_api.stats.endpoints as nba
+import pandas as pd
+from nba_api.stats.library.http import NBAStatsResponse
+
+import nbastatpy.client
+from nbastatpy.decode import decode
+
+
+def nba_api_frames(endpoint, contents):
+    request = endpoint.__new__(endpoint)
+    request.nba_response = NBAStatsResponse(
+        response=contents, status_code=200, url=None
+    )
+    request.load_response()
+    return request.get_data_frames()
+
+
+def assert_same_frames(endpoint, payload):
+    contents = json.dumps(payload)
+    frames = decode(endpoint.endpoint, contents)
+    expected = nba_api_frames(endpoint, contents)
+    assert len(frames) == len(expected)
+    for df, expected_df in zip(frames, expected):
+        pd.testing.assert_frame_equal(df, expected_df)
+
+
+def test_tabular_matches_nba_api():
+    headers = ["PLAYER_ID", "PLAYER_NAME", "PTS", "FG_PCT", "RANK", "FLAG"]
+    rows = [
+        [1, "A", 10, 0.5, None, True],
+        [2, "B", 12, 1, 3, False],
+        [3, None, 0, 0.25, 1, True],
+    ]
+    payload = {
+        "resultSets": [
+            {"name": "PlayerGameLogs", "headers": headers, "rowSet": rows},
+            {"name": "Empty", "headers": ["A", "B"], "rowSet": []},
+        ]
+    }
+    assert_same_frames(nba.PlayerGameLogs, payload)
+
+
+def test_single_result_set_matches_nba_api():
+    payload = {
+        "resultSet": {
+            "name": "LeagueGameLog",
+            "headers": ["A", "B"],
+            "rowSet": [[1, "x"]],
+        }
+    }
+    assert_same_frames(nba.LeagueGameLog, payload)
+
+
+def test_v3_matches_nba_api():
+    actions = [
+        {"actionNumber": i, "period": 1, "clock": f"PT11M{i:02d}.00S", "personId": i}
+        for i in range(5)
+    ]
+    payload = {
+        "game": {"gameId": "0022300001", "videoAvailable": 1, "actions": actions}
+    }
+    assert_same_frames(nba.PlayByPlayV3, payload)
+
+
+def test_invalid_json():
+    assert decode("playergamelogs", "<html>blocked</html>") is None
+
+
+def test_result_sets_built_on_access(monkeypatch):
+    payload = {
+        "resultSets": [
+            {"name": "CommonPlayerInfo", "headers": ["PERSON_ID"], "rowSet": [[2544]]},
+            {"name": "PlayerHeadlineStats", "headers": ["PTS"], "rowSet": [[25.7]]},
+            {
+                "name": "AvailableSeasons",
+                "headers": ["SEASON_ID"],
+                "rowSet": [["22023"]],
+            },
+        ]
+    }
+    monkeypatch.setattr(
+        nbastatpy.client, "_send_endpoint", lambda *args: json.dumps(payload)
+    )
+    built = []
+    monkeypatch.setattr(
+        "nbastatpy.decode.build_frame",
+        lambda data_set: (
+            built.append(data_set["headers"])
+            or pd.DataFrame(data_set["data"], columns=data_set["headers"])
+        ),
+    )
+
+    result = nbastatpy.client.get_endpoint(nba.CommonPlayerInfo, 2544, kind="player")
+    frames = result.get_data_frames()
+    assert len(frames) == 3 and built == []
+    assert frames[0]["PERSON_ID"].tolist() == [2544]
+    assert built == [["PERSON_ID"]]
+
+    view = frames.view()[0]
+    view["NEW"] = 1
+    assert "NEW" not in frames[0].columns
+    assert [df.columns[0] for df in frames] == ["PERSON_ID", "PTS", "SEASON_ID"]
+    assert built == [["PERSON_ID"], ["PTS"], ["SEASON_ID"]]
+
+
+def test_lazy_frames_are_a_list():
+    payload = {
+        "resultSets": [
+            {"name": "A", "headers": ["PTS"], "rowSet": [[25.7]]},
+            {"name": "B", "headers": ["AST"], "rowSet": [[8.3]]},
+        ]
+    }
+    frames = decode("playerdashboardbygeneralsplits", json.dumps(payload))
+    assert isinstance(frames, list)
+
+    for other in (
+        pickle.loads(pickle.dumps(frames)),
+        copy.deepcopy(frames),
+        frames + [],
+        [] + frames,
+        list(frames),
+    ):
+        assert type(other) is list
+        assert [df.columns[0] for df in other] == ["PTS", "AST"]
@@ -0,0 +1,52 @@
+import json
+
+import pandas as pd
+
+import nbastatpy.client
+from nbastatpy.dtypes import configure_dtypes, optimize_frame
+from nbastatpy.game import Game
+
+
+def test_optimize_frame():
+    df = pd.DataFrame(
+        {
+            "TEAM": ["MIL", "BOS"] * 50,
+            "NAME": [f"Player {i}" for i in range(100)],
+            "PTS": range(100),
+            "PCT": [0.5] * 100,
+            "BIG": [2**40] * 100,
+        }
+    )
+    optimized = optimize_frame(df, {"PTS": "int8"})
+    assert optimized["TEAM"].dtype == "category"
+    assert optimized["NAME"].dtype == df["NAME"].dtype
+    assert optimized["PTS"].dtype == "int8"
+    assert optimized["PCT"].dtype == "float32"
+    assert optimized["BIG"].dtype == "int64"
+    assert optimized.memory_usage(deep=True).sum() < df.memory_usage(deep=True).sum()
+    pd.testing.assert_frame_equal(optimized.astype(df.dtypes), df)
+
+
+def test_policy_applied_to_endpoints(monkeypatch):
+    actions = [
+        {
+            "actionNumber": i,
+            "period": 1 + i // 100,
+            "actionType": "shot",
+            "description": f"play {i}",
+        }
+        for i in range(400)
+    ]
+    payload = {"game": {"gameId": "0022300001", "actions": actions}}
+    monkeypatch.setattr(
+        nbastatpy.client, "_send_endpoint", lambda *args: json.dumps(payload)
+    )
+
+    assert Game("0022300001").get_playbyplay()["period"].dtype == "int64"
+    configure_dtypes(True)
+    try:
+        pbp = Game("0022300001").get_playbyplay()
+    finally:
+        configure_dtypes(False)
+    assert pbp["period"].dtype == "int8"
+    assert pbp["actionType"].dtype == "category"
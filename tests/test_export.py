@@ -0,0 +1,126 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from nbastatpy.export import export, read_dataset, write_dataset, write_stream
+from nbastatpy.utils import Formatter
+
+
+def make_games(season_year: str, dates: list) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "SEASON_YEAR": season_year,
+            "GAME_ID": [f"00223{i:05d}" for i in range(len(dates))],
+            "GAME_DATE": [f"{date}T00:00:00" for date in dates],
+            "PTS": range(len(dates)),
+        }
+    )
+
+
+def test_write_and_read_partitions(tmp_path):
+    write_dataset(
+        make_games("2022-23", ["2023-01-01"]), tmp_path, "player_games", "2022-23"
+    )
+    write_dataset(
+        make_games("2023-24", ["2024-01-01", "2024-01-02"]),
+        tmp_path,
+        "player_games",
+        "2023-24",
+    )
+    write_dataset(
+        make_games("2023-24", ["2024-05-01"]),
+        tmp_path,
+        "player_games",
+        "2023-24",
+        "Playoffs",
+    )
+
+    assert len(read_dataset(tmp_path)) == 4
+    regular = read_dataset(tmp_path, season="2023-24", season_type="Regular Season")
+    assert regular["GAME_DATE"].tolist() == [
+        "2024-01-01T00:00:00",
+        "2024-01-02T00:00:00",
+    ]
+    assert list(regular.columns) == ["SEASON_YEAR", "GAME_ID", "GAME_DATE", "PTS"]
+    assert read_dataset(tmp_path, endpoint="team_games").empty
+
+    # Writing a partition again replaces it
+    write_dataset(
+        make_games("2022-23", ["2023-01-02"]), tmp_path, "player_games", "2022-23"
+    )
+    assert read_dataset(tmp_path, season="2022-23")["GAME_DATE"].tolist() == [
+        "2023-01-02T00:00:00"
+    ]
+
+
+def test_by_date_filters(tmp_path):
+    games = make_games("2023-24", ["2024-01-01", "2024-01-02", "2024-01-03"])
+    files = write_dataset(
+        games, tmp_path, "team_games", "2023-24", by_date=True, format="arrow"
+    )
+    assert len(files) == 3
+
+    df = read_dataset(tmp_path, date_from="2024-01-02", format="arrow")
+    assert df["PTS"].tolist() == [1, 2]
+    assert read_dataset(
+        tmp_path, date_to="2024-01-01", columns=["PTS"], format="arrow"
+    )["PTS"].tolist() == [0]
+
+
+def test_schema_merged_across_seasons(tmp_path):
+    old = make_games("2022-23", ["2023-01-01"])
+    new = make_games("2023-24", ["2024-01-01"]).assign(NEW_STAT=1.5)
+    write_dataset(old, tmp_path, "player_games", "2022-23")
+    write_dataset(new, tmp_path, "player_games", "2023-24")
+
+    df = read_dataset(tmp_path).sort_values("SEASON_YEAR")
+    assert df["NEW_STAT"].isna().tolist() == [True, False]
+
+
+def test_export_game(tmp_path):
+    class FakeGame:
+        game_id = "0042300101"
+
+        def get_boxscore(self):
+            return [
+                make_games("2023-24", ["2024-04-20"]),
+                pd.DataFrame({"TEAM": ["MIL"]}),
+            ]
+
+    export(FakeGame(), "boxscore", tmp_path)
+    df = read_dataset(
+        tmp_path, endpoint="boxscore_1", season="2023-24", season_type="Playoffs"
+    )
+    assert df["TEAM"].tolist() == ["MIL"]
+
+
+def test_game_season():
+    assert Formatter.get_game_season("0022300001") == ("2023-24", "Regular Season")
+    assert Formatter.get_game_season("0049900001") == ("1999-00", "Playoffs")
+
+
+def test_write_stream_in_chunks(tmp_path):
+    def games():
+        for i in range(5):
+            df = make_games("2023-24", ["2024-01-01"] * 3)
+            # A column that's empty in the first games
+            df["NOTE"] = None if i < 2 else "late"
+            yield df
+
+    files = write_stream(games(), tmp_path, "playbyplay", "2023-24", chunk_rows=6)
+    assert [Path(file).name for file in files] == [
+        "part-0.parquet",
+        "part-1.parquet",
+        "part-2.parquet",
+    ]
+    df = read_dataset(tmp_path, endpoint="playbyplay")
+    assert len(df) == 15
+    assert df["NOTE"].tolist()[-1] == "late"
+
+    # Fewer chunks the second time round, the leftover file goes
+    write_stream(games(), tmp_path, "playbyplay", "2023-24", chunk_rows=100)
+    assert len(read_dataset(tmp_path, endpoint="playbyplay")) == 15
+    assert len(list(tmp_path.rglob("part-*"))) == 1
@@ -1,4 +1,15 @@
-from nbastatpy.game import Game
+import time
+
+import pandas as pd
+
+import nbastatpy.game
+import nbastatpy.season
+from nbastatpy.cache import CachePolicy
+from nbastatpy.client import EndpointResult
+from nbastatpy.game import Game, GameBatch
+from nbastatpy.retry import CircuitOpenError, RetryPolicy
+from nbastatpy.season import Season
+from nbastatpy.utils import Formatter
 
 GAME_ID = "0021800836"
 
@@ -6,3 +17,126 @@ GAME_ID = "0021800836"
 def test_game_creation():
     game = Game(GAME_ID)
     assert game.game_id == GAME_ID
+
+
+def test_game_batch(monkeypatch):
+    calls = []
+
+    def fake_get_endpoint(endpoint, *args, kind, **kwargs):
+        game_id = kwargs.get("game_id", args[0] if args else None)
+        calls.append(game_id)
+        if calls.count(game_id) == 1 and game_id.endswith("2"):
+            raise ConnectionError("timed out")
+        return EndpointResult([pd.DataFrame({"actionNumber": [1, 2]})])
+
+    monkeypatch.setattr(nbastatpy.game, "get_endpoint", fake_get_endpoint)
+    game_ids = ["0022300001", "0022300002"]
+    data = GameBatch(game_ids, kinds=["playbyplay"], backoff=0).get()
+
+    assert data["playbyplay"]["GAME_ID"].tolist() == [
+        "0022300001",
+        "0022300001",
+        "0022300002",
+        "0022300002",
+    ]
+    assert Game.many(game_ids[:1], kinds=["playbyplay"])["playbyplay"].shape == (2, 2)
+
+
+def test_get_all(monkeypatch):
+    def fake_get_endpoint(endpoint, *args, kind, **kwargs):
+        time.sleep(0.05)
+        return EndpointResult([pd.DataFrame({"endpoint": [endpoint.endpoint]})] * 2)
+
+    monkeypatch.setattr(nbastatpy.game, "get_endpoint", fake_get_endpoint)
+    start = time.monotonic()
+    data = Game(GAME_ID).get_all()
+
+    assert time.monotonic() - start < 0.05 * len(Game.KINDS) / 2
+    assert list(data) == list(Game.KINDS)
+    assert data["playbyplay"]["endpoint"].iloc[0] == "playbyplayv3"
+    assert isinstance(data["boxscore"], list)
+
+
+def test_stream(monkeypatch):
+    in_flight, most = [0], [0]
+
+    def fake_get_endpoint(endpoint, *args, kind, **kwargs):
+        in_flight[0] += 1
+        most[0] = max(most[0], in_flight[0])
+        time.sleep(0.01)
+        in_flight[0] -= 1
+        return EndpointResult([pd.DataFrame({"actionNumber": [1, 2]})])
+
+    monkeypatch.setattr(nbastatpy.game, "get_endpoint", fake_get_endpoint)
+    game_ids = [f"00223000{i:02d}" for i in range(1, 21)]
+    games = Game.stream(
+        game_ids, transforms=[lambda df: df.assign(points=0)], max_workers=4
+    )
+
+    first = next(games)
+    assert first["GAME_ID"].tolist() == ["0022300001"] * 2
+    assert "points" in first.columns
+    assert [df["GAME_ID"].iloc[0] for df in games] == game_ids[1:]
+    assert most[0] <= 4
+
+
+def test_live_games_cached_briefly(monkeypatch):
+    kinds = []
+
+    def fake_get_endpoint(endpoint, *args, kind, **kwargs):
+        kinds.append((endpoint.endpoint, kind))
+        return EndpointResult([pd.DataFrame({"GAME_ID": [game_id]})])
+
+    monkeypatch.setattr(nbastatpy.game, "get_endpoint", fake_get_endpoint)
+    monkeypatch.setattr(nbastatpy.season, "get_endpoint", fake_get_endpoint)
+    monkeypatch.setattr(CachePolicy, "FINAL_GAMES", set())
+    year = Formatter.get_current_season_year()
+    game_id = f"002{str(year)[2:]}00001"
+
+    Game(game_id).get_playbyplay()
+    Season(year).get_team_games()
+    Game(game_id).get_playbyplay()
+    Game(GAME_ID).get_playbyplay()
+    assert kinds == [
+        ("playbyplayv3", "live_game"),
+        ("leaguegamelog", "game_log"),
+        ("playbyplayv3", "game"),
+        ("playbyplayv3", "game"),
+    ]
+
+
+def test_game_batch_only_retries_transient_errors(monkeypatch):
+    calls = []
+
+    def fake_get_endpoint(endpoint, *args, kind, **kwargs):
+        game_id = kwargs.get("game_id", args[0] if args else None)
+        calls.append(game_id)
+        if game_id.endswith("1"):
+            raise CircuitOpenError("stats.nba.com failed 5 times in a row")
+        raise ValueError("bad response")
+
+    monkeypatch.setattr(nbastatpy.game, "get_endpoint", fake_get_endpoint)
+    batch = GameBatch(["0022300001", "0022300002"], kinds=["playbyplay"], backoff=0)
+    batch.get()
+    assert sorted(calls) == ["0022300001", "0022300002"]
+    assert sorted(batch.failed) == [
+        ("0022300001", "playbyplay"),
+        ("0022300002", "playbyplay"),
+    ]
+    # Every game failed, but play-by-play still comes back as a data frame
+    assert isinstance(batch.data["playbyplay"], pd.DataFrame)
+    assert batch.data["playbyplay"].empty
+
+
+def test_retry_policy_passed_on(monkeypatch):
+    policies = []
+
+    def fake_get_endpoint(endpoint, *args, kind, retry=None, **kwargs):
+        policies.append(retry)
+        return EndpointResult([pd.DataFrame({"actionNumber": [1]})])
+
+    monkeypatch.setattr(nbastatpy.game, "get_endpoint", fake_get_endpoint)
+    policy = RetryPolicy(max_attempts=5)
+    Game(GAME_ID, retry=policy).get_playbyplay()
+    Game.many([GAME_ID], kinds=["playbyplay"], retry=policy)
+    assert policies == [policy, policy]
@@ -0,0 +1,56 @@
+import time
+
+import pandas as pd
+
+import nbastatpy.player
+from nbastatpy.client import EndpointResult
+from nbastatpy.lazy import LazyPlayer, resolve_all
+
+
+def test_fetch_deferred_until_used(monkeypatch):
+    calls = []
+
+    def fake_get_endpoint(endpoint, *args, kind, **kwargs):
+        calls.append(endpoint.endpoint)
+        return EndpointResult([pd.DataFrame({"DESCRIPTION": ["MVP"]})])
+
+    monkeypatch.setattr(nbastatpy.player, "get_endpoint", fake_get_endpoint)
+    player = LazyPlayer("LeBron James")
+    awards = player.get_awards()
+    player.get_awards()  # never used, never fetched
+    assert calls == [] and not awards.resolved
+    assert "not fetched" in repr(awards)
+
+    assert awards["DESCRIPTION"].tolist() == ["MVP"]
+    assert len(awards) == 1
+    assert awards.shape == (1, 1)
+    assert calls == ["playerawards"]
+    assert player.name == "LeBron James"
+
+
+def test_resolve_all_concurrently(monkeypatch):
+    def slow_get_endpoint(endpoint, *args, kind, **kwargs):
+        time.sleep(0.2)
+        return EndpointResult([pd.DataFrame({"ENDPOINT": [endpoint.endpoint]})])
+
+    monkeypatch.setattr(nbastatpy.player, "get_endpoint", slow_get_endpoint)
+    player = LazyPlayer("LeBron James")
+    results = [player.get_awards(), player.get_splits(), player.get_awards()]
+
+    start = time.monotonic()
+    values = resolve_all(results)
+    assert time.monotonic() - start < 0.5
+    assert all(result.resolved for result in results)
+    assert values[0]["ENDPOINT"].tolist() == ["playerawards"]
+
+
+def test_readme_example(monkeypatch):
+    def fake_get_endpoint(endpoint, *args, kind, **kwargs):
+        return EndpointResult([pd.DataFrame({"DESCRIPTION": ["MVP"]})])
+
+    monkeypatch.setattr(nbastatpy.player, "get_endpoint", fake_get_endpoint)
+    player = LazyPlayer("Giannis", season_year="2023")
+    awards, splits = player.get_awards(), player.get_splits()
+    resolve_all([awards, splits])
+    assert awards["DESCRIPTION"].tolist() == ["MVP"]
+    assert player.season_year == "2023"
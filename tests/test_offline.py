@@ -0,0 +1,78 @@
+import json
+
+import pytest
+
+from nbastatpy.archive import Archive, set_archive
+from nbastatpy.cache import CacheMissError, DiskCache, get_cache, set_cache
+from nbastatpy.client import configure_offline, get_url
+from nbastatpy.player import Player
+
+HEADSHOT_URL = "https://cdn.nba.com/headshots/nba/latest/1040x760/2544.png"
+SALARIES_URL = "https://hoopshype.com/salaries/players/"
+
+
+@pytest.fixture
+def offline(tmp_path):
+    previous = get_cache()
+    yield tmp_path
+    configure_offline(False)
+    set_cache(previous)
+    set_archive(None)
+
+
+def expire_all(cache: DiskCache) -> None:
+    for path in cache.directory.glob("*/*.json"):
+        contents = path.read_text().split("\n", 1)[1]
+        path.write_text(json.dumps({"expires": 0}) + "\n" + contents)
+
+
+def test_offline_serves_expired_cache(network, offline):
+    cache = DiskCache(offline / "cache")
+    set_cache(cache)
+    online = Player("LeBron James").get_awards()
+    expire_all(cache)
+
+    network.connected = False
+    configure_offline()
+    assert Player("LeBron James").get_awards().equals(online)
+    with pytest.raises(CacheMissError):
+        Player("Giannis").get_awards()
+
+
+def test_offline_serves_archive(network, offline):
+    set_cache(None)
+    # A recording archive is still read from when offline
+    set_archive(Archive(offline / "archive", mode="record"))
+    online = Player("LeBron James").get_awards()
+    get_url(HEADSHOT_URL)
+
+    network.connected = False
+    configure_offline()
+    assert Player("LeBron James").get_awards().equals(online)
+    assert get_url(HEADSHOT_URL) == b"\x89PNG image"
+    with pytest.raises(CacheMissError):
+        get_url(SALARIES_URL)
+
+
+def test_offline_without_cache_or_archive(network, offline):
+    set_cache(None)
+    network.connected = False
+    configure_offline()
+    with pytest.raises(CacheMissError):
+        Player("LeBron James").get_awards()
+
+
+def test_get_url_cached_on_disk(network, offline):
+    cache = DiskCache(offline / "cache")
+    set_cache(cache)
+    assert get_url(HEADSHOT_URL) == b"\x89PNG image"
+    assert get_url(HEADSHOT_URL) == b"\x89PNG image"
+    assert len(network.sent) == 1
+
+    get_url(SALARIES_URL, kind="salary")
+    expire_all(cache)
+
+    network.connected = False
+    configure_offline()
+    assert get_url(HEADSHOT_URL) == b"\x89PNG image"
+    assert get_url(SALARIES_URL) == b"\x89PNG image"
@@ -0,0 +1,40 @@
+import pandas as pd
+from helpers import AWAY, GAME_ID, HOME
+
+from nbastatpy.oncourt import OnCourtIndex
+
+
+def test_players_at(rotations):
+    index = OnCourtIndex(rotations)
+    assert index.players_at(GAME_ID, 100) == (1, 2, 3, 4, 5, 11, 12, 13, 14, 15)
+    # At the substitution time the player coming in is on the floor
+    assert 6 in index.players_at(GAME_ID, 360)
+    assert index.players_at(GAME_ID, 3000) == ()
+    assert index.players_at("0022399999", 100) == ()
+
+
+def test_lineups_at(rotations):
+    index = OnCourtIndex(rotations)
+    lineups = index.lineups_at(
+        [GAME_ID, GAME_ID, GAME_ID, "0022399999"],
+        [10, 2000, 2000, 10],
+        [HOME, HOME, AWAY, HOME],
+    )
+    assert lineups == [
+        (1, 2, 3, 4, 5),
+        (1, 2, 3, 4, 6),
+        (11, 12, 13, 14, 15),
+        None,
+    ]
+
+
+def test_shared(rotations):
+    second_game = rotations.assign(GAME_ID="0022300002")
+    index = OnCourtIndex(pd.concat([rotations, second_game], ignore_index=True))
+
+    shared = index.shared(5, 11)
+    assert shared["GAME_ID"].tolist() == [GAME_ID, "0022300002"]
+    assert shared["START"].tolist() == [0, 0]
+    assert shared["SECONDS"].tolist() == [360, 360]
+    assert index.shared(5, 6).empty
+    assert index.shared(5, 999).empty
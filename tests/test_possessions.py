@@ -0,0 +1,89 @@
+import pandas as pd
+from helpers import AWAY, GAME_ID, HOME
+
+from nbastatpy.possessions import get_possessions, tag_possessions
+
+ACTIONS = [
+    # period, clock, teamId, actionType, subType, shotValue, description
+    (1, "PT12M00.00S", 0, "period", "start", 0, "Start of 1st Period"),
+    (1, "PT12M00.00S", HOME, "Jump Ball", "", 0, "Jump Ball"),
+    (1, "PT11M40.00S", HOME, "Made Shot", "Jump Shot", 2, "Lopez 2' Jump Shot"),
+    (1, "PT11M40.00S", AWAY, "Timeout", "full", 0, "Celtics Timeout"),
+    (1, "PT11M20.00S", AWAY, "Missed Shot", "Jump Shot", 3, "MISS Tatum 3PT"),
+    (1, "PT11M18.00S", AWAY, "Rebound", "offensive", 0, "Horford REBOUND"),
+    (1, "PT11M10.00S", HOME, "Foul", "shooting", 0, "Giannis S.FOUL"),
+    (1, "PT11M10.00S", AWAY, "Free Throw", "1 of 2", 1, "Horford Free Throw 1 of 2"),
+    (
+        1,
+        "PT11M10.00S",
+        AWAY,
+        "Free Throw",
+        "2 of 2",
+        1,
+        "MISS Horford Free Throw 2 of 2",
+    ),
+    (1, "PT11M08.00S", HOME, "Rebound", "defensive", 0, "Giannis REBOUND"),
+    (
+        1,
+        "PT11M00.00S",
+        AWAY,
+        "Free Throw",
+        "Technical",
+        1,
+        "Brown Free Throw Technical",
+    ),
+    (1, "PT10M50.00S", HOME, "Turnover", "bad pass", 0, "Giannis Bad Pass TURNOVER"),
+    (2, "PT12M00.00S", 0, "period", "start", 0, "Start of 2nd Period"),
+    (2, "PT11M45.00S", AWAY, "Made Shot", "Dunk", 2, "Brown Dunk"),
+]
+
+
+def make_playbyplay(game_id: str = GAME_ID) -> pd.DataFrame:
+    df = pd.DataFrame(
+        ACTIONS,
+        columns=[
+            "period",
+            "clock",
+            "teamId",
+            "actionType",
+            "subType",
+            "shotValue",
+            "description",
+        ],
+    )
+    df.insert(0, "gameId", game_id)
+    df.insert(1, "actionNumber", range(1, len(df) + 1))
+    return df
+
+
+def test_tag_possessions():
+    df = tag_possessions(make_playbyplay())
+    assert df["possessionId"].tolist() == [1, 1, 1, 1, 2, 2, 2, 2, 2, 3, 3, 3, 4, 4]
+    assert (
+        df["offenseTeamId"].tolist()
+        == [HOME] * 4 + [AWAY] * 5 + [HOME] * 3 + [AWAY] * 2
+    )
+    # The timeout after the basket stays with the possession it follows, and the
+    # technical free throw doesn't count for the offense
+    assert df["points"].tolist() == [0, 0, 2, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 2]
+
+
+def test_get_possessions_across_games():
+    season = pd.concat(
+        [make_playbyplay("0022300001"), make_playbyplay("0022300002")],
+        ignore_index=True,
+    )
+    possessions = get_possessions(season)
+
+    assert len(possessions) == 8
+    assert possessions.groupby("gameId")["possessionId"].max().tolist() == [4, 4]
+    first_game = possessions[possessions["gameId"] == "0022300001"]
+    assert first_game["points"].tolist() == [2, 1, 0, 2]
+    assert first_game["startClock"].tolist() == [
+        "PT12M00.00S",
+        "PT11M40.00S",
+        "PT11M10.00S",
+        "PT12M00.00S",
+    ]
+    assert first_game["endClock"].tolist()[1] == "PT11M10.00S"
+    assert first_game["actions"].sum() == len(ACTIONS)
@@ -0,0 +1,28 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from nbastatpy.ratelimit import TokenBucket
+
+
+def test_burst_is_immediate():
+    bucket = TokenBucket(rate=1, burst=3)
+    start = time.monotonic()
+    for _ in range(3):
+        bucket.acquire()
+    assert time.monotonic() - start < 0.1
+
+
+def test_budget_shared_across_threads():
+    bucket = TokenBucket(rate=50, burst=1)
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda _: bucket.acquire(), range(11)))
+    elapsed = time.monotonic() - start
+    assert 0.18 <= elapsed < 0.5
+
+
+def test_invalid_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
@@ -0,0 +1,109 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+from nba_api.stats.library.http import NBAStatsHTTP
+
+from nbastatpy.cache import DiskCache, get_cache, set_cache
+from nbastatpy.client import get_url
+from nbastatpy.player import Player
+from nbastatpy.ratelimit import RateLimitConfig, configure_rate_limit
+from nbastatpy.retry import CircuitOpenError, RetryPolicy, configure_retry
+
+PAYLOAD = {
+    "resultSets": [
+        {"name": "PlayerAwards", "headers": ["DESCRIPTION"], "rowSet": [["MVP"]]}
+    ]
+}
+NO_WAIT = RetryPolicy(max_attempts=3, backoff=0, jitter=False)
+
+
+@pytest.fixture
+def stub_server(monkeypatch):
+    """Local server that replies with the queued (status, headers) pairs, then 200"""
+    replies = []
+    hits = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            hits.append(self.path)
+            status, headers = replies.pop(0) if replies else (200, {})
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(json.dumps(PAYLOAD).encode())
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}"
+    monkeypatch.setattr(NBAStatsHTTP, "base_url", url + "/stats/{endpoint}")
+    configure_retry(policy=NO_WAIT, failure_threshold=3, reset_timeout=60)
+    configure_rate_limit(None)
+    yield url, replies, hits
+    server.shutdown()
+    configure_rate_limit(RateLimitConfig.RATE)
+    configure_retry(policy=RetryPolicy(), failure_threshold=5, reset_timeout=60)
+
+
+def test_retries_server_errors(stub_server):
+    url, replies, hits = stub_server
+    replies.extend([(503, {}), (429, {"Retry-After": "0"})])
+    awards = Player("LeBron James").get_awards()
+    assert awards["DESCRIPTION"].tolist() == ["MVP"]
+    assert len(hits) == 3
+
+
+def test_retry_policy_per_object(stub_server):
+    url, replies, hits = stub_server
+    replies.extend([(503, {})] * 2)
+    # The default policy would retry both, this one gives up after the first
+    with pytest.raises(requests.HTTPError):
+        Player("LeBron James", retry=RetryPolicy(max_attempts=1)).get_awards()
+    assert len(hits) == 1
+    assert Player("LeBron James").get_awards()["DESCRIPTION"].tolist() == ["MVP"]
+    assert len(hits) == 3
+
+
+def test_gives_up_after_max_attempts(stub_server):
+    url, replies, hits = stub_server
+    replies.extend([(500, {})] * 2)
+    with pytest.raises(requests.HTTPError):
+        get_url(url + "/image.png", retry=RetryPolicy(max_attempts=2, backoff=0))
+    assert len(hits) == 2
+
+
+def test_get_url_skips_cache_on_error(stub_server, tmp_path):
+    url, replies, hits = stub_server
+    previous = get_cache()
+    set_cache(DiskCache(tmp_path))
+    replies.append((404, {}))
+    try:
+        with pytest.raises(requests.HTTPError):
+            get_url(url + "/image.png")
+        assert json.loads(get_url(url + "/image.png")) == PAYLOAD
+        assert json.loads(get_url(url + "/image.png")) == PAYLOAD
+    finally:
+        set_cache(previous)
+    assert len(hits) == 2
+
+
+def test_circuit_breaker_fails_fast(stub_server):
+    url, replies, hits = stub_server
+    replies.extend([(502, {})] * 3)
+    with pytest.raises(requests.HTTPError):
+        get_url(url + "/salaries")
+    with pytest.raises(CircuitOpenError):
+        get_url(url + "/salaries")
+    assert len(hits) == 3
+
+
+def test_retry_delay():
+    policy = RetryPolicy(backoff=1, max_backoff=5, jitter=False)
+    assert [policy.get_delay(attempt) for attempt in range(4)] == [1, 2, 4, 5]
+    assert policy.get_delay(0, retry_after=10) == 10
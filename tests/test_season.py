@@ -1,3 +1,5 @@
+import pandas as pd
+
 from nbastatpy.season import Season
 
 SEASON_YEAR = "2020"
@@ -6,3 +8,22 @@ SEASON_YEAR = "2020"
 def test_season_creation():
     season = Season(SEASON_YEAR)
     assert season.season_year == SEASON_YEAR
+
+
+def test_game_logs_date_bounds(monkeypatch):
+    calls = []
+
+    class Result:
+        def get_data_frames(self):
+            return [pd.DataFrame({"GAME_ID": []})]
+
+    def get_endpoint(endpoint, **kwargs):
+        calls.append(kwargs)
+        return Result()
+
+    monkeypatch.setattr("nbastatpy.season.get_endpoint", get_endpoint)
+    season = Season(SEASON_YEAR)
+    season.get_team_games(date_from="2021-01-05")
+    season.get_player_games()
+    assert calls[0]["date_from_nullable"] == "01/05/2021"
+    assert calls[1]["date_from_nullable"] == ""
@@ -0,0 +1,39 @@
+import pytest
+from nba_api.stats.library.http import NBAStatsHTTP
+
+from nbastatpy.session import (
+    SessionConfig,
+    configure_session,
+    get_headers,
+    get_session,
+)
+
+
+@pytest.fixture
+def session_config(monkeypatch):
+    # Put the settings back, and a session built from them, for the tests that follow
+    for name in ["POOL_CONNECTIONS", "POOL_MAXSIZE", "TIMEOUT", "COMPRESSION"]:
+        monkeypatch.setattr(SessionConfig, name, getattr(SessionConfig, name))
+    yield
+    monkeypatch.undo()
+    configure_session()
+
+
+def test_session_shared_with_nba_api(session_config):
+    session = configure_session(pool_maxsize=4, timeout=5)
+    assert get_session() is session
+    assert NBAStatsHTTP.get_session() is session
+    assert session.get_adapter("https://stats.nba.com")._pool_maxsize == 4
+
+
+def test_compression_setting(session_config):
+    configure_session(compression=False)
+    assert get_headers({"Host": "stats.nba.com"})["Accept-Encoding"] == "identity"
+    configure_session(compression=True)
+    assert "gzip" in get_headers()["Accept-Encoding"]
+
+
+def test_settings_restored():
+    assert SessionConfig.POOL_MAXSIZE == 32
+    assert SessionConfig.TIMEOUT == 30
+    assert get_session().get_adapter("https://stats.nba.com")._pool_maxsize == 32
@@ -0,0 +1,49 @@
+import pandas as pd
+from helpers import AWAY, GAME_ID, HOME
+
+from nbastatpy.stints import get_stints
+
+
+def make_playbyplay() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "gameId": GAME_ID,
+            "actionNumber": [1, 2, 3, 4],
+            "period": [1, 1, 1, 3],
+            "clock": ["PT12M00.00S", "PT11M00.00S", "PT06M00.00S", "PT05M00.00S"],
+            "teamId": [0, HOME, AWAY, HOME],
+            "actionType": ["period", "Made Shot", "Made Shot", "Missed Shot"],
+            "subType": ["start", "Layup", "Jump Shot", "Jump Shot"],
+            "shotValue": [0, 2, 3, 3],
+            "description": ["Start of 1st Period", "Layup", "3PT", "MISS 3PT"],
+        }
+    )
+
+
+def test_stints_from_rotations(rotations):
+    stints = get_stints(rotations)
+    assert len(stints) == 4
+    assert stints["STINT"].tolist() == [1, 1, 2, 2]
+    assert stints["START"].tolist() == [0, 0, 360, 360]
+    assert stints["SECONDS"].tolist() == [360, 360, 2520, 2520]
+
+    home = stints[stints["TEAM_ID"] == HOME]
+    assert home["LINEUP"].tolist() == [(1, 2, 3, 4, 5), (1, 2, 3, 4, 6)]
+    assert home["OPP_LINEUP"].tolist() == [(11, 12, 13, 14, 15)] * 2
+    # Identical lineups are stored once
+    away = stints[stints["TEAM_ID"] == AWAY]["LINEUP"].tolist()
+    assert away[0] is away[1]
+
+
+def test_stints_with_playbyplay(rotations):
+    stints = get_stints(rotations, make_playbyplay())
+    home = stints[stints["TEAM_ID"] == HOME]
+    away = stints[stints["TEAM_ID"] == AWAY]
+
+    assert home["PTS"].tolist() == [2, 0]
+    # The shot at the substitution time goes to the new lineup
+    assert home["OPP_PTS"].tolist() == [0, 3]
+    assert away["PTS"].tolist() == [0, 3]
+    assert home["POSS"].tolist() == [1, 1]
+    assert away["POSS"].tolist() == [0, 1]
+    assert home["OPP_POSS"].tolist() == away["POSS"].tolist()
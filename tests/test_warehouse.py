@@ -0,0 +1,183 @@
+import pandas as pd
+import pytest
+
+from nbastatpy.season import Season
+from nbastatpy.warehouse import Warehouse
+
+
+def make_season(monkeypatch, player_points):
+    season = Season("2023")
+    player_games = pd.DataFrame(
+        {
+            "SEASON_YEAR": "2023-24",
+            "PLAYER_ID": [1, 2],
+            "GAME_ID": "0022300001",
+            "GAME_DATE": "2023-10-24T00:00:00",
+            "PTS": player_points,
+        }
+    )
+    team_games = pd.DataFrame(
+        {"TEAM_ID": [10, 20], "GAME_ID": "0022300001", "GAME_DATE": "2023-10-24"}
+    )
+
+    monkeypatch.setattr(season, "get_player_games", lambda date_from=None: player_games)
+    monkeypatch.setattr(season, "get_team_games", lambda date_from=None: team_games)
+    monkeypatch.setattr(
+        season,
+        "get_player_stats",
+        lambda: pd.DataFrame({"PLAYER_ID": [1, 2], "PTS": [20.5, 3.0]}),
+    )
+    monkeypatch.setattr(
+        season,
+        "get_team_stats",
+        lambda: pd.DataFrame({"TEAM_ID": [10, 20], "W": [1, 0]}),
+    )
+    return season
+
+
+def test_sync_season_upserts(monkeypatch, tmp_path):
+    with Warehouse(tmp_path / "nba.db") as warehouse:
+        changed = warehouse.sync_season(
+            make_season(monkeypatch, [30, 10]), boxscores=False
+        )
+        assert changed == {
+            "player_games": 2,
+            "team_games": 2,
+            "player_stats": 2,
+            "team_stats": 2,
+        }
+
+        # Only the corrected row is touched on a re-sync
+        changed = warehouse.sync_season(
+            make_season(monkeypatch, [30, 12]), boxscores=False
+        )
+        assert changed == {
+            "player_games": 1,
+            "team_games": 0,
+            "player_stats": 0,
+            "team_stats": 0,
+        }
+
+        df = warehouse.query(
+            "SELECT PLAYER_ID, PTS, SEASON_TYPE FROM player_games ORDER BY PLAYER_ID"
+        )
+        assert df["PTS"].tolist() == [30, 12]
+        assert df["SEASON_TYPE"].unique().tolist() == ["Regular Season"]
+        stats = warehouse.query("SELECT PER_MODE FROM player_stats")
+        assert stats["PER_MODE"].unique().tolist() == ["PerGame"]
+
+
+def test_upsert_adds_new_columns():
+    warehouse = Warehouse()
+    warehouse.upsert(
+        "boxscore_teams",
+        pd.DataFrame({"gameId": ["1"], "teamId": [10], "points": [100]}),
+    )
+    changed = warehouse.upsert(
+        "boxscore_teams",
+        pd.DataFrame(
+            {
+                "gameId": ["1", "2"],
+                "teamId": [10, 10],
+                "points": [100, 90],
+                "assists": [20, 25],
+            }
+        ),
+    )
+    assert changed == 2
+    df = warehouse.query("SELECT * FROM boxscore_teams ORDER BY gameId")
+    assert df["assists"].tolist() == [20, 25]
+    assert (
+        "boxscore_teams_gameId"
+        not in warehouse.query("SELECT name FROM sqlite_master")["name"].tolist()
+    )
+
+
+class FakeBatch:
+    requested = []
+    failing = set()
+
+    def __init__(self, game_ids, kinds, max_workers=None):
+        self.game_ids = list(game_ids)
+        self.failed = {}
+
+    def get(self):
+        self.requested.append(self.game_ids)
+        game_ids = [game_id for game_id in self.game_ids if game_id not in self.failing]
+        self.failed = {
+            (game_id, "boxscore"): RuntimeError("timed out")
+            for game_id in self.game_ids
+            if game_id in self.failing
+        }
+        players = pd.DataFrame({"gameId": game_ids, "personId": 1, "points": 10})
+        teams = pd.DataFrame({"gameId": game_ids, "teamId": 10, "points": 100})
+        return {"boxscore": [players, teams.iloc[:0], teams]}
+
+
+@pytest.fixture
+def batch(monkeypatch):
+    monkeypatch.setattr(FakeBatch, "requested", [])
+    monkeypatch.setattr(FakeBatch, "failing", set())
+    monkeypatch.setattr("nbastatpy.warehouse.GameBatch", FakeBatch)
+    return FakeBatch
+
+
+def test_sync_boxscores(batch):
+    warehouse = Warehouse()
+    assert warehouse.sync_boxscores(["0022300001", "0022300002"]) == {
+        "boxscore_players": 2,
+        "boxscore_teams": 2,
+    }
+    assert warehouse.sync_boxscores([]) == {"boxscore_players": 0, "boxscore_teams": 0}
+
+
+def next_night(monkeypatch, season, dates):
+    team_games = pd.DataFrame(
+        {
+            "TEAM_ID": [10, 20, 10],
+            "GAME_ID": ["0022300001", "0022300002", "0022300003"],
+            "GAME_DATE": ["2023-10-24", "2023-10-25", "2023-10-26"],
+        }
+    )
+
+    def get_team_games(date_from=None):
+        dates.append(date_from)
+        return team_games[team_games["GAME_DATE"] >= (date_from or "")]
+
+    monkeypatch.setattr(season, "get_team_games", get_team_games)
+
+
+def test_incremental_sync(monkeypatch, batch):
+    warehouse = Warehouse()
+    season = make_season(monkeypatch, [30, 10])
+    warehouse.sync_season(season, incremental=True)
+    assert warehouse.get_high_water_mark(season) == "2023-10-24"
+
+    # The next nights: last synced day is requested again, only the new games are fetched
+    dates = []
+    next_night(monkeypatch, season, dates)
+    warehouse.sync_season(season, incremental=True)
+    assert dates == ["2023-10-24"]
+    assert batch.requested == [["0022300001"], ["0022300002", "0022300003"]]
+    assert warehouse.get_high_water_mark(season) == "2023-10-26"
+
+
+def test_incremental_sync_retries_failed_boxscores(monkeypatch, batch):
+    warehouse = Warehouse()
+    season = make_season(monkeypatch, [30, 10])
+    warehouse.sync_season(season, incremental=True)
+
+    # A failed boxscore holds the last synced date back to its game
+    dates = []
+    next_night(monkeypatch, season, dates)
+    batch.failing = {"0022300002"}
+    warehouse.sync_season(season, incremental=True)
+    assert list(warehouse.failed) == ["0022300002"]
+    assert warehouse.get_high_water_mark(season) == "2023-10-25"
+
+    batch.failing = set()
+    warehouse.sync_season(season, incremental=True)
+    assert dates == ["2023-10-24", "2023-10-25"]
+    assert batch.requested[-1] == ["0022300002"]
+    assert warehouse.failed == {}
+    assert warehouse.get_high_water_mark(season) == "2023-10-26"